@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmark of the parsing of the query string of a search request.
+
+Parses the query string with a typical search args schema, loaded by
+Marshmallow and by the compiled load function.
+
+Run with ``python benchmarks/bench_args_parsing.py``.
+"""
+
+import timeit
+
+import marshmallow as ma
+from flask import Flask
+
+from flask_resources import RequestParser
+
+FIELDS = {
+    "q": ma.fields.String(),
+    "sort": ma.fields.String(load_default="bestmatch"),
+    "page": ma.fields.Int(load_default=1, validate=ma.validate.Range(min=1)),
+    "size": ma.fields.Int(load_default=10, validate=ma.validate.Range(min=1)),
+    "allversions": ma.fields.Boolean(load_default=False),
+    "type": ma.fields.List(ma.fields.String()),
+    "subject": ma.fields.List(ma.fields.String()),
+}
+
+QUERY_STRING = (
+    "q=title:physics&sort=newest&page=2&size=25&allversions=true"
+    "&type=publication&type=dataset&subject=a&subject=b&subject=c"
+)
+
+
+class MarshmallowParser(RequestParser):
+    """Parser loading the data with Marshmallow."""
+
+    compile_schemas = False
+
+
+def main(number=20000):
+    """Run the benchmark."""
+    app = Flask("bench")
+    parsers = {
+        "marshmallow": MarshmallowParser(FIELDS, location="args"),
+        "compiled": RequestParser(FIELDS, location="args"),
+    }
+    with app.test_request_context("/?" + QUERY_STRING):
+        expected = parsers["marshmallow"].parse()
+        for name, parser in parsers.items():
+            assert parser.parse() == expected
+            total = timeit.timeit(parser.parse, number=number)
+            print(f"{name:>12}: {total / number * 1e6:.2f} us/parse")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmark of the parsing of a bulk request body.
+
+Parses and consumes the body of a bulk import of 50000 records, as a JSON
+array loaded at once, and with the streaming deserializers. Prints the time
+and the peak memory allocated while parsing.
+
+Run with ``python benchmarks/bench_bulk_body.py``.
+"""
+
+import io
+import json
+import time
+import tracemalloc
+
+from flask_resources import JSONArrayDeserializer, JSONDeserializer, NDJSONDeserializer
+
+RECORD = {
+    "metadata": {
+        "title": "A dataset about physics",
+        "creators": [{"name": "Doe, John"}, {"name": "Roe, Jane"}],
+        "keywords": ["physics", "dataset", "bulk"],
+    },
+    "access": {"record": "public", "files": "public"},
+}
+
+
+def main(count=50000):
+    """Run the benchmark."""
+    records = [dict(RECORD, id=i) for i in range(count)]
+    array = json.dumps(records).encode("utf-8")
+    ndjson = "\n".join(json.dumps(record) for record in records).encode("utf-8")
+    del records
+    cases = {
+        "json": (JSONDeserializer(), array, lambda s: s.read()),
+        "json array": (JSONArrayDeserializer(), array, lambda s: s),
+        "ndjson": (NDJSONDeserializer(), ndjson, lambda s: s),
+    }
+    for name, (deserializer, body, data) in cases.items():
+        tracemalloc.start()
+        start = time.perf_counter()
+        ids = 0
+        for record in deserializer.deserialize(data(io.BytesIO(body))):
+            ids += record["id"]
+        total = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert ids == count * (count - 1) // 2
+        print(f"{name:>10}: {total * 1e3:.0f} ms, peak {peak / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
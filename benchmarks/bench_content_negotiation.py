@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmark of the content negotiation.
+
+Compares parsing the Accept header and matching it on every request with the
+memoized ``ContentNegotiator.match_header()``.
+
+Run with ``python benchmarks/bench_content_negotiation.py``.
+"""
+
+import timeit
+
+from flask import Flask, request
+
+from flask_resources.content_negotiation import ContentNegotiator
+
+ACCEPT = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+HANDLERS = {
+    "application/json": None,
+    "application/vnd.inveniordm.v1+json": None,
+    "application/vnd.citationstyles.csl+json": None,
+    "text/csv": None,
+}
+
+
+def uncached():
+    """Negotiation as done before memoization."""
+    return ContentNegotiator.match(
+        HANDLERS.keys(),
+        request.accept_mimetypes,
+        {},
+        request.args.get("format", None),
+        "application/json",
+    )
+
+
+def cached():
+    """Memoized negotiation."""
+    return ContentNegotiator.match_header(
+        frozenset(HANDLERS),
+        request.headers.get("Accept"),
+        request.args.get("format", None),
+        "application/json",
+    )
+
+
+def main(number=20000):
+    """Run the benchmark."""
+    app = Flask("bench")
+    for func in (uncached, cached):
+        # a new request context each time, as the parsed header is cached on it
+        def run():
+            with app.test_request_context("/", headers={"Accept": ACCEPT}):
+                func()
+
+        baseline = timeit.timeit(
+            lambda: app.test_request_context("/", headers={"Accept": ACCEPT}),
+            number=number,
+        )
+        total = timeit.timeit(run, number=number)
+        print(
+            f"{func.__name__:>10}: {(total - baseline) / number * 1e6:.2f} us/request"
+        )
+    print(ContentNegotiator.match_header.cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmark of the parsing of request headers.
+
+Parses two header fields of a request carrying 35 headers (as added by
+proxies and browsers), with the dict of all the normalized headers built
+before the ``HeadersView``, and with the view.
+
+Run with ``python benchmarks/bench_header_parsing.py``.
+"""
+
+import timeit
+
+import marshmallow as ma
+from flask import Flask, request
+
+from flask_resources import RequestParser
+
+HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Cache-Control": "no-cache",
+    "Cookie": "session=abcdef; csrftoken=123456",
+    "If-Match": "3",
+    "Pragma": "no-cache",
+    "Referer": "https://example.org/search?q=test",
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) Firefox/130.0",
+    "X-Forwarded-For": "203.0.113.1, 198.51.100.2",
+    "X-Forwarded-Host": "example.org",
+    "X-Forwarded-Port": "443",
+    "X-Forwarded-Proto": "https",
+    "X-Real-Ip": "203.0.113.1",
+    "X-Request-Id": "0f1e2d3c4b5a",
+    "Sec-Fetch-Dest": "empty",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-origin",
+    "Sec-Ch-Ua": '"Chromium";v="130"',
+    "Sec-Ch-Ua-Mobile": "?0",
+    "Sec-Ch-Ua-Platform": '"Linux"',
+    "Traceparent": "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01",
+    "Tracestate": "vendor=opaque",
+    "Cdn-Loop": "cloudflare",
+    "Cf-Connecting-Ip": "203.0.113.1",
+    "Cf-Ipcountry": "CH",
+    "Cf-Ray": "8c1e2d3c4b5a-GVA",
+    "Cf-Visitor": '{"scheme":"https"}',
+    "Via": "1.1 varnish",
+    "X-Varnish": "12345 67890",
+    "X-Amzn-Trace-Id": "Root=1-67891233-abcdef012345678912345678",
+    "X-Client-Version": "12.0.0",
+    "Origin": "https://example.org",
+    "Dnt": "1",
+}
+
+FIELDS = {"if_match": ma.fields.Int(), "x_request_id": ma.fields.String()}
+
+
+class AllHeadersParser(RequestParser):
+    """Parser normalizing all the headers, as done before the view."""
+
+    def load_data(self):
+        """Load data from request."""
+        return {k.lower().replace("-", "_"): v for (k, v) in request.headers.items()}
+
+
+def main(number=20000):
+    """Run the benchmark."""
+    app = Flask("bench")
+    parsers = {
+        "all headers": AllHeadersParser(FIELDS, location="headers"),
+        "headers view": RequestParser(FIELDS, location="headers"),
+    }
+    with app.test_request_context("/", headers=HEADERS):
+        for name, parser in parsers.items():
+            assert parser.parse() == {"if_match": 3, "x_request_id": "0f1e2d3c4b5a"}
+            total = timeit.timeit(parser.parse, number=number)
+            print(f"{name:>12}: {total / number * 1e6:.2f} us/parse")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmark of the JSON codecs on record payloads.
+
+Compares ``json.dumps()`` with a new encoder on each call (as done before the
+codecs), the ``StdlibJSONCodec`` reusing its encoders, and the third-party
+codecs which are installed (``orjson``, ``ujson``).
+
+Run with ``python benchmarks/bench_json_codecs.py``.
+"""
+
+import json
+import timeit
+from datetime import date
+
+from speaklater import make_lazy_string
+
+from flask_resources.serializers.json import (
+    JSONEncoder,
+    StdlibJSONCodec,
+    json_default,
+)
+
+
+def make_record(i):
+    """A record as dumped by a record schema."""
+    return {
+        "id": f"abcde-{i:05d}",
+        "revision_id": 3,
+        "created": "2026-01-01T10:00:00.000000+00:00",
+        "updated": "2026-01-02T10:00:00.000000+00:00",
+        "links": {
+            "self": f"https://example.org/api/records/abcde-{i:05d}",
+            "files": f"https://example.org/api/records/abcde-{i:05d}/files",
+        },
+        "metadata": {
+            "title": f"A study of the record number {i}",
+            "publication_date": date(2026, 1, 1),
+            "resource_type": {
+                "id": "publication-article",
+                "title": make_lazy_string(lambda: "Journal article"),
+            },
+            "creators": [
+                {
+                    "person_or_org": {
+                        "name": f"Doe, Jane {j}",
+                        "type": "personal",
+                        "identifiers": [
+                            {"scheme": "orcid", "id": "0000-0002-1825-0097"}
+                        ],
+                    },
+                    "affiliations": [{"name": "CERN"}],
+                }
+                for j in range(5)
+            ],
+            "description": "Lorem ipsum dolor sit amet. " * 20,
+            "subjects": [{"subject": f"keyword {j}"} for j in range(10)],
+        },
+        "stats": {"views": 1234, "downloads": 567},
+    }
+
+
+class StdlibPerCallCodec:
+    """Encoder created on every call."""
+
+    def encode(self, obj, **options):
+        """Encode."""
+        return json.dumps(obj, cls=JSONEncoder, **options)
+
+
+def optional_codecs():
+    """Adapters for the installed third-party codecs."""
+    codecs = {}
+    try:
+        import orjson
+
+        class OrjsonCodec:
+            def encode(self, obj, **options):
+                return orjson.dumps(obj, default=json_default).decode("utf-8")
+
+        codecs["orjson"] = OrjsonCodec()
+    except ImportError:
+        pass
+    try:
+        import ujson
+
+        class UjsonCodec:
+            def encode(self, obj, **options):
+                # ujson has no fallback hook, convert the unknown types first
+                return ujson.dumps(json.loads(json.dumps(obj, default=json_default)))
+
+        codecs["ujson"] = UjsonCodec()
+    except ImportError:
+        pass
+    return codecs
+
+
+def main(number=200):
+    """Run the benchmark."""
+    record = make_record(0)
+    search = {"hits": {"hits": [make_record(i) for i in range(100)], "total": 100}}
+    codecs = {
+        "stdlib (per call)": StdlibPerCallCodec(),
+        "stdlib (reused)": StdlibJSONCodec(),
+        **optional_codecs(),
+    }
+    for name, codec in codecs.items():
+        one = timeit.timeit(lambda: codec.encode(record), number=number * 100)
+        many = timeit.timeit(lambda: codec.encode(search), number=number)
+        print(
+            f"{name:>18}: {one / number / 100 * 1e6:8.1f} us/record"
+            f" {many / number * 1e3:8.2f} ms/search of 100"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmark of the translation of lazy strings in a list response.
+
+Serializes a page of records whose vocabulary labels are lazy strings, with
+and without ``ResourceConfig.cache_lazy_strings``.
+
+Run with ``python benchmarks/bench_lazy_strings.py``.
+"""
+
+import gettext as gettext_module
+import timeit
+
+from flask import Flask, g
+from speaklater import make_lazy_string
+
+from flask_resources import JSONSerializer, ResourceConfig
+from flask_resources.context import ResourceRequestCtx
+
+LABELS = [f"Resource type {i}" for i in range(20)]
+
+
+class Translations(gettext_module.NullTranslations):
+    """Translations with a catalog, as looked up by gettext."""
+
+    def __init__(self):
+        """Constructor."""
+        super().__init__()
+        self.catalog = {label: label.replace("type", "Typ") for label in LABELS}
+
+    def gettext(self, message):
+        """Translate a message."""
+        return self.catalog.get(message, message)
+
+
+def get_translations():
+    """Get the translations of the locale of the request, like Flask-Babel."""
+    translations = g.get("translations")
+    if translations is None:
+        translations = g.translations = {"de": Translations()}
+    return translations["de"]
+
+
+def gettext(message, **variables):
+    """Translate a message, like Flask-Babel."""
+    translated = get_translations().gettext(message)
+    return translated % variables if variables else translated
+
+
+def _(message):
+    """Lazy gettext."""
+    return make_lazy_string(gettext, message)
+
+
+def make_page(size=100):
+    """A page of records with 30 lazy labels each, from 20 distinct ones."""
+    return {
+        "hits": {
+            "hits": [
+                {
+                    "id": str(i),
+                    "metadata": {
+                        "resource_type": {"title": _(LABELS[i % 20])},
+                        "subjects": [
+                            {"title": _(LABELS[(i + j) % 20])} for j in range(29)
+                        ],
+                    },
+                }
+                for i in range(size)
+            ],
+            "total": size,
+        }
+    }
+
+
+def main(number=200):
+    """Run the benchmark."""
+    app = Flask("bench")
+    serializer = JSONSerializer()
+    page = make_page()
+    for cache_lazy_strings in (False, True):
+
+        class Config(ResourceConfig):
+            pass
+
+        Config.cache_lazy_strings = cache_lazy_strings
+
+        def run():
+            with ResourceRequestCtx(Config):
+                serializer.serialize_object_list(page)
+
+        with app.test_request_context():
+            total = timeit.timeit(run, number=number)
+        print(
+            f"cache_lazy_strings={cache_lazy_strings!s:>5}:"
+            f" {total / number * 1e3:.2f} ms/page of 100 records"
+        )
+
+
+if __name__ == "__main__":
+    main()
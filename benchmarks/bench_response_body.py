@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmark of the serialization of list response bodies.
+
+Builds the response of a search returning 20000 records, with the body
+serialized as a string (the default) and written into the response as bytes
+chunks (``ResponseHandler(write_into=True)``). Prints the time and the peak
+memory allocated while building the response.
+
+Run with ``python benchmarks/bench_response_body.py``.
+"""
+
+import time
+import tracemalloc
+
+from flask import Flask
+
+from flask_resources import JSONSerializer, ResourceConfig, ResponseHandler
+from flask_resources.context import ResourceRequestCtx, resource_requestctx
+
+RECORD = {
+    "metadata": {
+        "title": "A dataset about physics",
+        "creators": [{"name": "Doe, John"}, {"name": "Roe, Jane"}],
+        "keywords": ["physics", "dataset", "search"],
+    },
+    "access": {"record": "public", "files": "public"},
+}
+
+
+def main(count=20000, repeat=5):
+    """Run the benchmark."""
+    app = Flask("bench")
+    hits = [dict(RECORD, id=str(i)) for i in range(count)]
+    obj_list = {"hits": {"hits": hits, "total": count}}
+    cases = {
+        "str": ResponseHandler(JSONSerializer()),
+        "write_into": ResponseHandler(JSONSerializer(), write_into=True),
+    }
+    with app.test_request_context("/"), ResourceRequestCtx(ResourceConfig):
+        resource_requestctx.accept_mimetype = "application/json"
+        for name, handler in cases.items():
+            total = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                handler.make_response(obj_list, 200, many=True)
+                total = min(total, time.perf_counter() - start)
+
+            tracemalloc.start()
+            response = handler.make_response(obj_list, 200, many=True)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            size = response.calculate_content_length()
+            print(
+                f"{name:>10}: {total * 1e3:.0f} ms, peak {peak / 2**20:.1f} MB"
+                f" for a body of {size / 2**20:.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -144,7 +144,7 @@ Below is a large example that demonstrates:
 from .config import from_conf
 from .content_negotiation import with_content_negotiation
 from .context import resource_requestctx
-from .deserializers import JSONDeserializer
+from .deserializers import JSONArrayDeserializer, JSONDeserializer, NDJSONDeserializer
 from .errors import HTTPJSONException, create_error_handler
 from .parsers import (
     BaseListSchema,
@@ -156,7 +156,12 @@ from .parsers import (
     request_parser,
 )
 from .resources import Resource, ResourceConfig, route
-from .responses import ResponseHandler, response_handler
+from .responses import (
+    ResponseHandler,
+    cache_tags,
+    invalidate_cache_tags,
+    response_handler,
+)
 from .serializers import CSVSerializer, JSONSerializer, MarshmallowSerializer
 
 __version__ = "1.3.1"
@@ -167,6 +172,8 @@ __all__ = (
     "from_conf",
     "HTTPJSONException",
     "JSONDeserializer",
+    "JSONArrayDeserializer",
+    "NDJSONDeserializer",
     "JSONSerializer",
     "CSVSerializer",
     "MultiDictSchema",
@@ -179,6 +186,8 @@ __all__ = (
     "ResourceConfig",
     "response_handler",
     "ResponseHandler",
+    "cache_tags",
+    "invalidate_cache_tags",
     "route",
     "with_content_negotiation",
     "BaseListSchema",
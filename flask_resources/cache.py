@@ -0,0 +1,241 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""In-process caches.
+
+The caches implement a small interface (``get()``, ``set()``, ``delete()``,
+``invalidate_tags()``, ``clear()`` and ``stats``), so that they can be plugged
+in wherever a cache is accepted (e.g. the dump cache of the
+``MarshmallowSerializer``).
+
+Values can be set with tags (e.g. ``"record:12345"``). The values of a tag are
+deleted from all the caches of the process with ``invalidate_tags()``.
+"""
+
+import sys
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import count
+from threading import Lock
+from weakref import WeakSet
+
+# Caches on which the tags are invalidated.
+_caches = WeakSet()
+
+#: Number of tags of which the last invalidation is remembered.
+MAX_INVALIDATED_TAGS = 10000
+
+# Generation of the last invalidation of each tag, in the order of the
+# invalidations. The tags forgotten when there are too many count as
+# invalidated at the generation of the last forgotten one.
+_generations = count(1)
+_generation = 0
+_invalidated = OrderedDict()
+_forgotten = 0
+_invalidated_lock = Lock()
+
+
+def register_cache(cache):
+    """Register a cache, for its tags to be invalidated by ``invalidate_tags()``."""
+    _caches.add(cache)
+    return cache
+
+
+def invalidate_tags(tags):
+    """Delete the values with any of the given tags from all the caches."""
+    global _generation, _forgotten
+    tags = list(tags)
+    if tags:
+        # the generation is bumped before the values are deleted (see
+        # ``tags_invalidated_since()``)
+        with _invalidated_lock:
+            _generation = next(_generations)
+            for tag in tags:
+                _invalidated[tag] = _generation
+                _invalidated.move_to_end(tag)
+            while len(_invalidated) > MAX_INVALIDATED_TAGS:
+                _, _forgotten = _invalidated.popitem(last=False)
+        for cache in list(_caches):
+            cache.invalidate_tags(tags)
+
+
+def tags_generation():
+    """Get the current generation of the tags, bumped by ``invalidate_tags()``.
+
+    A value computed from data which may change must not be stored if its
+    tags were invalidated while it was computed. As the invalidation can also
+    happen while the value is stored, it is checked again afterwards:
+
+    .. code-block:: python
+
+        generation = tags_generation()
+        value = compute()
+        if not tags_invalidated_since(tags, generation):
+            cache.set(key, value, tags=tags)
+            if tags_invalidated_since(tags, generation):
+                cache.delete(key)
+    """
+    return _generation
+
+
+def tags_invalidated_since(tags, generation):
+    """Check if any of the tags was invalidated since a generation."""
+    if _generation == generation:
+        return False
+    with _invalidated_lock:
+        return any(_invalidated.get(tag, _forgotten) > generation for tag in tags)
+
+
+def approx_sizeof(obj):
+    """Approximate size in bytes of an object and the objects it contains."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += approx_sizeof(key) + approx_sizeof(value)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += approx_sizeof(item)
+    return size
+
+
+class LRUCache:
+    """Thread-safe least recently used cache with size-based eviction.
+
+    The size of each value is computed with ``sizeof`` (by default each value
+    counts as one, i.e. ``max_size`` is a number of entries). Least recently
+    used values are evicted when the total size goes over ``max_size``.
+
+    .. code-block:: python
+
+        cache = LRUCache(max_size=64 * 1024 * 1024, sizeof=approx_sizeof)
+    """
+
+    def __init__(self, max_size=1024, sizeof=None):
+        """Constructor.
+
+        :param max_size: The maximum total size of the cached values.
+        :param sizeof: Callable returning the size of a value.
+        """
+        self.max_size = max_size
+        self.sizeof = sizeof
+        self._data = OrderedDict()
+        self._tags = {}
+        self._lock = Lock()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        register_cache(self)
+
+    def get(self, key, default=None):
+        """Get a value, marking it as recently used."""
+        with self._lock:
+            try:
+                value, _, _ = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, tags=()):
+        """Set a value, evicting the least recently used ones if needed.
+
+        :param tags: Tags of the value, for ``invalidate_tags()``.
+        """
+        size = self.sizeof(value) if self.sizeof else 1
+        if size > self.max_size:
+            return
+        tags = frozenset(tags)
+        with self._lock:
+            self._remove(key)
+            self._data[key] = (value, size, tags)
+            self._size += size
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while self._size > self.max_size:
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def delete(self, key):
+        """Delete a value."""
+        with self._lock:
+            self._remove(key)
+
+    def invalidate_tags(self, tags):
+        """Delete the values with any of the given tags."""
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+
+    def clear(self):
+        """Delete all the values."""
+        with self._lock:
+            self._data.clear()
+            self._tags.clear()
+            self._size = 0
+
+    def _remove(self, key):
+        """Remove a value and its tags (the lock must be held)."""
+        old = self._data.pop(key, None)
+        if old is None:
+            return
+        _, size, tags = old
+        self._size -= size
+        for tag in tags:
+            keys = self._tags[tag]
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+    def __len__(self):
+        """Number of cached values."""
+        return len(self._data)
+
+    @property
+    def stats(self):
+        """Counters for tuning the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._data),
+            "size": self._size,
+            "max_size": self.max_size,
+        }
+
+
+class KeyLocks:
+    """Locks per key, created on demand and dropped once no one holds them."""
+
+    def __init__(self):
+        """Constructor."""
+        self._locks = {}
+        self._lock = Lock()
+
+    @contextmanager
+    def hold(self, key, blocking=True):
+        """Acquire the lock of a key, yielding whether it was acquired."""
+        with self._lock:
+            entry = self._locks.get(key)
+            if entry is None:
+                entry = self._locks[key] = [Lock(), 0]
+            entry[1] += 1
+        acquired = entry[0].acquire(blocking)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                entry[0].release()
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._locks[key]
+
+    def __len__(self):
+        """Number of keys currently locked or waited for."""
+        return len(self._locks)
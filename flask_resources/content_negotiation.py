@@ -4,15 +4,19 @@
 
 """Content negotiation API."""
 
-from functools import wraps
+from functools import lru_cache, wraps
 
 from flask import request
 from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header
 
 from .config import resolve_from_conf
 from .context import resource_requestctx
 from .errors import MIMETypeNotAccepted
 
+#: Maximum number of negotiation results kept by ``ContentNegotiator.match_header``.
+NEGOTIATION_CACHE_SIZE = 512
+
 
 class ContentNegotiator(object):
     """Content negotiation API.
@@ -36,6 +40,28 @@ class ContentNegotiator(object):
             mimetypes, accept_mimetypes, default=default
         )
 
+    @classmethod
+    @lru_cache(maxsize=NEGOTIATION_CACHE_SIZE)
+    def match_header(cls, mimetypes, accept_header, fmt, default=None):
+        """Select the MIME type which best matches a raw "Accept" header.
+
+        Clients usually send only a handful of distinct "Accept" headers, so
+        the result is memoized in a LRU cache. Use ``match_header.cache_info()``
+        to get the hit and miss counters.
+
+        :param mimetypes: Frozenset of available MIME types.
+        :param accept_header: The client's raw "Accept" header (or ``None``).
+        :param format: The client's selected format.
+        :param default: Default MIMEtype if a wildcard was received.
+        """
+        return cls.match(
+            mimetypes,
+            parse_accept_header(accept_header, MIMEAccept),
+            {},  # TODO: Rely on config to populate this formats_map
+            fmt,
+            default,
+        )
+
     @classmethod
     def match_by_accept(cls, mimetypes, accept_mimetypes, default=None):
         """Select the MIME type which best matches Accept header.
@@ -95,10 +121,9 @@ def with_content_negotiation(
                 default_accept_mimetype, resource_requestctx.config
             )
 
-            accept_mimetype = ContentNegotiator.match(
-                handlers.keys(),
-                request.accept_mimetypes,
-                {},  # TODO: Rely on config to populate this formats_map
+            accept_mimetype = ContentNegotiator.match_header(
+                frozenset(handlers),
+                request.headers.get("Accept"),
                 request.args.get("format", None),
                 default_mimetype,
             )
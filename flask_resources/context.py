@@ -14,6 +14,8 @@ parser (preferably), or accessing ``request.view_args``. The goal of this
 is to ensure that the view function access only validated data.
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
 from inspect import ismethod
 
@@ -34,6 +36,12 @@ def _get_context():
 resource_requestctx = LocalProxy(_get_context)
 """Proxy to the resource's request context"""
 
+lazy_strings_cache = ContextVar("lazy_strings_cache", default=None)
+"""Translated lazy strings of the current request, if cached."""
+
+json_codec = ContextVar("json_codec", default=None)
+"""JSON codec configured on the current resource, if any."""
+
 
 #
 # Resource context
@@ -46,6 +54,7 @@ class ResourceRequestCtx(object):
 
     - The mimetype selected by the content negotiation.
     - The content type of the request payload
+    - The tags of the cached response (see ``cache_tags()``)
     """
 
     def __init__(self, config):
@@ -57,14 +66,46 @@ class ResourceRequestCtx(object):
         self.view_args = None
         self.accept_mimetype = None
         self.response_handler = None
+        self.cache_tags = set()
+        # translated lazy strings, see ``force_lazy_string()``
+        self.lazy_strings = {} if getattr(config, "cache_lazy_strings", False) else None
+        self._lazy_strings_token = None
+        self._json_codec_token = None
 
     def __enter__(self):
         """Push the resource context manager on the current request."""
         g.resource_requestctx = self
+        self._lazy_strings_token = lazy_strings_cache.set(self.lazy_strings)
+        self._json_codec_token = json_codec.set(
+            getattr(self.config, "json_codec", None)
+        )
 
     def __exit__(self, type, value, traceback):
         """Pop the resource context manager from the current request."""
         del g.resource_requestctx
+        lazy_strings_cache.reset(self._lazy_strings_token)
+        json_codec.reset(self._json_codec_token)
+
+    @contextmanager
+    def reenter(self):
+        """Make the context current again, e.g. while streaming a response.
+
+        The chunks of streamed responses are produced after the view returned
+        and the context was popped. The previous state is restored on exit.
+        """
+        previous = g.get("resource_requestctx")
+        g.resource_requestctx = self
+        lazy_strings_token = lazy_strings_cache.set(self.lazy_strings)
+        json_codec_token = json_codec.set(getattr(self.config, "json_codec", None))
+        try:
+            yield self
+        finally:
+            json_codec.reset(json_codec_token)
+            lazy_strings_cache.reset(lazy_strings_token)
+            if previous is None:
+                g.pop("resource_requestctx", None)
+            else:
+                g.resource_requestctx = previous
 
     def update(self, values):
         """Update the context fields present in the received dictionary `values`."""
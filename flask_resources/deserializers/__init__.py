@@ -5,6 +5,11 @@
 """Deserializers."""
 
 from .base import DeserializerMixin
-from .json import JSONDeserializer
+from .json import JSONArrayDeserializer, JSONDeserializer, NDJSONDeserializer
 
-__all__ = ("JSONDeserializer", "DeserializerMixin")
+__all__ = (
+    "JSONDeserializer",
+    "JSONArrayDeserializer",
+    "NDJSONDeserializer",
+    "DeserializerMixin",
+)
@@ -8,6 +8,10 @@
 class DeserializerMixin:
     """Deserializer Interface."""
 
+    #: Whether ``deserialize()`` takes the request stream (i.e.
+    #: ``request.stream``) instead of the request body.
+    streaming = False
+
     def deserialize(self, data):
         """Deserializes the data into an object."""
         raise NotImplementedError()
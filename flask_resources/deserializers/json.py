@@ -2,16 +2,189 @@
 # SPDX-FileCopyrightText: 2020-2021 Northwestern University.
 # SPDX-License-Identifier: MIT
 
-"""JSON Deserializer."""
+"""JSON Deserializers."""
 
+import codecs
 import json
+import re
 
+from ..serializers.json import current_json_codec
 from .base import DeserializerMixin
 
 
 class JSONDeserializer(DeserializerMixin):
     """JSON Deserializer."""
 
+    def __init__(self, codec=None):
+        """Constructor.
+
+        :param codec: The JSON codec (see ``StdlibJSONCodec``). Defaults to
+            ``ResourceConfig.json_codec``, or the standard library codec.
+        """
+        self._codec = codec
+
+    @property
+    def codec(self):
+        """The JSON codec used for deserialization."""
+        return self._codec or current_json_codec()
+
     def deserialize(self, data):
         """Deserializes JSON into a Python dictionary."""
-        return json.loads(data) if data else None
+        return self.codec.decode(data) if data else None
+
+
+def _read_lines(stream, chunk_size):
+    """Iterate over the lines of a binary stream, read in chunks."""
+    pending = []
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = chunk.split(b"\n")
+        if len(lines) == 1:
+            pending.append(chunk)
+            continue
+        pending.append(lines[0])
+        yield b"".join(pending)
+        yield from lines[1:-1]
+        pending = [lines[-1]]
+    last = b"".join(pending)
+    if last:
+        yield last
+
+
+class NDJSONDeserializer(DeserializerMixin):
+    """Newline-delimited JSON (``application/x-ndjson``) deserializer.
+
+    Reads the request stream in chunks, and returns an iterator over the
+    decoded documents, one per non-empty line. The body is never held in
+    memory as a whole, e.g. for bulk imports:
+
+    .. code-block:: python
+
+        class Config(ResourceConfig):
+            request_body_parsers = {
+                **ResourceConfig.request_body_parsers,
+                "application/x-ndjson": RequestBodyParser(NDJSONDeserializer()),
+            }
+
+    The view then consumes ``resource_requestctx.data`` (e.g. in batches),
+    within the request.
+    """
+
+    streaming = True
+
+    def __init__(self, codec=None, chunk_size=64 * 1024):
+        """Constructor.
+
+        :param codec: The JSON codec (see ``StdlibJSONCodec``). Defaults to
+            ``ResourceConfig.json_codec``, or the standard library codec.
+        :param chunk_size: Number of bytes read from the stream at once.
+        """
+        self._codec = codec
+        self.chunk_size = chunk_size
+
+    @property
+    def codec(self):
+        """The JSON codec used for deserialization."""
+        return self._codec or current_json_codec()
+
+    def deserialize(self, stream):
+        """Get an iterator over the documents of a stream."""
+        decode = self.codec.decode
+        return (
+            decode(line)
+            for line in _read_lines(stream, self.chunk_size)
+            if line.strip()
+        )
+
+
+class JSONArrayDeserializer(DeserializerMixin):
+    """Deserializer of a top-level JSON array, item by item.
+
+    Reads the request stream in chunks, and returns an iterator over the
+    items of the array, each one decoded as soon as it has been read. Only one
+    item is held in memory at a time. The items are decoded with the standard
+    library decoder. A body which is not a JSON array raises a ``ValueError``
+    when the iterator is consumed.
+    """
+
+    streaming = True
+
+    def __init__(self, chunk_size=64 * 1024):
+        """Constructor.
+
+        :param chunk_size: Number of bytes read from the stream at once.
+        """
+        self.chunk_size = chunk_size
+
+    def deserialize(self, stream):
+        """Get an iterator over the items of the array of a stream."""
+        return _iter_array(stream, self.chunk_size)
+
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _iter_array(stream, chunk_size):
+    """Iterate over the items of the JSON array of a binary stream."""
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def read(size):
+        """Append at least ``size`` bytes of the stream to the buffer."""
+        nonlocal buf, pos, eof
+        chunk = stream.read(size)
+        eof = not chunk
+        if pos > chunk_size:
+            buf = buf[pos:]
+            pos = 0
+        buf += text_decoder.decode(chunk, final=eof)
+
+    def next_char():
+        """Skip the whitespace and get the next character, or ``""``."""
+        nonlocal pos
+        while True:
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos < len(buf) or eof:
+                return buf[pos : pos + 1]
+            read(chunk_size)
+
+    if next_char() != "[":
+        raise ValueError("Expecting a JSON array.")
+    pos += 1
+    if next_char() == "]":
+        pos += 1
+    else:
+        while True:
+            # read until the item and the character after it are buffered,
+            # doubling the read size for items bigger than a chunk
+            size = chunk_size
+            while True:
+                next_char()
+                try:
+                    item, end = _decoder.raw_decode(buf, pos)
+                except ValueError:
+                    if eof:
+                        raise
+                else:
+                    end = _WHITESPACE.match(buf, end).end()
+                    if end < len(buf) or eof:
+                        break
+                read(size)
+                size = max(size, len(buf) - pos)
+            pos = end
+            yield item
+
+            char = next_char()
+            pos += 1
+            if char == "]":
+                break
+            if char != ",":
+                raise ValueError("Expecting ',' delimiter or ']' in the JSON array.")
+
+    if next_char():
+        raise ValueError("Extra data after the JSON array.")
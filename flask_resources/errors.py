@@ -4,12 +4,10 @@
 
 """Exceptions used in Flask Resources module."""
 
-import json
-
 from flask import current_app, g
 from werkzeug.exceptions import HTTPException
 
-from .serializers.json import JSONEncoder
+from .serializers.json import current_json_codec
 
 
 def create_error_handler(map_func_or_exception):
@@ -90,7 +88,7 @@ class HTTPJSONException(HTTPException):
         if self.code and (self.code >= 500) and hasattr(g, "sentry_event_id"):
             body["error_id"] = str(g.sentry_event_id)
 
-        return json.dumps(body, cls=JSONEncoder)
+        return current_json_codec().encode(body)
 
 
 class MIMETypeException(HTTPJSONException):
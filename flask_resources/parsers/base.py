@@ -70,16 +70,74 @@ meta class:
             unknown = ma.INCLUDE
 """
 
+from collections.abc import Mapping
+from threading import Lock
+
 import marshmallow as ma
 from flask import request
+from marshmallow.decorators import PRE_LOAD
 
+from .loading import compile_loader
 from .schema import MultiDictSchema
 
 
+class HeadersView(Mapping):
+    """Read-only view of the request headers, by normalized name.
+
+    The names are lowercased with dashes replaced by underscores (e.g.
+    ``if_match``). Looking up a name only reads the corresponding header,
+    instead of normalizing all the headers of the request. Iterating over the
+    view normalizes all the headers.
+    """
+
+    # headers left out of the WSGI environ when empty
+    _content_keys = frozenset(["content_type", "content_length"])
+
+    def __init__(self, headers, names):
+        """Constructor.
+
+        :param headers: The request headers (``request.headers``).
+        :param names: The normalized names which can be looked up.
+        """
+        self._headers = headers
+        self._names = names
+        self._all = None
+
+    def __getitem__(self, key):
+        """Get the value of a header."""
+        if key not in self._names:
+            raise KeyError(key)
+        # the headers of the environ are looked up case-insensitively, and
+        # with dashes or underscores
+        value = self._headers.get(key)
+        if value is None or (not value and key in self._content_keys):
+            raise KeyError(key)
+        return value
+
+    def _normalized(self):
+        if self._all is None:
+            self._all = {
+                k.lower().replace("-", "_"): v for (k, v) in self._headers.items()
+            }
+        return self._all
+
+    def __iter__(self):
+        """Iterate over the normalized names of all the headers."""
+        return iter(self._normalized())
+
+    def __len__(self):
+        """Number of headers."""
+        return len(self._normalized())
+
+
 class RequestParser:
     """Request parser."""
 
-    def __init__(self, schema_or_dict, location, unknown=ma.EXCLUDE):
+    #: Whether to compile the schema into a load function, when possible (see
+    #: ``flask_resources.parsers.loading``).
+    compile_schemas = True
+
+    def __init__(self, schema_or_dict, location, unknown=ma.EXCLUDE, pure=False):
         """Constructor.
 
         :param schema_or_dict: A marshmallow schema class or a mapping from
@@ -89,10 +147,17 @@ class RequestParser:
         :param unknown: Determines how to handle unknown values. Possible
             values: ``ma.EXCLUDE``, ``ma.INCLUDE``, ``ma.RAISE``. Only used if
             the schema is a dict.
+        :param pure: Whether the parsed data only depends on the request data
+            (see ``pure``).
         """
         assert location in ["args", "headers", "view_args"]
         self._location = location
         self._unknown = unknown
+        self._pure = pure
+        self._schema_instance = None
+        self._header_names = None
+        self._loader = None
+        self._lock = Lock()
 
         if isinstance(schema_or_dict, dict):
             self._schema = self.schema_from_dict(schema_or_dict)
@@ -104,6 +169,25 @@ class RequestParser:
         """The request location for this request parser."""
         return self._location
 
+    @property
+    def pure(self):
+        """Whether the parsed data only depends on the request data.
+
+        A schema is pure if it has no request-dependent defaults, hooks nor
+        validators (e.g. reading the current user or time), in which case the
+        parsed data can be cached. Set with the ``pure`` argument or on the
+        schema:
+
+        .. code-block:: python
+
+            class SearchArgs(MultiDictSchema):
+                q = ma.fields.String()
+
+                class Meta:
+                    pure = True
+        """
+        return self._pure or getattr(self._schema.Meta, "pure", False)
+
     @property
     def default_schema_cls(self):
         """Get the base schema class when dynamically creating the schema.
@@ -130,8 +214,45 @@ class RequestParser:
 
     @property
     def schema(self):
-        """Build the schema class."""
-        return self._schema()
+        """Get the schema instance.
+
+        The instance is built once and then shared between requests (and
+        threads), in the same way as the serializers share their schemas.
+        Loading data does not modify the state of a schema instance.
+        """
+        if self._schema_instance is None:
+            with self._lock:
+                if self._schema_instance is None:
+                    self._schema_instance = self._schema()
+        return self._schema_instance
+
+    @property
+    def loader(self):
+        """Get the function loading the request data.
+
+        It is the compiled load function of the schema, or the ``load()`` of
+        the schema if it cannot be compiled.
+        """
+        if self._loader is None:
+            schema = self.schema
+            loader = compile_loader(schema) if self.compile_schemas else None
+            self._loader = loader or schema.load
+        return self._loader
+
+    @property
+    def header_names(self):
+        """The normalized header names the schema loads."""
+        if self._header_names is None:
+            self._header_names = frozenset(
+                key
+                for key in (
+                    field.data_key or name
+                    for name, field in self.schema.load_fields.items()
+                )
+                # other names never matched the normalized headers
+                if key == key.lower() and "-" not in key
+            )
+        return self._header_names
 
     def load_data(self):
         """Load data from request."""
@@ -141,6 +262,11 @@ class RequestParser:
             else:
                 return request.args.to_dict(flat=False)
         elif self._location == "headers":
+            schema = self.schema
+            if schema.unknown == ma.EXCLUDE and not schema._hooks[PRE_LOAD]:
+                # only the headers of the fields are read (pre-load hooks may
+                # read or change any header)
+                return HeadersView(request.headers, self.header_names)
             return {
                 k.lower().replace("-", "_"): v for (k, v) in request.headers.items()
             }
@@ -150,4 +276,4 @@ class RequestParser:
 
     def parse(self):
         """Parse the request data."""
-        return self.schema.load(self.load_data())
+        return self.loader(self.load_data())
@@ -15,5 +15,11 @@ class RequestBodyParser:
         self.deserializer = deserializer
 
     def parse(self):
-        """Parse the request body."""
+        """Parse the request body.
+
+        Streaming deserializers are passed the request stream instead of the
+        body, which is then not read into memory.
+        """
+        if getattr(self.deserializer, "streaming", False):
+            return self.deserializer.deserialize(request.stream)
         return self.deserializer.deserialize(request.data)
@@ -5,20 +5,42 @@
 """Decorator for invoking the request parser."""
 
 import warnings
+from copy import deepcopy
 from functools import wraps
 
 from flask import request
+from marshmallow import missing
 
 from flask_resources.deserializers.json import JSONDeserializer
 
+from ..cache import LRUCache
 from ..config import resolve_from_conf
 from ..context import resource_requestctx
 from ..errors import InvalidContentType
 from .base import RequestParser
 from .body import RequestBodyParser
 
+#: Maximum number of parsers cached per ``request_parser()`` decorator.
+PARSERS_CACHE_SIZE = 32
 
-def request_parser(schema_or_parser, location=None, **options):
+
+# Types of the parsed values which are not copied.
+_IMMUTABLE_TYPES = frozenset([str, int, float, bool, bytes, type(None)])
+
+
+def copy_parsed(value):
+    """Copy parsed data, only copying the dicts, lists and mutable values."""
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+    if value_type is dict:
+        return {key: copy_parsed(v) for key, v in value.items()}
+    if value_type is list:
+        return [copy_parsed(v) for v in value]
+    return deepcopy(value)
+
+
+def request_parser(schema_or_parser, location=None, cache_size=None, **options):
     """Create decorator for parsing the request.
 
     Both decorator parameters can be resolved from the resource configuration.
@@ -26,7 +48,44 @@ def request_parser(schema_or_parser, location=None, **options):
     :param schema_or_parser: A mapping of content types to parsers.
     :param default_content_type_name: The default content type used to select
         a parser if no content type was provided.
+    :param cache_size: Number of parsed query strings to cache. The URL args
+        of a request with the same query string as a previous one are then
+        copied from the cache instead of being parsed again. Only the parsers
+        of pure schemas (see ``RequestParser.pure``) are cached.
     """
+    # Parsed URL args, keyed by the parser and the raw query string. The cache
+    # holds copies, which are copied again for each request.
+    cache = LRUCache(max_size=cache_size) if cache_size else None
+
+    def parse(parser):
+        if cache is None or parser.location != "args" or not parser.pure:
+            return parser.parse()
+        key = (parser, request.query_string)
+        result = cache.get(key, missing)
+        if result is missing:
+            result = parser.parse()
+            cache.set(key, copy_parsed(result))
+            return result
+        return copy_parsed(result)
+
+    # Parsers built from a schema, keyed by the id of the resolved schema. The
+    # schema is kept alongside the parser, so that its id cannot be reused.
+    # Location and options are the same for all parsers of the decorator.
+    parsers = {}
+
+    def get_parser(s):
+        try:
+            schema, parser = parsers[id(s)]
+            if schema is s:
+                return parser
+        except KeyError:
+            pass
+        parser = RequestParser(s, location, **options)
+        if len(parsers) >= PARSERS_CACHE_SIZE:
+            # schemas built on the fly (e.g. by a config property)
+            parsers.clear()
+        parsers[id(s)] = (s, parser)
+        return parser
 
     def decorator(f):
         @wraps(f)
@@ -37,13 +96,13 @@ def request_parser(schema_or_parser, location=None, **options):
                 if location is not None:
                     warnings.warn("The location is ignored.")
             else:
-                parser = RequestParser(s, location, **options)
+                parser = get_parser(s)
 
             ctx_attr = getattr(resource_requestctx, parser.location)
             if ctx_attr is None:
-                setattr(resource_requestctx, parser.location, parser.parse())
+                setattr(resource_requestctx, parser.location, parse(parser))
             else:
-                ctx_attr.update(parser.parse())
+                ctx_attr.update(parse(parser))
             return f(self, *args, **kwargs)
 
         return inner
@@ -0,0 +1,207 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Load functions compiled from simple request parser schemas.
+
+Most schemas of the request parsers (e.g. of the query string) only declare
+``String``, ``Integer``, ``Boolean`` and ``List`` fields, with defaults and
+validators. ``compile_loader()`` inspects the fields of such a schema once,
+and builds a load function which converts the values directly instead of going
+through the load machinery of Marshmallow. It returns the same data and raises
+the same ``ValidationError`` as ``schema.load()``. Schemas with hooks or other
+field types are left to Marshmallow.
+"""
+
+from collections.abc import Mapping
+
+from marshmallow import EXCLUDE, INCLUDE, RAISE, Schema, ValidationError, fields
+from marshmallow import missing as missing_
+from marshmallow.decorators import PRE_LOAD
+from marshmallow.utils import is_collection
+from werkzeug.datastructures import MultiDict
+
+from .schema import MultiDictSchema
+
+# Schema methods which, when overridden, change how data is loaded.
+_LOAD_METHODS = ("load", "_do_load", "_deserialize", "handle_error")
+
+
+def compile_loader(schema):
+    """Compile a load function for a schema instance.
+
+    Only schemas without hooks (apart from the flattening of ``MultiDict``
+    data of the ``MultiDictSchema``), without custom load methods and loading
+    all fields are compiled. Fields must be of type ``String``, ``Integer``,
+    ``Boolean`` or ``List`` (of those). Data which is not a mapping is loaded
+    by the schema itself.
+
+    :returns: The load function, or ``None`` if the schema cannot be compiled.
+    """
+    cls = type(schema)
+    if (
+        schema.many
+        or schema.partial
+        or any(
+            getattr(cls, name) is not getattr(Schema, name) for name in _LOAD_METHODS
+        )
+    ):
+        return None
+
+    flatten = None
+    for tag, hooks in schema._hooks.items():
+        if not hooks:
+            continue
+        if (
+            tag == PRE_LOAD
+            and [hook[0] for hook in hooks] == ["flatten_multidict"]
+            and isinstance(schema, MultiDictSchema)
+            and cls.flatten_multidict is MultiDictSchema.flatten_multidict
+        ):
+            flatten = schema.flatten_multidict
+        else:
+            return None
+
+    plan = []
+    for attr_name, field in schema.load_fields.items():
+        deserialize = _compile_field(field)
+        key = field.attribute or attr_name
+        if deserialize is None or "." in key:
+            return None
+        field_name = field.data_key if field.data_key is not None else attr_name
+        plan.append((field_name, key, deserialize))
+
+    dict_class = schema.dict_class
+    unknown = schema.unknown
+    field_names = {field_name for field_name, _, _ in plan}
+    unknown_message = schema.error_messages["unknown"]
+
+    def load(data):
+        if not isinstance(data, Mapping):
+            return schema.load(data)
+        processed = data
+        if flatten is not None and isinstance(data, MultiDict):
+            processed = flatten(data)
+
+        result = dict_class()
+        errors = {}
+        for field_name, key, deserialize in plan:
+            try:
+                value = deserialize(processed.get(field_name, missing_))
+            except ValidationError as error:
+                errors[field_name] = error.messages
+                value = error.valid_data or missing_
+            if value is not missing_:
+                result[key] = value
+
+        if unknown != EXCLUDE:
+            for key in set(processed) - field_names:
+                if unknown == INCLUDE:
+                    result[key] = processed[key]
+                elif unknown == RAISE:
+                    errors[key] = [unknown_message]
+
+        if errors:
+            raise ValidationError(errors, data=data, valid_data=result)
+        return result
+
+    return load
+
+
+def _compile_field(field):
+    """Compile the deserialization of a value (see ``Field.deserialize()``)."""
+    convert = _compile_converter(field)
+    if convert is None:
+        return None
+
+    required = field.required
+    allow_none = field.allow_none
+    default = field.load_default
+    default_is_callable = callable(default)
+    validate = field._validate if field.validators else None
+    make_error = field.make_error
+
+    def deserialize(value):
+        if value is missing_:
+            if required:
+                raise make_error("required")
+            return default() if default_is_callable else default
+        if value is None:
+            if allow_none:
+                return None
+            raise make_error("null")
+        output = convert(value)
+        if validate is not None:
+            validate(output)
+        return output
+
+    return deserialize
+
+
+def _compile_converter(field):
+    """Compile the conversion of a value (see ``Field._deserialize()``).
+
+    The common case (i.e. strings from the query string) is converted
+    directly, other values are left to the field, for it to raise the same
+    errors.
+    """
+    field_type = type(field)
+
+    if field_type is fields.String:
+        field_deserialize = field._deserialize
+
+        def convert(value):
+            if type(value) is str:
+                return value
+            return field_deserialize(value, None, None)
+
+    elif field_type is fields.Integer:
+        strict = field.strict
+        validated = field._validated
+
+        def convert(value):
+            if type(value) is str and not strict:
+                try:
+                    return int(value)
+                except ValueError:
+                    pass
+            return validated(value)
+
+    elif field_type is fields.Boolean:
+        truthy = field.truthy
+        falsy = field.falsy
+        field_deserialize = field._deserialize
+
+        def convert(value):
+            if truthy and type(value) is str:
+                if value in truthy:
+                    return True
+                if value in falsy:
+                    return False
+            return field_deserialize(value, None, None)
+
+    elif field_type is fields.List:
+        inner = _compile_field(field.inner)
+        if inner is None:
+            return None
+        make_error = field.make_error
+
+        def convert(value):
+            if not is_collection(value):
+                raise make_error("invalid")
+            result = []
+            errors = {}
+            for idx, each in enumerate(value):
+                try:
+                    result.append(inner(each))
+                except ValidationError as error:
+                    if error.valid_data is not None:
+                        result.append(error.valid_data)
+                    errors[idx] = error.messages
+            if errors:
+                raise ValidationError(errors, valid_data=result)
+            return result
+
+    else:
+        return None
+
+    return convert
@@ -6,10 +6,14 @@
 """Schema that's able to handle loading data from MultiDicts."""
 
 from warnings import warn
+from weakref import WeakKeyDictionary
 
 from marshmallow import EXCLUDE, Schema, fields, missing, pre_load
 from werkzeug.datastructures import MultiDict
 
+from ..serializers.dumping import SchemaDumper
+from ..serializers.fragments import RawJSON
+
 
 class MultiDictSchema(Schema):
     """MultiDict aware schema used for loading e.g. request.args."""
@@ -31,17 +35,55 @@ class MultiDictSchema(Schema):
         """
         return any((isinstance(field, t) for t in cls.LIST_TYPES))
 
+    # Index of the fields, per schema class and set of fields. The classes are
+    # weakly referenced, as schemas may be created at runtime (``from_dict()``).
+    _multidict_indexes = WeakKeyDictionary()
+
+    def get_multidict_index(self):
+        """Get the names of the scalar fields, and all the keys of the fields.
+
+        The index is computed once per schema class (and set of fields, as
+        they depend on ``only`` and ``exclude``).
+        """
+        indexes = self._multidict_indexes.get(type(self))
+        if indexes is None:
+            indexes = self._multidict_indexes[type(self)] = {}
+        cache_key = tuple(self.fields)
+        index = indexes.get(cache_key)
+        if index is None:
+            scalars = frozenset(
+                name
+                for name, field in self.fields.items()
+                if not self.is_list_field(field)
+            )
+            known = frozenset(self.fields) | frozenset(
+                field.data_key
+                for field in self.fields.values()
+                if field.data_key is not None
+            )
+            index = indexes[cache_key] = (scalars, known)
+        return index
+
     @pre_load
     def flatten_multidict(self, data, **kwargs):
-        """Flatten a MultiDict into a normal dictionary."""
+        """Flatten a MultiDict into a normal dictionary.
+
+        Only the first value of the non-list fields is kept. If the schema
+        excludes unknown values, the keys which are not the name or data key
+        of a field are skipped.
+        """
         if not isinstance(data, MultiDict):
             return data
-        data = data.to_dict(flat=False)
 
-        for name, field in self.fields.items():
-            if name in data and not self.is_list_field(field):
-                data[name] = data[name][0]
-        return data
+        scalars, known = self.get_multidict_index()
+        skip_unknown = self.unknown == EXCLUDE
+        result = {}
+        for key, values in data.lists():
+            if key in scalars:
+                result[key] = values[0]
+            elif not skip_unknown or key in known:
+                result[key] = values
+        return result
 
 
 class BaseListSchema(Schema):
@@ -52,13 +94,21 @@ class BaseListSchema(Schema):
     links = fields.Method("get_links")
     sortBy = fields.Method("get_sorting_option")
 
-    def __init__(self, object_schema_cls=None, **kwargs):
-        """Construct."""
+    def __init__(self, object_schema_cls=None, dumper_factory=None, **kwargs):
+        """Construct.
+
+        :param object_schema_cls: Schema used to dump each of the hits.
+        :param dumper_factory: Callable creating the dumper of the hits from
+            the object schema (see ``flask_resources.serializers.dumping``).
+        """
         super().__init__(**kwargs)
         self.object_schema_cls = object_schema_cls
+        self.dumper_factory = dumper_factory or SchemaDumper
+        self._hits_dumper = None
+        self._hits_dumper_context = None
 
-    def get_hits(self, obj_list):
-        """Apply hits transformation."""
+    def get_object_schema(self):
+        """Get the schema used to dump each of the hits."""
         if self.object_schema_cls:
             object_schema_cls = self.object_schema_cls
         else:
@@ -77,10 +127,56 @@ class BaseListSchema(Schema):
         else:
             object_schema = object_schema_cls()
 
-        hits_list = [object_schema.dump(obj) for obj in obj_list["hits"]["hits"]]
-        obj_list["hits"]["hits"] = hits_list
+        return object_schema
+
+    def get_hits_dumper(self):
+        """Get the dumper of the hits, reused for all the dumps of the list.
+
+        The dumper is built again if the context of the list schema changed
+        since it was built, as the object schema is built from the context.
+        """
+        if self._hits_dumper is None or self._hits_dumper_context != self.context:
+            self._hits_dumper_context = dict(self.context)
+            self._hits_dumper = self.dumper_factory(self.get_object_schema())
+        return self._hits_dumper
+
+    def get_hits(self, obj_list):
+        """Apply hits transformation.
+
+        ``RawJSON`` hits are already serialized and are kept as they are.
+        """
+        hits = list(obj_list["hits"]["hits"])
+        dumper = self.get_hits_dumper()
+        to_dump = [i for i, hit in enumerate(hits) if not isinstance(hit, RawJSON)]
+        if len(to_dump) == len(hits):
+            hits = dumper.dump_many(hits)
+        elif to_dump:
+            dumped = dumper.dump_many([hits[i] for i in to_dump])
+            for i, hit in zip(to_dump, dumped):
+                hits[i] = hit
+        obj_list["hits"]["hits"] = hits
         return obj_list["hits"]
 
+    def dump_lazy(self, obj_list):
+        """Dump the list envelope, leaving the hits as a lazy iterator.
+
+        The hits are only dumped while the returned iterator is consumed (e.g.
+        while streaming the response). Schemas overriding ``get_hits()`` are
+        dumped eagerly to preserve their behavior.
+        """
+        if type(self).get_hits is not BaseListSchema.get_hits:
+            return self.dump(obj_list)
+
+        hits = obj_list["hits"]["hits"]
+        envelope = dict(obj_list, hits=dict(obj_list["hits"], hits=[]))
+        result = self.dump(envelope)
+
+        dumper = self.get_hits_dumper()
+        result["hits"]["hits"] = (
+            obj if isinstance(obj, RawJSON) else dumper.dump(obj) for obj in hits
+        )
+        return result
+
     def get_aggs(self, obj_list):
         """Apply aggregations transformation."""
         aggs = obj_list.get("aggregations")
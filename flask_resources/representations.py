@@ -0,0 +1,181 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Store of serialized representations of immutable objects.
+
+The serialized bytes of an object (e.g. a published record), per mimetype, are
+written once to an append-only data file, and served from a memory map of
+that file afterwards, without dumping nor encoding the object again.
+
+A view returns a ``StoredRepresentation`` marker instead of the object, and
+the response handler of the negotiated mimetype looks it up in its store:
+
+.. code-block:: python
+
+    store = RepresentationStore("/var/lib/records/representations")
+
+    class Config(ResourceConfig):
+        response_handlers = {
+            "application/json": ResponseHandler(JSONSerializer(), store=store),
+        }
+
+    class RecordResource(Resource):
+        @response_handler()
+        def read(self):
+            pid_value = resource_requestctx.view_args["pid_value"]
+            return StoredRepresentation(
+                f"{pid_value}:v1", loader=lambda: get_record(pid_value)
+            ), 200
+
+As the stored bytes are never replaced, the keys must identify immutable
+content (e.g. include the revision of the record). The store is only
+available on Unix.
+"""
+
+import mmap
+import os
+import struct
+import threading
+
+# offset and length of the data, length of the key
+_RECORD = struct.Struct("<QQI")
+
+
+class StoredRepresentation:
+    """Marker returned by views instead of an object with a stored representation.
+
+    :param key: Key of the object in the store, unique per content.
+    :param obj: The object, serialized if it is not in the store yet.
+    :param loader: Callable returning the object, instead of ``obj``. It is
+        only called if the object is not in the store.
+    """
+
+    __slots__ = ("key", "obj", "loader")
+
+    def __init__(self, key, obj=None, loader=None):
+        """Constructor."""
+        self.key = key
+        self.obj = obj
+        self.loader = loader
+
+    def load(self):
+        """Get the object."""
+        if self.obj is None and self.loader is not None:
+            self.obj = self.loader()
+        return self.obj
+
+
+class RepresentationStore:
+    """Append-only store of serialized representations.
+
+    The bytes are appended to ``<path>.data`` and their position to
+    ``<path>.index``. Several processes can share the store, writes are
+    serialized with a lock on the index file.
+    """
+
+    def __init__(self, path):
+        """Constructor.
+
+        :param path: Path prefix of the data and index files, which are
+            created if they do not exist.
+        """
+        self.path = path
+        self._data_fd = os.open(path + ".data", os.O_RDWR | os.O_CREAT, 0o644)
+        self._index_fd = os.open(path + ".index", os.O_RDWR | os.O_CREAT, 0o644)
+        self._index = {}
+        self._index_pos = 0
+        self._mm = None
+        self._lock = threading.Lock()
+
+    def close(self):
+        """Close the files.
+
+        The data stays mapped while views returned by ``get()`` are in use.
+        """
+        self._mm = None
+        os.close(self._data_fd)
+        os.close(self._index_fd)
+
+    @staticmethod
+    def _index_key(key, mimetype):
+        return f"{mimetype}\0{key}".encode("utf-8")
+
+    def _refresh(self):
+        """Read the index records appended since the last read."""
+        size = os.fstat(self._index_fd).st_size - self._index_pos
+        if size <= 0:
+            return
+        data = os.pread(self._index_fd, size, self._index_pos)
+        pos = 0
+        while pos + _RECORD.size <= len(data):
+            offset, length, key_length = _RECORD.unpack_from(data, pos)
+            end = pos + _RECORD.size + key_length
+            if end > len(data):
+                break
+            self._index[data[pos + _RECORD.size : end]] = (offset, length)
+            pos = end
+        self._index_pos += pos
+
+    def _slice(self, offset, length):
+        """Get a view of the data, remapping the data file if it has grown.
+
+        A previous map is not closed, as views of it may still be in use. It
+        is unmapped once they are all released.
+        """
+        end = offset + length
+        if not length:
+            return memoryview(b"")
+        if self._mm is None or len(self._mm) < end:
+            self._mm = mmap.mmap(self._data_fd, 0, access=mmap.ACCESS_READ)
+        return memoryview(self._mm)[offset:end]
+
+    def get(self, key, mimetype):
+        """Get a read-only ``memoryview`` of the stored bytes, or ``None``.
+
+        The view is a slice of the memory map of the data file, the data is
+        not copied.
+        """
+        index_key = self._index_key(key, mimetype)
+        with self._lock:
+            entry = self._index.get(index_key)
+            if entry is None:
+                self._refresh()
+                entry = self._index.get(index_key)
+                if entry is None:
+                    return None
+            return self._slice(*entry)
+
+    def put(self, key, mimetype, data):
+        """Store the bytes of a key and mimetype, unless already stored.
+
+        :returns: A ``memoryview`` of the stored bytes.
+        """
+        import fcntl  # not available on all platforms, unlike the module
+
+        index_key = self._index_key(key, mimetype)
+        with self._lock:
+            fcntl.flock(self._index_fd, fcntl.LOCK_EX)
+            try:
+                self._refresh()
+                entry = self._index.get(index_key)
+                if entry is not None:
+                    return self._slice(*entry)
+                offset = os.fstat(self._data_fd).st_size
+                os.pwrite(self._data_fd, data, offset)
+                # the index record is written after the data it points to
+                record = _RECORD.pack(offset, len(data), len(index_key)) + index_key
+                os.pwrite(self._index_fd, record, os.fstat(self._index_fd).st_size)
+                self._refresh()
+            finally:
+                fcntl.flock(self._index_fd, fcntl.LOCK_UN)
+        return memoryview(data)
+
+    def __contains__(self, key_and_mimetype):
+        """Check if a ``(key, mimetype)`` is stored."""
+        return self.get(*key_and_mimetype) is not None
+
+    def __len__(self):
+        """Number of stored representations."""
+        with self._lock:
+            self._refresh()
+            return len(self._index)
@@ -15,7 +15,7 @@ from .context import ResourceRequestCtx
 from .deserializers import JSONDeserializer
 from .errors import handle_http_exception
 from .parsers import RequestBodyParser
-from .responses import ResponseHandler
+from .responses import ResponseHandler, cache_response
 from .serializers import JSONSerializer
 
 
@@ -49,6 +49,13 @@ def route(
     config = view_meth.__self__.config
     decorators = view_meth.__self__.decorators
 
+    # Applied before the decorators, so that the content negotiation is done
+    # first, but the request parsing is skipped for cached responses.
+    cache = getattr(config, "response_cache", None)
+    ttl = getattr(config, "response_cache_ttl", {}).get(endpoint or view_name)
+    if method == "GET" and cache is not None and ttl:
+        view_meth = cache_response(view_meth, endpoint or view_name, cache, ttl)
+
     if apply_decorators:
         # reversed so order is the same as when applied directly to method
         for decorator in reversed(decorators):
@@ -105,6 +112,38 @@ class ResourceConfig:
     #: Set to ``None``, to require an Accept header.
     default_accept_mimetype = "application/json"
 
+    # Response compression
+    # ====================
+
+    #: MIME types of the responses to compress with gzip or deflate, if the
+    #: client accepts it (``Accept-Encoding`` header).
+    response_compression_mimetypes = []
+    #: Minimum size in bytes of a response body for it to be compressed.
+    response_compression_min_size = 1024
+    #: The compression level, from 1 (fastest) to 9 (smallest).
+    response_compression_level = 6
+
+    # JSON encoding
+    # =============
+
+    #: The JSON codec of the JSON serializers and deserializers which are not
+    #: given one (e.g. a faster third-party codec, see ``StdlibJSONCodec``).
+    json_codec = None
+    #: Translate each distinct lazy string only once per request when
+    #: serializing (e.g. the labels of vocabularies repeated in the records).
+    cache_lazy_strings = False
+
+    # Response caching
+    # ================
+
+    #: Cache of the responses of GET routes, e.g.
+    #: ``LRUCache(max_size=64 * 1024 * 1024, sizeof=len)`` to limit it to 64MB.
+    #: Only use it for responses which are the same for all users.
+    response_cache = None
+    #: Mapping of endpoint names to the number of seconds their responses are
+    #: cached for. Routes not in the mapping are not cached.
+    response_cache_ttl = {}
+
 
 class Resource:
     """Resource interface.
@@ -4,11 +4,18 @@
 
 """Response module."""
 
+import string
+import time
+import zlib
 from functools import wraps
+from hashlib import blake2b
+from itertools import chain
 
-from flask import Response, make_response
+from flask import Response, current_app, make_response, request, stream_with_context
 
+from .cache import KeyLocks, invalidate_tags, tags_generation, tags_invalidated_since
 from .context import resource_requestctx
+from .representations import StoredRepresentation
 
 
 def response_handler(many=False):
@@ -40,6 +47,85 @@ def response_handler(many=False):
     return decorator
 
 
+def cache_tags(*tags):
+    """Decorator tagging the cached response of a read view.
+
+    The tags are formatted with the view args, and the cached response is
+    invalidated when a write view invalidates one of its tags (see
+    ``invalidate_cache_tags()``).
+
+    .. code-block:: python
+
+        @cache_tags("record:{pid_value}")
+        @response_handler()
+        def read(self):
+            return obj, 200
+    """
+    _check_tags(tags)
+
+    def decorator(f):
+        @wraps(f)
+        def inner(*args, **kwargs):
+            resource_requestctx.cache_tags.update(_format_tags(tags))
+            return f(*args, **kwargs)
+
+        return inner
+
+    return decorator
+
+
+def invalidate_cache_tags(*tags):
+    """Decorator invalidating cache tags once a write view succeeded.
+
+    The tags are formatted with the view args, before the view is called. The
+    cached responses and dumps with any of these tags are deleted from all the
+    caches of the process, unless the view raises an exception.
+
+    .. code-block:: python
+
+        @invalidate_cache_tags("record:{pid_value}", "records")
+        @response_handler()
+        def update(self):
+            return obj, 200
+    """
+    _check_tags(tags)
+
+    def decorator(f):
+        @wraps(f)
+        def inner(*args, **kwargs):
+            # formatted first, so that a missing view arg fails before the write
+            formatted = _format_tags(tags)
+            res = f(*args, **kwargs)
+            invalidate_tags(formatted)
+            return res
+
+        return inner
+
+    return decorator
+
+
+def _check_tags(tags):
+    """Check that the placeholders of the tags are names of view args."""
+    for tag in tags:
+        for _, name, _, _ in string.Formatter().parse(tag):
+            if name is not None and not name.isidentifier():
+                raise ValueError(
+                    f"Invalid placeholder {{{name}}} in the cache tag {tag!r}, "
+                    "only view arg names are supported."
+                )
+
+
+def _format_tags(tags):
+    view_args = request.view_args or {}
+    try:
+        return [tag.format(**view_args) for tag in tags]
+    except KeyError as error:
+        raise RuntimeError(
+            f"The cache tags {tags!r} use the view arg {error}, which is not "
+            "in the route."
+        ) from error
+
+
 class ResponseHandler:
     """Response handler which delegates to the a serializer.
 
@@ -57,10 +143,49 @@ class ResponseHandler:
             }
     """
 
-    def __init__(self, serializer, headers=None):
-        """Constructor."""
+    #: Minimum size of the chunks written to the client when streaming.
+    stream_chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        serializer,
+        headers=None,
+        stream=False,
+        etag=None,
+        weak_etag=False,
+        store=None,
+        write_into=False,
+    ):
+        """Constructor.
+
+        :param serializer: The serializer used to build the response body.
+        :param headers: A dict or a callable returning the response headers.
+        :param stream: If ``True``, list responses are sent chunk by chunk
+            (using ``stream_object_list()`` of the serializer) instead of being
+            serialized in memory first.
+        :param etag: Enables ETags and conditional requests (``If-None-Match``).
+            Either a callable ``etag(obj_or_list, code, many=False)`` returning
+            a validator (e.g. the revision of the object the view returned) or
+            ``None``, or ``True`` to hash the serialized body. With a callable,
+            the serialization is skipped when the client's copy is current.
+        :param weak_etag: Emit weak ETags instead of strong ones.
+        :param store: A ``RepresentationStore``, from which the views returning
+            a ``StoredRepresentation`` are served (unless the request has a
+            query string). The ``headers`` and ``etag``
+            callables receive the ``StoredRepresentation`` for these views.
+        :param write_into: If ``True``, the serializer writes the body as bytes
+            (using ``serialize_object_into()`` and
+            ``serialize_object_list_into()``), in chunks which are sent as
+            they are. Large list bodies are then never held both as a string
+            and as bytes (see ``benchmarks/bench_response_body.py``).
+        """
         self.serializer = serializer
         self.headers = headers
+        self.stream = stream
+        self.etag = etag
+        self.weak_etag = weak_etag
+        self.store = store
+        self.write_into = write_into
 
     def make_headers(self, obj_or_list, code, many=False):
         """Builds the headers fo the response."""
@@ -79,15 +204,362 @@ class ResponseHandler:
         if isinstance(obj_or_list, Response):
             return obj_or_list
 
+        etag = None
+        if callable(self.etag) and obj_or_list is not None:
+            etag = self.etag(obj_or_list, code, many=many)
+            if etag is not None and self.is_not_modified(etag, code):
+                return self.make_not_modified_response(etag, obj_or_list, code, many)
+
         # https://flask.palletsprojects.com/en/1.1.x/api/#flask.Flask.make_response
         # (body, status, header)
+        if many and self.stream and obj_or_list is not None:
+            chunks = _in_resource_context(
+                resource_requestctx._get_current_object(),
+                _coalesce(
+                    self.serializer.stream_object_list(obj_or_list),
+                    self.stream_chunk_size,
+                ),
+            )
+            response = make_response(
+                stream_with_context(chunks),
+                code,
+                self.make_headers(obj_or_list, code, many=many),
+            )
+            if etag is not None:
+                response.set_etag(etag, weak=self.weak_etag)
+            return self.compress(response)
+
+        if obj_or_list is None:
+            body = ""
+        elif many:
+            body = self.serialize_body(obj_or_list, many=True)
+        elif isinstance(obj_or_list, StoredRepresentation):
+            body = self.load_representation(obj_or_list)
+        else:
+            body = self.serialize_body(obj_or_list)
+
+        headers = self.make_headers(obj_or_list, code, many=many)
+        if isinstance(body, _Body):
+            # a list body is sent as is (``make_response()`` would jsonify it)
+            response = current_app.response_class(body, code, headers)
+        else:
+            response = make_response(body, code, headers)
+
+        if self.etag is True and obj_or_list is not None:
+            etag = blake2b(response.get_data(), digest_size=16).hexdigest()
+            if self.is_not_modified(etag, code):
+                return self.make_not_modified_response(etag, obj_or_list, code, many)
+        if etag is not None:
+            response.set_etag(etag, weak=self.weak_etag)
+
+        return self.compress(response)
+
+    def serialize_body(self, obj_or_list, many=False):
+        """Serialize the response body.
+
+        The body is the ``str`` output of the serializer, or with
+        ``write_into``, the list of bytes chunks the serializer wrote.
+        """
+        if not self.write_into:
+            if many:
+                return self.serializer.serialize_object_list(obj_or_list)
+            return self.serializer.serialize_object(obj_or_list)
+
+        body = _Body(self.stream_chunk_size)
         if many:
-            serialize = self.serializer.serialize_object_list
+            self.serializer.serialize_object_list_into(obj_or_list, body)
+        else:
+            self.serializer.serialize_object_into(obj_or_list, body)
+        body.flush()
+        return body
+
+    def load_representation(self, representation):
+        """Get the serialized bytes of a ``StoredRepresentation``.
+
+        The object is serialized and stored if it is not in the store yet.
+        The store gives a view of its memory map, which is copied once into
+        the bytes of the body, as WSGI servers only accept ``bytes``.
+
+        Requests with a query string bypass the store, as its arguments may
+        change the output of the serializer (e.g. ``prettyprint`` or sparse
+        fieldsets).
+        """
+        mimetype = resource_requestctx.accept_mimetype
+        store = None if request.args else self.store
+        if store is not None:
+            data = store.get(representation.key, mimetype)
+            if data is not None:
+                return bytes(data)
+
+        data = self.serializer.serialize_object(representation.load())
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if store is not None:
+            store.put(representation.key, mimetype, data)
+        return data
+
+    def is_not_modified(self, etag, code):
+        """Check if the client's copy (``If-None-Match``) matches the ETag."""
+        return (
+            code == 200
+            and request.method in ("GET", "HEAD")
+            and request.if_none_match.contains_weak(etag)
+        )
+
+    def make_not_modified_response(self, etag, obj_or_list, code, many=False):
+        """Builds a ``304 Not Modified`` response."""
+        response = make_response(
+            "", 304, self.make_headers(obj_or_list, code, many=many)
+        )
+        response.set_etag(etag, weak=self.weak_etag)
+        return self.compress(response)
+
+    def compress(self, response):
+        """Compress the response body, if enabled for its MIME type.
+
+        Compression is configured on the resource config (see
+        ``ResourceConfig.response_compression_mimetypes``). Streamed bodies
+        are compressed incrementally.
+        """
+        config = resource_requestctx.config
+        mimetypes = getattr(config, "response_compression_mimetypes", None)
+        if not mimetypes or response.mimetype not in mimetypes:
+            return response
+
+        response.vary.add("Accept-Encoding")
+        if (
+            response.status_code < 200
+            or response.status_code in (204, 304)
+            or "Content-Encoding" in response.headers
+        ):
+            return response
+
+        encoding = _negotiate_encoding(request.accept_encodings)
+        if encoding is None:
+            return response
+
+        min_size = config.response_compression_min_size
+        level = config.response_compression_level
+        if response.is_streamed:
+            # Read the beginning of the stream, to not compress small bodies.
+            chunks = response.iter_encoded()
+            head = []
+            size = 0
+            for chunk in chunks:
+                head.append(chunk)
+                size += len(chunk)
+                if size >= min_size:
+                    break
+            else:
+                response.set_data(b"".join(head))
+                return response
+            response.response = _compress_stream(chain(head, chunks), encoding, level)
         else:
-            serialize = self.serializer.serialize_object
+            data = response.get_data()
+            if len(data) < min_size:
+                return response
+            compressor = _compressor(encoding, level)
+            response.set_data(compressor.compress(data) + compressor.flush())
+
+        response.headers["Content-Encoding"] = encoding
+        # the compressed body is not byte-for-byte the same representation
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+
+class _Body(list):
+    """Response body the serializers write into, as a list of bytes chunks.
+
+    Small writes are joined into chunks of at least ``size`` bytes.
+    """
+
+    def __init__(self, size):
+        """Constructor."""
+        super().__init__()
+        self.size = size
+        self.pending = []
+        self.pending_size = 0
+
+    def write(self, data):
+        """Write bytes to the body."""
+        self.pending.append(data)
+        self.pending_size += len(data)
+        if self.pending_size >= self.size:
+            self.flush()
+
+    def flush(self):
+        """Add the pending writes to the chunks of the body."""
+        if self.pending:
+            pending = self.pending
+            self.append(pending[0] if len(pending) == 1 else b"".join(pending))
+            self.pending = []
+            self.pending_size = 0
+
+
+def _in_resource_context(ctx, chunks):
+    """Produce each chunk in the resource request context.
+
+    The hits of streamed lists are dumped lazily, while the response is sent,
+    and may use the resource request context (e.g. in schemas).
+    """
+    chunks = iter(chunks)
+    while True:
+        with ctx.reenter():
+            chunk = next(chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def _coalesce(chunks, size):
+    """Join small chunks together, so they are written in fewer calls."""
+    buffer = []
+    buffered = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered >= size:
+            yield "".join(buffer)
+            buffer = []
+            buffered = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+class CachedResponse:
+    """A finished response stored in the response cache.
 
-        return make_response(
-            "" if obj_or_list is None else serialize(obj_or_list),
-            code,
-            self.make_headers(obj_or_list, code, many=many),
+    ``len()`` gives its approximate size in bytes, so it can be used as the
+    ``sizeof`` function of the cache.
+    """
+
+    __slots__ = ("expires", "status", "headers", "body")
+
+    def __init__(self, expires, status, headers, body):
+        """Constructor."""
+        self.expires = expires
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @classmethod
+    def from_response(cls, response, ttl):
+        """Store a response, if it is cacheable."""
+        if (
+            response.status_code != 200
+            or response.is_streamed
+            or "Set-Cookie" in response.headers
+        ):
+            return None
+        return cls(
+            time.time() + ttl,
+            response.status_code,
+            list(response.headers.items()),
+            response.get_data(),
+        )
+
+    def to_response(self):
+        """Rebuild the response."""
+        response = Response(self.body, self.status, self.headers)
+        return response.make_conditional(request)
+
+    def __len__(self):
+        """Approximate size in bytes."""
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers)
+
+
+def cache_response(view, endpoint, cache, ttl):
+    """Decorator caching the responses of a view for ``ttl`` seconds.
+
+    The cache key is made of the endpoint, the view args, the query string
+    args, the negotiated mimetype and content encoding. When an entry expires,
+    a single request recomputes it while the others keep getting the expired
+    entry. Requests for a key not in the cache wait for the one computing it,
+    and compute the response themselves if it was not stored (e.g. an error).
+    The responses are stored with the tags set by ``cache_tags()``, unless
+    one of them was invalidated while the response was computed.
+
+    :param view: The view function.
+    :param endpoint: The name of the endpoint.
+    :param cache: The cache (e.g. ``flask_resources.cache.LRUCache``).
+    :param ttl: Number of seconds the responses are cached for.
+    """
+    locks = KeyLocks()
+
+    @wraps(view)
+    def inner(*args, **kwargs):
+        key = (
+            endpoint,
+            tuple(sorted((request.view_args or {}).items())),
+            # the order of the keys does not matter, the one of their values does
+            tuple((k, tuple(v)) for k, v in sorted(request.args.lists())),
+            resource_requestctx.accept_mimetype,
+            _negotiate_encoding(request.accept_encodings),
         )
+
+        entry = cache.get(key)
+        if entry is not None and entry.expires > time.time():
+            return entry.to_response()
+
+        with locks.hold(key, blocking=False) as acquired:
+            if acquired:
+                # it may have been stored since it was looked up
+                fresh = cache.get(key) if entry is None else None
+                if fresh is not None and fresh.expires > time.time():
+                    return fresh.to_response()
+                return compute(key, *args, **kwargs)
+        if entry is not None:
+            # served expired while another request recomputes it
+            return entry.to_response()
+
+        # wait for the request computing the missing entry
+        with locks.hold(key):
+            entry = cache.get(key)
+        if entry is not None and entry.expires > time.time():
+            return entry.to_response()
+        # nothing was stored (e.g. an error response), compute it concurrently
+        return compute(key, *args, **kwargs)
+
+    def compute(key, *args, **kwargs):
+        generation = tags_generation()
+        response = view(*args, **kwargs)
+        entry = CachedResponse.from_response(response, ttl)
+        tags = resource_requestctx.cache_tags
+        # a write may have invalidated the data while it was being read
+        if entry is not None and not tags_invalidated_since(tags, generation):
+            cache.set(key, entry, tags=tags)
+            if tags_invalidated_since(tags, generation):
+                cache.delete(key)
+        return response
+
+    return inner
+
+
+def _negotiate_encoding(accept_encodings):
+    """Select gzip or deflate, based on the "Accept-Encoding" header."""
+    gzip_quality = accept_encodings["gzip"]
+    deflate_quality = accept_encodings["deflate"]
+    if gzip_quality and gzip_quality >= deflate_quality:
+        return "gzip"
+    elif deflate_quality:
+        return "deflate"
+    return None
+
+
+def _compressor(encoding, level):
+    """Create a compressor writing a gzip member or a zlib stream.
+
+    The gzip header has no modification time, so the output is reproducible.
+    """
+    wbits = 16 + zlib.MAX_WBITS if encoding == "gzip" else zlib.MAX_WBITS
+    return zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+
+def _compress_stream(chunks, encoding, level):
+    """Compress chunks incrementally, flushing the output of each chunk."""
+    compressor = _compressor(encoding, level)
+    for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
@@ -11,6 +11,7 @@ from .base import (
     MarshmallowSerializer,
 )
 from .csv import CSVSerializer
+from .fragments import RawJSON
 from .json import JSONSerializer
 from .simple import SimpleSerializer
 
@@ -21,5 +22,6 @@ __all__ = (
     "CSVSerializer",
     "JSONSerializer",
     "MarshmallowSerializer",
+    "RawJSON",
     "SimpleSerializer",
 )
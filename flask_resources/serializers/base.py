@@ -6,10 +6,22 @@
 """Serializers required interfaces."""
 
 from abc import ABC, abstractmethod
+from functools import partial
 from warnings import warn
 
+from flask import has_request_context, request
 from marshmallow import Schema, post_dump, pre_dump
 
+from ..cache import LRUCache
+from .dumping import (
+    CachingDumper,
+    CompiledSchemaDumper,
+    ParallelDumper,
+    SchemaDumper,
+    record_cache_key,
+)
+from .fragments import RawJSON
+
 
 class BaseSerializer(ABC):
     """Serializer Interface."""
@@ -23,6 +35,43 @@ class BaseSerializer(ABC):
         """Serialize a list of objects according to the response ctx."""
         pass
 
+    def stream_object_list(self, obj_list):
+        """Serialize a list of objects into an iterator of string chunks.
+
+        Serializers able to produce their output incrementally should override
+        this method. By default the whole list is serialized in one chunk.
+        """
+        yield self.serialize_object_list(obj_list)
+
+    def serialize_object_into(self, obj, buffer):
+        """Serialize a single object as UTF-8 bytes written into a buffer.
+
+        :param buffer: A binary file-like object (e.g. ``io.BytesIO``).
+
+        By default, the output of ``serialize_object()`` is encoded.
+        """
+        buffer.write(_to_bytes(self.serialize_object(obj)))
+
+    def serialize_object_list_into(self, obj_list, buffer):
+        """Serialize a list of objects as UTF-8 bytes written into a buffer.
+
+        By default, the output of ``serialize_object_list()`` is encoded.
+        """
+        buffer.write(_to_bytes(self.serialize_object_list(obj_list)))
+
+
+def _to_bytes(data):
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+def is_overridden(obj, name, cls):
+    """Check if the class of an object overrides a method of a base class.
+
+    Serializers writing bytes directly fall back to the ``str`` output of
+    subclasses overriding the methods returning it.
+    """
+    return getattr(type(obj), name) is not getattr(cls, name)
+
 
 class MarshmallowSerializer(BaseSerializer):
     """Marshmallow serializer that serializes an obj into defined schema.
@@ -33,8 +82,28 @@ class MarshmallowSerializer(BaseSerializer):
     :param list_schema_cls: Marshmallow Schema of the object list.
     :param schema_context: Context of the Marshmallow Schema.
     :param schema_kwargs: Additional arguments to be passed to marshmallow schema.
+    :param compile_schemas: Dump objects with functions compiled from the
+        schemas (see ``CompiledSchemaDumper``). The list schema must accept a
+        ``dumper_factory`` argument (e.g. ``BaseListSchema``).
+    :param dump_cache: Cache of the dumped objects (see ``CachingDumper``),
+        e.g. a ``flask_resources.cache.LRUCache``. Same requirement on the
+        list schema as for ``compile_schemas``.
+    :param dump_cache_key: Callable returning the cache key of an object, or
+        ``None`` to not cache it. Defaults to the id and revision id.
+    :param dump_cache_tags: Callable returning the cache tags of an object,
+        e.g. ``lambda obj: ["record:" + obj["id"]]``.
+    :param dump_executor: A ``concurrent.futures.Executor`` used to dump the
+        hits of large lists in parallel (see ``ParallelDumper``). Same
+        requirement on the list schema as for ``compile_schemas``.
+    :param sparse_fieldsets: Name of the query string argument listing the
+        fields to dump (e.g. ``"fields"`` for ``?fields=id,title``). The
+        objects are then dumped with schemas built with ``only=``, so the
+        other fields are never computed. Unknown fields are ignored.
     """
 
+    #: Maximum number of field sets whose schemas are kept.
+    fieldsets_cache_size = 64
+
     def __init__(
         self,
         format_serializer_cls,
@@ -42,11 +111,27 @@ class MarshmallowSerializer(BaseSerializer):
         list_schema_cls=None,
         schema_context=None,
         schema_kwargs=None,
+        compile_schemas=False,
+        dump_cache=None,
+        dump_cache_key=record_cache_key,
+        dump_cache_tags=None,
+        dump_executor=None,
+        sparse_fieldsets=None,
         **serializer_options,
     ):
         """Initialize the serializer."""
         schema_kwargs = schema_kwargs or {}
         self.format_serializer = format_serializer_cls(**serializer_options)
+        self.object_schema_cls = object_schema_cls
+        self.list_schema_cls = list_schema_cls
+        self.schema_context = schema_context
+        self.schema_kwargs = schema_kwargs
+        self.compile_schemas = compile_schemas
+        self.dump_cache = dump_cache
+        self.dump_cache_key = dump_cache_key
+        self.dump_cache_tags = dump_cache_tags
+        self.dump_executor = dump_executor
+        self.sparse_fieldsets = sparse_fieldsets
 
         if schema_context:
             self.object_schema = object_schema_cls(
@@ -60,30 +145,127 @@ class MarshmallowSerializer(BaseSerializer):
         else:
             self.object_schema = object_schema_cls(**schema_kwargs)
 
-        if list_schema_cls:
-            if schema_context:
-                self.list_schema = list_schema_cls(
-                    object_schema_cls=object_schema_cls,
-                    context=schema_context,
-                )
-            else:
-                self.list_schema = list_schema_cls(
-                    object_schema_cls=object_schema_cls,
-                )
-
+        self.object_dumper = self.make_dumper(self.object_schema)
+        self.list_schema = self.make_list_schema(object_schema_cls)
+
+        if sparse_fieldsets:
+            # field sets are given with the names of the dumped keys
+            self._fieldset_names = {
+                field.data_key or name: name
+                for name, field in self.object_schema.dump_fields.items()
+            }
+            self._fieldset_schemas = LRUCache(max_size=self.fieldsets_cache_size)
+
+    def make_list_schema(self, object_schema_cls):
+        """Create the list schema, dumping the hits with the given schema."""
+        if not self.list_schema_cls:
+            return None
+
+        list_schema_kwargs = {}
+        if self.schema_context:
+            list_schema_kwargs["context"] = self.schema_context
+        if (
+            self.compile_schemas
+            or self.dump_cache is not None
+            or self.dump_executor is not None
+        ):
+            list_schema_kwargs["dumper_factory"] = self.make_dumper
+        return self.list_schema_cls(
+            object_schema_cls=object_schema_cls,
+            **list_schema_kwargs,
+        )
+
+    def get_fieldset(self):
+        """Get the names of the fields requested in the query string.
+
+        :returns: A frozenset of field names, or ``None`` for all the fields.
+        """
+        if not self.sparse_fieldsets or not has_request_context():
+            return None
+        values = request.args.getlist(self.sparse_fieldsets)
+        if not values:
+            return None
+        names = self._fieldset_names
+        fieldset = frozenset(
+            names[key]
+            for value in values
+            for key in (key.strip() for key in value.split(","))
+            if key in names
+        )
+        if not fieldset or len(fieldset) == len(names):
+            return None
+        return fieldset
+
+    def get_schemas(self):
+        """Get the object schema, its dumper and the list schema of the request.
+
+        With sparse fieldsets, the schemas only dump the requested fields, and
+        are cached per field set.
+        """
+        fieldset = self.get_fieldset()
+        if fieldset is None:
+            return self.object_schema, self.object_dumper, self.list_schema
+
+        schemas = self._fieldset_schemas.get(fieldset)
+        if schemas is None:
+            schemas = self.make_fieldset_schemas(fieldset)
+            self._fieldset_schemas.set(fieldset, schemas)
+        return schemas
+
+    def make_fieldset_schemas(self, fieldset):
+        """Create the schemas dumping only the fields of a field set."""
+        object_schema_cls = partial(self.object_schema_cls, only=sorted(fieldset))
+        kwargs = dict(self.schema_kwargs)
+        kwargs.pop("only", None)
+        if self.schema_context:
+            kwargs["context"] = self.schema_context
+        object_schema = object_schema_cls(**kwargs)
+        return (
+            object_schema,
+            self.make_dumper(object_schema),
+            self.make_list_schema(object_schema_cls),
+        )
+
+    def make_dumper(self, schema):
+        """Create the dumper used to dump objects with the given schema."""
+        if self.compile_schemas:
+            dumper = CompiledSchemaDumper(schema)
         else:
-            self.list_schema = None
+            dumper = SchemaDumper(schema)
+        if self.dump_executor is not None:
+            dumper = ParallelDumper(dumper, self.dump_executor)
+        if self.dump_cache is not None:
+            dumper = CachingDumper(
+                dumper, self.dump_cache, self.dump_cache_key, self.dump_cache_tags
+            )
+        return dumper
 
     def dump_obj(self, obj):
         """Dump the object using object schema class."""
-        return self.object_schema.dump(obj)
+        if isinstance(obj, RawJSON):
+            return obj
+        _, object_dumper, _ = self.get_schemas()
+        return object_dumper.dump(obj)
 
     def dump_list(self, obj_list):
         """Dump the list of objects."""
-        if not self.list_schema:
-            return self.object_schema.dump(obj_list, many=True)
+        object_schema, _, list_schema = self.get_schemas()
+        if not list_schema:
+            return object_schema.dump(obj_list, many=True)
+
+        return list_schema.dump(obj_list)
 
-        return self.list_schema.dump(obj_list)
+    def dump_list_lazy(self, obj_list):
+        """Dump the list of objects, deferring the dump of the hits.
+
+        Only list schemas providing ``dump_lazy()`` (e.g. ``BaseListSchema``)
+        defer the dump of the individual hits until they are iterated over.
+        """
+        _, _, list_schema = self.get_schemas()
+        dump_lazy = getattr(list_schema, "dump_lazy", None)
+        if dump_lazy is None:
+            return self.dump_list(obj_list)
+        return dump_lazy(obj_list)
 
     def serialize_object(self, obj):
         """Dump the object using the serializer."""
@@ -93,6 +275,28 @@ class MarshmallowSerializer(BaseSerializer):
         """Dump the object list using the serializer."""
         return self.format_serializer.serialize_object_list(self.dump_list(obj_list))
 
+    def stream_object_list(self, obj_list):
+        """Dump the object list lazily into an iterator of chunks."""
+        return self.format_serializer.stream_object_list(self.dump_list_lazy(obj_list))
+
+    def serialize_object_into(self, obj, buffer):
+        """Dump the object using the serializer, writing bytes into a buffer."""
+        write = getattr(self.format_serializer, "serialize_object_into", None)
+        if write is None or is_overridden(
+            self, "serialize_object", MarshmallowSerializer
+        ):
+            return super().serialize_object_into(obj, buffer)
+        write(self.dump_obj(obj), buffer)
+
+    def serialize_object_list_into(self, obj_list, buffer):
+        """Dump the object list using the serializer, writing bytes into a buffer."""
+        write = getattr(self.format_serializer, "serialize_object_list_into", None)
+        if write is None or is_overridden(
+            self, "serialize_object_list", MarshmallowSerializer
+        ):
+            return super().serialize_object_list_into(obj_list, buffer)
+        write(self.dump_list(obj_list), buffer)
+
 
 class DumperMixin:
     """Abstract class that defines an interface for pre_dump and post_dump methods.
@@ -4,8 +4,14 @@
 """CSV serializer."""
 
 import csv
+import json
+from tempfile import SpooledTemporaryFile
 
-from .base import BaseSerializer
+from speaklater import is_lazy_string
+
+from .base import BaseSerializer, is_overridden
+from .fragments import RawJSON
+from .json import force_lazy_string
 
 
 class Line(object):
@@ -27,10 +33,14 @@ class Line(object):
 class CSVSerializer(BaseSerializer):
     """CSV serializer for records.
 
-    Note: This serializer is not suitable for serializing large number of
-    records.
+    Note: ``serialize_object_list()`` builds the whole CSV in memory, use
+    ``stream_object_list()`` (e.g. via ``ResponseHandler(stream=True)``) for
+    large number of records.
     """
 
+    #: Maximum number of cached entries of the flatten plan.
+    plan_max_size = 100000
+
     def __init__(self, *args, **kwargs):
         """Initialize CSVSerializer.
 
@@ -42,9 +52,16 @@ class CSVSerializer(BaseSerializer):
                                  nested dictionary keys
         :param collapse_lists: prevent lists being expanded into many columns
                                and instead newline seperated fields
+        :param csv_headers: list of the columns of the output, known in
+                            advance. Fields not in the list are left out.
+        :param spool_max_size: size in bytes of the records kept in memory
+                               when streaming records without known headers,
+                               before spooling them to a temporary file
         """
         self.csv_excluded_fields = kwargs.pop("csv_excluded_fields", [])
         self.csv_included_fields = kwargs.pop("csv_included_fields", [])
+        self.csv_headers = kwargs.pop("csv_headers", [])
+        self.spool_max_size = kwargs.pop("spool_max_size", 10 * 1024 * 1024)
 
         if self.csv_excluded_fields and self.csv_included_fields:
             raise ValueError("Please provide only fields to either include or exclude")
@@ -53,6 +70,11 @@ class CSVSerializer(BaseSerializer):
 
         self.collapse_lists = kwargs.pop("collapse_lists", False)
 
+        # Compiled field matching and flatten plan. See ``_plan_key()``.
+        self._excluded = frozenset(self.csv_excluded_fields)
+        self._included = {}
+        self._plan = {}
+
     def serialize_object(self, obj):
         """Serialize a single record and persistent identifier.
 
@@ -69,66 +91,139 @@ class CSVSerializer(BaseSerializer):
         records = [self.process_dict(obj) for obj in obj_list["hits"]["hits"]]
         return self._format_csv(records)
 
+    def serialize_object_list_into(self, obj_list, buffer):
+        """Dump the object list into a buffer, line by line."""
+        if is_overridden(self, "serialize_object_list", CSVSerializer):
+            return super().serialize_object_list_into(obj_list, buffer)
+        records = [self.process_dict(obj) for obj in obj_list["hits"]["hits"]]
+        for line in self._iter_csv(self._headers(records), records):
+            buffer.write(line.encode("utf-8"))
+
+    def stream_object_list(self, obj_list):
+        """Dump the object list into an iterator of csv lines.
+
+        If the headers are known in advance (``csv_headers`` or
+        ``csv_included_fields``), the records are written in a single pass.
+        Otherwise, the flattened records are first spooled to a temporary file
+        (kept in memory up to ``spool_max_size`` bytes) to collect the headers.
+        """
+        records = (self.process_dict(obj) for obj in obj_list["hits"]["hits"])
+        headers = self.csv_headers or self.csv_included_fields
+        if headers:
+            return self._iter_csv(headers, records)
+        return self._iter_spooled_csv(records)
+
     def process_dict(self, dictionary):
         """Transform record dict with nested keys to a flat dict."""
+        if isinstance(dictionary, RawJSON):
+            dictionary = dictionary.loads()
         return self._flatten(dictionary)
 
     def _format_csv(self, records):
         """Return the list of records as a CSV string."""
-        # build a unique list of all records keys as CSV headers
-        if self.csv_included_fields:
-            headers = self.csv_included_fields
-        else:
+        return "".join(self._iter_csv(self._headers(records), records))
+
+    def _headers(self, records):
+        """Build a unique list of all records keys as CSV headers."""
+        headers = self.csv_headers or self.csv_included_fields
+        if not headers:
             headers = set()
             for rec in records:
                 headers.update(rec.keys())
             headers = sorted(headers)
+        return headers
 
-        # write the CSV output in memory
+    def _iter_csv(self, headers, records):
+        """Write the records as CSV lines, starting with the headers."""
         line = Line()
-        writer = csv.DictWriter(line, fieldnames=headers)
+        writer = csv.DictWriter(
+            line,
+            fieldnames=headers,
+            extrasaction="ignore" if self.csv_headers else "raise",
+        )
         writer.writeheader()
-        result = line.read()
+        yield line.read()
 
         for record in records:
             writer.writerow(record)
-            result += line.read()
-
-        return result
+            yield line.read()
+
+    def _iter_spooled_csv(self, records):
+        """Write the records as CSV lines, collecting the headers first."""
+        headers = set()
+        with SpooledTemporaryFile(
+            max_size=self.spool_max_size, mode="w+", encoding="utf-8"
+        ) as spool:
+            for record in records:
+                headers.update(record.keys())
+                # values are stored as the csv writer would write them
+                spool.write(
+                    json.dumps(
+                        {k: "" if v is None else str(v) for k, v in record.items()}
+                    )
+                )
+                spool.write("\n")
+
+            spool.seek(0)
+            yield from self._iter_csv(
+                sorted(headers), (json.loads(line) for line in spool)
+            )
 
     def _flatten(self, value, parent_key=""):
         """Flattens nested dict recursively, skipping excluded fields."""
-        items = []
-        sep = self.header_separator if parent_key else ""
+        items = {}
+        self._flatten_into(items, value, parent_key)
+        return items
 
+    def _flatten_into(self, items, value, parent_key):
+        """Flattens a value into the items dict, following the flatten plan."""
         if isinstance(value, dict):
             for k, v in value.items():
                 # for dict, build a key field_subfield, e.g. title_subtitle
-                new_key = parent_key + sep + k
-                if self.is_field_included(new_key):
-                    items.extend(self._flatten(v, new_key).items())
+                new_key = self._plan_key(parent_key, k)
+                if new_key is not None:
+                    self._flatten_into(items, v, new_key)
         elif isinstance(value, list):
             if not self.collapse_lists:
                 for index, item in enumerate(value):
                     # for lists, build a key with an index, e.g. title_0_subtitle
-                    new_key = parent_key + sep + str(index)
-                    if self.is_field_included(new_key):
-                        items.extend(self._flatten(item, new_key).items())
+                    new_key = self._plan_key(parent_key, index)
+                    if new_key is not None:
+                        self._flatten_into(items, item, new_key)
             else:
                 # for collapsed lists do not include index, e.g. title_subtitle
-                new_key = parent_key
-                if self.is_field_included(new_key):
+                if self.is_field_included(parent_key):
                     if all([isinstance(v, str) for v in value]):
-                        values = "\n".join(value)
-                        items.append((new_key, values))
+                        items[parent_key] = "\n".join(value)
                     else:
-                        items.extend(self._flatten_list_dict(value, new_key).items())
+                        items.update(self._flatten_list_dict(value, parent_key))
+
+        elif self.is_field_included(parent_key):
+            if is_lazy_string(value):
+                value = force_lazy_string(value)
+            items[parent_key] = value
 
-        else:
-            if self.is_field_included(parent_key):
-                items.append((parent_key, value))
+    def _plan_key(self, parent_key, k):
+        """Get the flattened key of a child, or ``None`` if it is excluded.
 
-        return dict(items)
+        The keys are computed for the first record and cached in the flatten
+        plan, so records with the same shape do not have to build and check
+        them again.
+        """
+        try:
+            return self._plan[(parent_key, k)]
+        except KeyError:
+            pass
+
+        sep = self.header_separator if parent_key else ""
+        new_key = parent_key + sep + (k if isinstance(k, str) else str(k))
+        if not self.is_field_included(new_key):
+            new_key = None
+
+        if len(self._plan) >= self.plan_max_size:
+            self._plan.clear()
+        self._plan[(parent_key, k)] = new_key
+        return new_key
 
     def _flatten_list_dict(self, value, parent_key=""):
         combined_dict = {}
@@ -209,12 +304,17 @@ class CSVSerializer(BaseSerializer):
 
     def is_field_included(self, key):
         """Determines if a key should be included or not."""
-        if key in self.csv_excluded_fields:
-            return False
-        if self.csv_included_fields and not self.key_in_field(
-            key, self.csv_included_fields
-        ):
+        if key in self._excluded:
             return False
+        if self.csv_included_fields:
+            try:
+                return self._included[key]
+            except KeyError:
+                included = self.key_in_field(key, self.csv_included_fields)
+                if len(self._included) >= self.plan_max_size:
+                    self._included.clear()
+                self._included[key] = included
+                return included
         return True
 
     def key_in_field(self, key, fields):
@@ -0,0 +1,390 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Dumpers used by the Marshmallow serializer to dump objects with a schema.
+
+A dumper wraps a schema instance and provides ``dump(obj)`` and
+``dump_many(objs)``. The ``CompiledSchemaDumper`` inspects the declared fields
+of a schema once, and builds a specialized dump function for simple field
+types. Anything it does not understand is left to Marshmallow. The
+``CachingDumper`` keeps the dumped objects in a cache (e.g.
+``flask_resources.cache.LRUCache``), keyed by e.g. their id and revision.
+The ``ParallelDumper`` dumps lists of objects in chunks on an executor.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+
+from flask import g, has_app_context
+from marshmallow import Schema, fields, missing
+from marshmallow.decorators import POST_DUMP, PRE_DUMP
+from marshmallow.utils import ensure_text_type, get_value
+
+from ..cache import approx_sizeof
+
+
+class SchemaDumper:
+    """Dump objects with a Marshmallow schema."""
+
+    def __init__(self, schema):
+        """Constructor."""
+        self.schema = schema
+
+    def dump(self, obj):
+        """Dump one object."""
+        return self.schema.dump(obj)
+
+    def dump_many(self, objs):
+        """Dump a list of objects, each one on its own."""
+        return [self.dump(obj) for obj in objs]
+
+
+class CompiledSchemaDumper(SchemaDumper):
+    """Dump objects with a function compiled from the schema.
+
+    Falls back to the schema's ``dump()`` if the schema cannot be compiled.
+    """
+
+    def __init__(self, schema):
+        """Constructor."""
+        super().__init__(schema)
+        self.compiled = compile_dumper(schema)
+        self.dump = self.compiled or schema.dump
+
+
+def record_cache_key(obj):
+    """Cache key of a record, made of its ``id`` and ``revision_id``.
+
+    Returns ``None`` (i.e. do not cache) if the object has no id or revision.
+    """
+    id_ = get_value(obj, "id", None)
+    revision_id = get_value(obj, "revision_id", None)
+    if id_ is None or revision_id is None:
+        return None
+    return (id_, revision_id)
+
+
+def copy_dump(value):
+    """Copy the dicts and lists of dumped data."""
+    if isinstance(value, dict):
+        return value.__class__((key, copy_dump(v)) for key, v in value.items())
+    if isinstance(value, list):
+        return [copy_dump(v) for v in value]
+    return value
+
+
+class CachingDumper(SchemaDumper):
+    """Dump objects through a cache of already dumped objects.
+
+    The cache key is made of the schema class, its dumped fields, its context
+    and the key returned by ``key_func`` for the object. Objects for which
+    ``key_func`` returns ``None``, or dumped with a context which is not
+    hashable, are not cached. The dumps are copied in and out of the cache, so
+    that modifying a dump (e.g. in a post-processing step) does not modify
+    the cached one.
+    """
+
+    def __init__(self, dumper, cache, key_func=record_cache_key, tags_func=None):
+        """Constructor.
+
+        :param dumper: The dumper used for the objects not in the cache.
+        :param cache: The cache (e.g. ``flask_resources.cache.LRUCache``).
+        :param key_func: Callable returning the cache key of an object.
+        :param tags_func: Callable returning the cache tags of an object (see
+            ``flask_resources.cache.invalidate_tags()``).
+        """
+        super().__init__(dumper.schema)
+        self.dumper = dumper
+        self.cache = cache
+        self.key_func = key_func
+        self.tags_func = tags_func
+        self.namespace = (type(self.schema), tuple(self.schema.dump_fields))
+
+    def context_key(self):
+        """Get the part of the cache keys for the schema context, or ``None``."""
+        context = self.schema.context
+        if not context:
+            return ()
+        try:
+            return frozenset(context.items())
+        except TypeError:
+            return None
+
+    def cache_key(self, obj, context_key=()):
+        """Get the cache key of an object, or ``None``."""
+        if context_key is None:
+            return None
+        key = self.key_func(obj)
+        return None if key is None else (self.namespace, context_key, key)
+
+    def cache_get(self, key):
+        """Get a copy of the stored dump of an object, or ``missing``."""
+        result = self.cache.get(key, missing)
+        return result if result is missing else copy_dump(result)
+
+    def cache_set(self, key, obj, result):
+        """Store a copy of the dump of an object."""
+        tags = self.tags_func(obj) if self.tags_func else ()
+        self.cache.set(key, copy_dump(result), tags=tags)
+
+    def dump(self, obj):
+        """Dump one object, using the cache."""
+        key = self.cache_key(obj, self.context_key())
+        if key is None:
+            return self.dumper.dump(obj)
+        result = self.cache_get(key)
+        if result is missing:
+            result = self.dumper.dump(obj)
+            self.cache_set(key, obj, result)
+        return result
+
+    def dump_many(self, objs):
+        """Dump a list of objects, dumping only the ones not in the cache."""
+        context_key = self.context_key()
+        keys = [self.cache_key(obj, context_key) for obj in objs]
+        results = [missing if key is None else self.cache_get(key) for key in keys]
+        misses = [i for i, result in enumerate(results) if result is missing]
+        if misses:
+            dumped = self.dumper.dump_many([objs[i] for i in misses])
+            for i, result in zip(misses, dumped):
+                results[i] = result
+                if keys[i] is not None:
+                    self.cache_set(keys[i], objs[i], result)
+        return results
+
+
+class ParallelDumper(SchemaDumper):
+    """Dump lists of objects in chunks on a ``concurrent.futures`` executor.
+
+    The dumped objects keep the order of the list, and the first error raised
+    while dumping (e.g. by a ``DumperMixin``) is raised again, after
+    cancelling the chunks which have not started yet. The chunk size adapts to
+    the size of the dumped objects, so that a chunk holds about
+    ``chunk_bytes`` of dumped data. The size is estimated from the dump of the
+    first object, which is dumped in the calling thread.
+
+    On a ``ThreadPoolExecutor``, the chunks are dumped in a copy of the context
+    variables of the caller (and so of its Flask contexts, which are not pushed
+    again), within its resource request context. On a ``ProcessPoolExecutor``, the dumper (i.e. the schema)
+    and the objects must be picklable, so compiled dumpers cannot be used.
+    """
+
+    def __init__(self, dumper, executor, chunk_bytes=512 * 1024, min_chunk_size=16):
+        """Constructor.
+
+        :param dumper: The dumper used to dump each chunk.
+        :param executor: A ``concurrent.futures.Executor``.
+        :param chunk_bytes: Approximate size of the dumped objects of a chunk.
+        :param min_chunk_size: Minimum number of objects in a chunk.
+        """
+        super().__init__(dumper.schema)
+        self.dumper = dumper
+        self.executor = executor
+        self.chunk_bytes = chunk_bytes
+        self.min_chunk_size = min_chunk_size
+
+    def dump(self, obj):
+        """Dump one object."""
+        return self.dumper.dump(obj)
+
+    def chunk_size(self, dumped):
+        """Number of objects per chunk, estimated from a dumped object.
+
+        Dumped objects are made of dicts and lists, of which
+        ``approx_sizeof()`` measures the whole content.
+        """
+        return max(self.min_chunk_size, self.chunk_bytes // approx_sizeof(dumped))
+
+    def dump_many(self, objs):
+        """Dump a list of objects, chunk by chunk in parallel."""
+        objs = list(objs)
+        if len(objs) <= self.min_chunk_size:
+            return self.dumper.dump_many(objs)
+
+        results = [self.dumper.dump(objs[0])]
+        size = self.chunk_size(results[0])
+        objs = objs[1:]
+        if len(objs) <= size:
+            return results + self.dumper.dump_many(objs)
+
+        func = self.dumper.dump_many
+        thread_pool = isinstance(self.executor, ThreadPoolExecutor)
+        if thread_pool and has_app_context():
+            resource_ctx = g.get("resource_requestctx")
+            if resource_ctx is not None:
+                func = partial(_dump_in_context, resource_ctx, func)
+        futures = []
+        for i in range(0, len(objs), size):
+            if thread_pool:
+                # a context can only be entered by one thread at a time
+                future = self.executor.submit(
+                    copy_context().run, func, objs[i : i + size]
+                )
+            else:
+                future = self.executor.submit(func, objs[i : i + size])
+            futures.append(future)
+
+        try:
+            for future in futures:
+                results.extend(future.result())
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return results
+
+
+def _dump_in_context(resource_ctx, dump_many, objs):
+    """Dump objects in a resource request context."""
+    with resource_ctx.reenter():
+        return dump_many(objs)
+
+
+# Keys which Marshmallow would look up as attributes of a dict.
+_DICT_ATTRIBUTES = frozenset(dir(dict))
+
+
+def compile_dumper(schema):
+    """Compile a dump function for a schema instance.
+
+    Only schemas without pre/post-dump hooks and without custom dump methods
+    are compiled. Fields of type ``String``, ``Integer``, ``Boolean``,
+    ``DateTime``, ``Date``, ``Nested`` and ``List`` (of those) are converted
+    directly, any other field is serialized by the field itself.
+
+    :returns: The dump function, or ``None`` if the schema cannot be compiled.
+    """
+    if schema.many:
+        return None
+    return _compile_schema(schema, ())
+
+
+def _compile_schema(schema, stack):
+    cls = type(schema)
+    if (
+        cls in stack
+        or schema._hooks[PRE_DUMP]
+        or schema._hooks[POST_DUMP]
+        or cls.dump is not Schema.dump
+        or cls._serialize is not Schema._serialize
+        or cls.get_attribute is not Schema.get_attribute
+    ):
+        return None
+
+    stack = stack + (cls,)
+    dict_class = schema.dict_class
+    plan = []
+    for attr_name, field in schema.dump_fields.items():
+        key = field.data_key if field.data_key is not None else attr_name
+        plan.append((key, _compile_field(attr_name, field, schema, stack)))
+
+    def dump(obj):
+        ret = dict_class()
+        for key, serialize in plan:
+            value = serialize(obj)
+            if value is not missing:
+                ret[key] = value
+        return ret
+
+    return dump
+
+
+def _compile_field(attr_name, field, schema, stack):
+    """Compile the serialization of a field (see ``Field.serialize()``)."""
+    convert = _compile_converter(field, stack)
+    check_key = attr_name if field.attribute is None else field.attribute
+    if convert is None or "." in check_key or check_key in _DICT_ATTRIBUTES:
+        return partial(field.serialize, attr_name, accessor=schema.get_attribute)
+
+    default = field.dump_default
+    default_is_callable = callable(default)
+
+    def serialize(obj):
+        if type(obj) is dict:
+            value = obj.get(check_key, missing)
+        else:
+            value = get_value(obj, check_key, missing)
+        if value is missing:
+            value = default() if default_is_callable else default
+            if value is missing:
+                return missing
+        return convert(value)
+
+    return serialize
+
+
+def _compile_converter(field, stack):
+    """Compile the conversion of a value (see ``Field._serialize()``)."""
+    field_type = type(field)
+
+    if field_type is fields.String:
+
+        def convert(value):
+            if value is None or type(value) is str:
+                return value
+            return ensure_text_type(value)
+
+    elif field_type is fields.Integer:
+        as_string = field.as_string
+
+        def convert(value):
+            if value is None:
+                return None
+            return str(int(value)) if as_string else int(value)
+
+    elif field_type is fields.Boolean:
+        truthy = field.truthy
+        falsy = field.falsy
+
+        def convert(value):
+            if value is None:
+                return None
+            try:
+                if value in truthy:
+                    return True
+                if value in falsy:
+                    return False
+            except TypeError:
+                pass
+            return bool(value)
+
+    elif field_type in (fields.DateTime, fields.Date):
+        data_format = field.format or field.DEFAULT_FORMAT
+        format_func = field.SERIALIZATION_FUNCS.get(data_format)
+
+        def convert(value):
+            if value is None:
+                return None
+            if format_func:
+                return format_func(value)
+            return value.strftime(data_format)
+
+    elif field_type is fields.Nested:
+        nested_schema = field.schema
+        many = nested_schema.many or field.many
+        dump = _compile_schema(nested_schema, stack)
+        if dump is None:
+            return None
+
+        def convert(value):
+            if value is None:
+                return None
+            if many:
+                return [dump(each) for each in value]
+            return dump(value)
+
+    elif field_type is fields.List:
+        convert_inner = _compile_converter(field.inner, stack)
+        if convert_inner is None:
+            return None
+
+        def convert(value):
+            if value is None:
+                return None
+            return [convert_inner(each) for each in value]
+
+    else:
+        return None
+
+    return convert
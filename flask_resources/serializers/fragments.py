@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Pre-serialized JSON fragments."""
+
+import json
+
+
+class RawJSON:
+    """An already serialized JSON value, written verbatim by the JSON serializer.
+
+    E.g. the ``_source`` of a search hit as returned by the search backend.
+    Hits given as ``RawJSON`` are not dumped by ``BaseListSchema``, so they
+    must already be in their final form.
+
+    .. code-block:: python
+
+        hits = [RawJSON(hit["_source"]) for hit in results]
+    """
+
+    __slots__ = ("json",)
+
+    def __init__(self, data):
+        """Constructor.
+
+        :param data: The JSON document, as ``str`` or UTF-8 encoded ``bytes``.
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data).decode("utf-8")
+        self.json = data
+
+    def loads(self):
+        """Parse the JSON document."""
+        return json.loads(self.json)
+
+    def __eq__(self, other):
+        """Compare the JSON documents."""
+        return isinstance(other, RawJSON) and other.json == self.json
+
+    def __hash__(self):
+        """Hash of the JSON document."""
+        return hash(self.json)
+
+    def __repr__(self):
+        """Representation of the fragment."""
+        return f"RawJSON({self.json!r})"
@@ -4,14 +4,26 @@
 
 """JSON serializer."""
 
+import decimal
 import json
+import re
+import secrets
+import threading
+import uuid
 import warnings
+from collections.abc import Iterator
+from datetime import date
+from functools import partial
+from itertools import islice
 
 from flask import request
 from flask.json.provider import _default
-from speaklater import is_lazy_string
+from speaklater import _LazyString
+from werkzeug.http import http_date
 
-from .base import BaseSerializer, MarshmallowSerializer
+from ..context import json_codec, lazy_strings_cache
+from .base import BaseSerializer, MarshmallowSerializer, is_overridden
+from .fragments import RawJSON
 
 
 def flask_request_options():
@@ -24,26 +36,237 @@ def flask_request_options():
     return {}
 
 
+class JSONTypeRegistry:
+    """Converters of the types JSON does not support, looked up by type.
+
+    A converter is looked up by the exact type of the object, then by the
+    classes of its MRO. The result of the lookup is cached per type, so
+    converting e.g. a date costs a single dict lookup. Types without a
+    converter go to the ``fallback``.
+    """
+
+    def __init__(self, fallback=_default):
+        """Constructor.
+
+        :param fallback: Converter of the objects of any other type.
+        """
+        self.fallback = fallback
+        self._converters = {}
+        self._resolved = {}
+
+    def register(self, type_, converter):
+        """Register the converter of a type (and its subclasses)."""
+        self._converters[type_] = converter
+        self._resolved = {}
+
+    def resolve(self, type_):
+        """Get the converter of a type."""
+        converter = self._resolved.get(type_)
+        if converter is None:
+            converter = next(
+                (
+                    self._converters[base]
+                    for base in type_.__mro__
+                    if base in self._converters
+                ),
+                self.fallback,
+            )
+            self._resolved[type_] = converter
+        return converter
+
+    def __call__(self, obj):
+        """Convert an object."""
+        return self.resolve(type(obj))(obj)
+
+
+def force_lazy_string(obj):
+    """Translate a lazy translation string.
+
+    If ``ResourceConfig.cache_lazy_strings`` is enabled, each distinct lazy
+    string (i.e. function and arguments, e.g. a gettext call with its message
+    id) is only translated once per request, as the locale does not change
+    during a request.
+    """
+    cache = lazy_strings_cache.get()
+    if cache is None:
+        return str(obj)
+    try:
+        if obj._kwargs:
+            key = (obj._func, obj._args, tuple(sorted(obj._kwargs.items())))
+        else:
+            key = (obj._func, obj._args)
+        value = cache.get(key)
+    except TypeError:
+        # unhashable arguments
+        return str(obj)
+    if value is None:
+        value = cache[key] = str(obj)
+    return value
+
+
+#: The converters used by ``json_default()``.
+json_types = JSONTypeRegistry()
+# the conversions of Flask's JSON provider, dataclasses and objects with
+# ``__html__`` are left to its fallback
+json_types.register(date, http_date)
+json_types.register(decimal.Decimal, str)
+json_types.register(uuid.UUID, str)
+json_types.register(_LazyString, force_lazy_string)
+
+
+def register_json_type(type_, converter):
+    """Register how to convert the objects of a type (and its subclasses).
+
+    .. code-block:: python
+
+        register_json_type(PersistentIdentifier, lambda pid: pid.pid_value)
+    """
+    json_types.register(type_, converter)
+
+
+def json_default(obj):
+    """Convert the objects the JSON codecs do not know how to encode.
+
+    The converters are registered with ``register_json_type()``. Lazy
+    translation strings are translated, and Flask's conversions apply to the
+    other types (e.g. dates, UUIDs, dataclasses). Third-party codecs should
+    use it as their fallback.
+    """
+    return json_types(obj)
+
+
+class _Fragments(list):
+    """The ``RawJSON`` fragments of a document being encoded."""
+
+    nonce = None
+
+
+# Fragments of the document being encoded by the current thread, as encoder
+# instances are shared.
+_local = threading.local()
+
+
 class JSONEncoder(json.JSONEncoder):
     """JSONEncoder for our custom needs.
 
     - Knows to force translate lazy translation strings.
+    - Writes ``RawJSON`` fragments verbatim.
     """
 
+    def encode(self, o):
+        """Encode an object, splicing in the ``RawJSON`` fragments."""
+        previous = getattr(_local, "fragments", None)
+        _local.fragments = fragments = _Fragments()
+        try:
+            result = super().encode(o)
+        finally:
+            _local.fragments = previous
+        if fragments:
+            # the placeholders are strings with control characters, which
+            # are always escaped, and a random nonce
+            pattern = re.compile(r'"\\u0000%s:(\d+)\\u0000"' % fragments.nonce)
+            result = pattern.sub(lambda m: fragments[int(m.group(1))].json, result)
+        return result
+
     def default(self, obj):
         """Override parent's default."""
-        if is_lazy_string(obj):
-            return str(obj)
-        return _default(obj)
+        if isinstance(obj, RawJSON):
+            return self._placeholder(obj)
+        return json_default(obj)
+
+    def _placeholder(self, fragment):
+        fragments = getattr(_local, "fragments", None)
+        if fragments is None:
+            # used through iterencode(), the fragment can only be parsed
+            return fragment.loads()
+        if not fragments:
+            fragments.nonce = secrets.token_hex(8)
+        fragments.append(fragment)
+        return "\x00%s:%d\x00" % (fragments.nonce, len(fragments) - 1)
+
+
+class StdlibJSONCodec:
+    """JSON codec of the standard library.
+
+    A JSON codec provides ``encode(obj, **options)`` returning a ``str`` and
+    ``decode(data)``, where the options are the ones of ``json.dumps()``
+    (e.g. ``indent`` and ``sort_keys``). A faster codec can be plugged in
+    with ``ResourceConfig.json_codec`` or the ``codec`` argument of the JSON
+    serializer and deserializer. It should fall back to ``json_default()``
+    for the objects it does not know.
+
+    The encoder instances are created once per set of options.
+    """
+
+    def __init__(self, encoder_cls=JSONEncoder):
+        """Constructor.
+
+        :param encoder_cls: The ``json.JSONEncoder`` subclass.
+        """
+        self.encoder_cls = encoder_cls
+        self._encoders = {}
+
+    def get_encoder(self, **options):
+        """Get the encoder instance for the given options."""
+        try:
+            key = tuple(sorted(options.items()))
+            encoder = self._encoders.get(key)
+        except TypeError:
+            # unhashable options
+            return self.encoder_cls(**options)
+        if encoder is None:
+            encoder = self._encoders[key] = self.encoder_cls(**options)
+        return encoder
+
+    def encode(self, obj, **options):
+        """Encode an object into a JSON string."""
+        return self.get_encoder(**options).encode(obj)
+
+    def decode(self, data):
+        """Decode a JSON document."""
+        return json.loads(data)
+
+
+#: The codec used when none is configured.
+default_json_codec = StdlibJSONCodec()
+
+
+def current_json_codec():
+    """Get the JSON codec configured on the current resource, or the default one."""
+    codec = json_codec.get()
+    return default_json_codec if codec is None else codec
 
 
 class JSONSerializer(BaseSerializer):
     """JSON serializer implementation."""
 
-    def __init__(self, encoder=None, options=None):
-        """Initialize the JSONSerializer."""
+    #: Number of hits encoded together when streaming.
+    batch_size = 100
+
+    def __init__(self, encoder=None, options=None, codec=None):
+        """Initialize the JSONSerializer.
+
+        :param encoder: The ``json.JSONEncoder`` subclass of the standard
+            library codec.
+        :param options: A dict or a callable returning the encoding options.
+        :param codec: The JSON codec (see ``StdlibJSONCodec``). Defaults to
+            ``ResourceConfig.json_codec``, or the standard library codec.
+        """
         self._options = options or flask_request_options
         self._encoder = encoder or JSONEncoder
+        if codec is None and isinstance(encoder, type):
+            codec = StdlibJSONCodec(encoder)
+        self._codec = codec
+
+    @property
+    def codec(self):
+        """The JSON codec used for serialization."""
+        if self._codec is not None:
+            return self._codec
+        if not isinstance(self._encoder, type):
+            # an encoder factory, called for each serialization
+            return StdlibJSONCodec(self.encoder)
+        return current_json_codec()
 
     @property
     def dumps_options(self):
@@ -62,8 +285,94 @@ class JSONSerializer(BaseSerializer):
 
     def serialize_object(self, obj):
         """Dump the object into a json string."""
-        return json.dumps(obj, cls=self.encoder, **self.dumps_options)
+        return self.codec.encode(obj, **self.dumps_options)
 
     def serialize_object_list(self, obj_list):
         """Dump the object list into a json string."""
-        return json.dumps(obj_list, cls=self.encoder, **self.dumps_options)
+        return self.codec.encode(obj_list, **self.dumps_options)
+
+    def stream_object_list(self, obj_list):
+        """Dump the object list into an iterator of json string chunks.
+
+        The envelope is written piece by piece and the hits are encoded in
+        batches of ``batch_size``, so the complete document is never built in
+        memory. The hits may
+        be given as a lazy iterator (see ``BaseListSchema.dump_lazy()``), and
+        ``RawJSON`` hits are written as is.
+        """
+        options = self.dumps_options
+        encode = partial(self.codec.encode, **options)
+        if options.get("indent") is not None:
+            # pretty printed output is for humans, keep its exact layout
+            return iter([encode(_materialize(obj_list))])
+        item_separator, key_separator = options.get("separators") or (", ", ": ")
+        return self._iterencode(
+            obj_list,
+            encode,
+            item_separator,
+            key_separator,
+            options.get("sort_keys", False),
+        )
+
+    def serialize_object_list_into(self, obj_list, buffer):
+        """Dump the object list into a buffer, batch of hits by batch of hits.
+
+        The hits are encoded and written in batches (see
+        ``stream_object_list()``), instead of building the whole document as
+        a string first.
+        """
+        if is_overridden(self, "serialize_object_list", JSONSerializer):
+            return super().serialize_object_list_into(obj_list, buffer)
+        for chunk in self.stream_object_list(obj_list):
+            buffer.write(chunk.encode("utf-8"))
+
+    def _iterencode(self, obj, encode, item_separator, key_separator, sort_keys):
+        """Encode an object, streaming its hits."""
+        if isinstance(obj, dict):
+            if not all(isinstance(key, str) for key in obj):
+                yield encode(_materialize(obj))
+                return
+            items = sorted(obj.items()) if sort_keys else obj.items()
+            separator = "{"
+            for key, value in items:
+                yield separator + encode(key) + key_separator
+                if key == "hits":
+                    yield from self._iterencode(
+                        value, encode, item_separator, key_separator, sort_keys
+                    )
+                else:
+                    yield encode(value)
+                separator = item_separator
+            yield "}" if separator != "{" else "{}"
+        elif isinstance(obj, (list, tuple, Iterator)):
+            separator = "["
+            items = iter(obj)
+            while True:
+                batch = list(islice(items, self.batch_size))
+                if not batch:
+                    break
+                if any(isinstance(item, RawJSON) for item in batch):
+                    for item in batch:
+                        if isinstance(item, RawJSON):
+                            yield separator + item.json
+                        else:
+                            yield separator + encode(item)
+                        separator = item_separator
+                else:
+                    # a single call to the codec per batch, without the brackets
+                    yield separator + encode(batch)[1:-1]
+                    separator = item_separator
+            yield "]" if separator != "[" else "[]"
+        elif isinstance(obj, RawJSON):
+            yield obj.json
+        else:
+            yield encode(obj)
+
+
+def _materialize(obj):
+    """Turn lazy hits into lists, so the object can be encoded in one go."""
+    if isinstance(obj, dict) and "hits" in obj:
+        return dict(obj, hits=_materialize(obj["hits"]))
+    elif isinstance(obj, Iterator):
+        return list(obj)
+    return obj
@@ -3,7 +3,7 @@
 
 """Simple serializer."""
 
-from .base import BaseSerializer
+from .base import BaseSerializer, is_overridden
 
 
 class SimpleSerializer(BaseSerializer):
@@ -24,3 +24,17 @@ class SimpleSerializer(BaseSerializer):
         return "\n".join(
             [self.serialize_object(obj, **kwargs) for obj in obj_list["hits"]["hits"]]
         )
+
+    def stream_object_list(self, obj_list, **kwargs):
+        """Dump the object list into an iterator of lines."""
+        separator = ""
+        for obj in obj_list["hits"]["hits"]:
+            yield separator + self.serialize_object(obj, **kwargs)
+            separator = "\n"
+
+    def serialize_object_list_into(self, obj_list, buffer, **kwargs):
+        """Dump the object list into a buffer, separated by new lines."""
+        if is_overridden(self, "serialize_object_list", SimpleSerializer):
+            return super().serialize_object_list_into(obj_list, buffer)
+        for chunk in self.stream_object_list(obj_list, **kwargs):
+            buffer.write(chunk.encode("utf-8"))
@@ -0,0 +1,428 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Cache shared by the processes of a host, in a memory-mapped file.
+
+The ``SharedMemoryCache`` has the same interface as the in-process
+``flask_resources.cache.LRUCache``, so that e.g. all the workers of a gunicorn
+server share a single response cache:
+
+.. code-block:: python
+
+    class Config(ResourceConfig):
+        response_cache = SharedMemoryCache(
+            "/dev/shm/records-responses", secret_key=SECRET_KEY
+        )
+
+The file is divided into fixed-size slots, grouped into sets of ``ways``
+slots. A key can only be stored in one set, in which the least recently used
+slot is evicted. Reads take no lock (a sequence number in each slot detects
+concurrent writes), writes lock the set of the key. Values are pickled, and
+values bigger than a slot are not cached.
+
+Each entry is signed with a key derived from ``secret_key``, and entries with
+an invalid signature are never unpickled, so that a process which can write
+the file (but does not know the secret key) cannot run code in the
+application. Only available on Unix.
+"""
+
+import fcntl
+import hmac
+import mmap
+import os
+import pickle
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from hashlib import blake2b
+from uuid import UUID
+
+from .cache import register_cache
+
+_MAGIC = b"FRSHMC02"
+# magic, number of slots, slot size, ways, max number of tags
+_HEADER = struct.Struct("<8sIIII")
+_HEADER_SIZE = 64
+# sequence number, last used time, key hash, value length, number of tags,
+# signature
+_SLOT = struct.Struct("<Qd16sIH2x32s")
+_SEQ = struct.Struct("<Q")
+_LAST_USED = struct.Struct("<d")
+_SIGNED = struct.Struct("<IH")
+_EMPTY_KEY = bytes(16)
+
+
+def _encode_key(key):
+    """Encode a key in bytes which are the same in all processes.
+
+    Unlike ``repr()``, the encoding does not depend on the identity of the
+    objects of the key. Only the types with such an encoding are supported.
+    """
+    if key is None or key is True or key is False:
+        return repr(key).encode()[:1]
+    key_type = type(key)
+    if key_type is str:
+        data = key.encode("utf-8")
+        return b"s%d:%s" % (len(data), data)
+    if key_type is bytes:
+        return b"b%d:%s" % (len(key), key)
+    if key_type is int:
+        return b"i%d;" % key
+    if key_type is float:
+        return b"f%s;" % repr(key).encode()
+    if key_type is UUID:
+        return b"u" + key.bytes
+    if key_type in (tuple, list):
+        return b"(" + b"".join(_encode_key(item) for item in key) + b")"
+    if key_type is frozenset:
+        return b"{" + b"".join(sorted(_encode_key(item) for item in key)) + b"}"
+    if isinstance(key, type):
+        return b"c%s;" % f"{key.__module__}.{key.__qualname__}".encode("utf-8")
+    raise TypeError(f"Unsupported cache key type: {key_type.__name__}.")
+
+
+def _key_hash(key):
+    """Hash of a key, stable across processes, or ``None`` if unsupported."""
+    try:
+        data = _encode_key(key)
+    except TypeError:
+        return None
+    return blake2b(data, digest_size=16).digest()
+
+
+def _tag_hash(tag):
+    return blake2b(str(tag).encode("utf-8"), digest_size=8).digest()
+
+
+class _SharedFile:
+    """Descriptor, memory map and locks of a cache file, shared in a process.
+
+    The ``fcntl`` locks belong to the process: the caches of a process
+    opening the same file do not exclude each other with them, and closing
+    any descriptor of the file releases all of them. The caches of a process
+    therefore share one descriptor, and the thread locks which exclude their
+    threads.
+    """
+
+    def __init__(self, fd, file_id, size, sets):
+        """Constructor."""
+        self.fd = fd
+        self.file_id = file_id
+        self.mm = mmap.mmap(fd, size)
+        self.thread_locks = [threading.Lock() for _ in range(min(sets, 64))]
+        self.refs = 0
+
+
+# Open cache files, keyed by device and inode.
+_files = {}
+_files_lock = threading.Lock()
+
+
+class SharedMemoryCache:
+    """Set-associative cache in a memory-mapped file.
+
+    All the processes opening the same file with the same parameters share
+    the cache. The hit, miss and eviction counters are per process.
+    """
+
+    #: Number of times a read is retried while the slot is being written.
+    read_retries = 8
+
+    def __init__(
+        self,
+        path,
+        secret_key,
+        max_entries=4096,
+        slot_size=16 * 1024,
+        ways=8,
+        max_tags=8,
+    ):
+        """Constructor.
+
+        :param path: Path of the file, preferably on a ``tmpfs`` (e.g.
+            ``/dev/shm``). It is created if it does not exist.
+        :param secret_key: Secret (``str`` or ``bytes``) from which the key
+            signing the entries is derived, the same in all the processes
+            sharing the file (e.g. the ``SECRET_KEY`` of the application).
+        :param max_entries: Number of slots (rounded up to a multiple of ``ways``).
+        :param slot_size: Size of a slot in bytes, including a header.
+        :param ways: Number of slots a key can be stored in.
+        :param max_tags: Maximum number of tags of a value. Values with more
+            tags are not cached.
+        """
+        self.ways = ways
+        self.sets = -(-max_entries // ways)
+        self.slots = self.sets * ways
+        self.slot_size = slot_size
+        self.max_tags = max_tags
+        self.tags_offset = _SLOT.size
+        self.payload_offset = _SLOT.size + 8 * max_tags
+        self.max_size = slot_size - self.payload_offset
+        if self.max_size <= 0:
+            raise ValueError("The slot size is too small for the number of tags.")
+
+        if isinstance(secret_key, str):
+            secret_key = secret_key.encode("utf-8")
+        if not secret_key:
+            raise ValueError("A secret key is required to sign the entries.")
+        self._sign_key = blake2b(
+            secret_key, digest_size=32, person=b"flask-resources"
+        ).digest()
+
+        self.path = path
+        self._shared = self._open(path, _HEADER_SIZE + self.slots * slot_size)
+        self._fd = self._shared.fd
+        self._mm = self._shared.mm
+        self._thread_locks = self._shared.thread_locks
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        register_cache(self)
+
+    def _open(self, path, size):
+        """Open the file, or share the descriptor already open in the process."""
+        with _files_lock:
+            try:
+                stat = os.stat(path)
+                shared = _files.get((stat.st_dev, stat.st_ino))
+            except FileNotFoundError:
+                shared = None
+            if shared is not None:
+                self._check_header(shared.fd)
+            else:
+                fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+                try:
+                    self._init_file(fd, size)
+                except BaseException:
+                    os.close(fd)
+                    raise
+                stat = os.fstat(fd)
+                file_id = (stat.st_dev, stat.st_ino)
+                shared = _files[file_id] = _SharedFile(fd, file_id, size, self.sets)
+            shared.refs += 1
+            return shared
+
+    def _header(self):
+        return _HEADER.pack(
+            _MAGIC, self.slots, self.slot_size, self.ways, self.max_tags
+        )
+
+    def _check_header(self, fd):
+        if os.pread(fd, _HEADER.size, 0) != self._header():
+            raise ValueError(f"{self.path} is a cache file with different parameters.")
+
+    def _init_file(self, fd, size):
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(fd).st_size == 0:
+                os.ftruncate(fd, size)
+                os.pwrite(fd, self._header(), 0)
+            else:
+                self._check_header(fd)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def close(self):
+        """Close the cache, closing the file once no cache of the process uses it."""
+        shared = self._shared
+        if shared is None:
+            return
+        self._shared = None
+        with _files_lock:
+            shared.refs -= 1
+            if shared.refs == 0:
+                del _files[shared.file_id]
+                shared.mm.close()
+                os.close(shared.fd)
+
+    #
+    # Slots
+    #
+    def _set_index(self, key_hash):
+        return int.from_bytes(key_hash[:8], "little") % self.sets
+
+    def _offsets(self, set_index):
+        start = _HEADER_SIZE + set_index * self.ways * self.slot_size
+        return range(start, start + self.ways * self.slot_size, self.slot_size)
+
+    @contextmanager
+    def _locked(self, set_index):
+        """Lock a set against the writers of all the processes."""
+        with self._thread_locks[set_index % len(self._thread_locks)]:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, set_index)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, set_index)
+
+    def _sign(self, key_hash, data, tags):
+        """Signature of an entry, made of its key, tags and value."""
+        signed = key_hash + _SIGNED.pack(len(data), len(tags) // 8) + tags + data
+        return blake2b(signed, digest_size=32, key=self._sign_key).digest()
+
+    def _read(self, offset, key_hash):
+        """Read the value of a slot, or ``None`` if it holds another key.
+
+        Values being written, or with an invalid signature, are not returned.
+        """
+        mm = self._mm
+        for _ in range(self.read_retries):
+            seq, _, slot_key, length, ntags, signature = _SLOT.unpack_from(mm, offset)
+            if slot_key != key_hash:
+                return None
+            if seq & 1:
+                time.sleep(0)
+                continue
+            tags_start = offset + self.tags_offset
+            tags = mm[tags_start : tags_start + 8 * min(ntags, self.max_tags)]
+            start = offset + self.payload_offset
+            data = mm[start : start + min(length, self.max_size)]
+            if _SEQ.unpack_from(mm, offset)[0] == seq:
+                if hmac.compare_digest(signature, self._sign(key_hash, data, tags)):
+                    return data
+                return None
+        return None
+
+    def _write(self, offset, key_hash=_EMPTY_KEY, data=b"", tag_hashes=()):
+        """Write a slot (the set must be locked).
+
+        The sequence number is odd while the slot is written. If a writer
+        crashed while writing the slot, it is already odd and stays so.
+        """
+        mm = self._mm
+        seq = _SEQ.unpack_from(mm, offset)[0] | 1
+        _SEQ.pack_into(mm, offset, seq)
+        tags = b"".join(tag_hashes)
+        _SLOT.pack_into(
+            mm,
+            offset,
+            seq,
+            time.time(),
+            key_hash,
+            len(data),
+            len(tag_hashes),
+            self._sign(key_hash, data, tags),
+        )
+        tags_start = offset + self.tags_offset
+        mm[tags_start : tags_start + len(tags)] = tags
+        start = offset + self.payload_offset
+        mm[start : start + len(data)] = data
+        _SEQ.pack_into(mm, offset, seq + 1)
+
+    def _slot_tags(self, offset):
+        ntags = _SLOT.unpack_from(self._mm, offset)[4]
+        start = offset + self.tags_offset
+        tags = self._mm[start : start + 8 * min(ntags, self.max_tags)]
+        return {tags[i : i + 8] for i in range(0, len(tags), 8)}
+
+    #
+    # Cache interface (keys of unsupported types, see ``_encode_key()``, are
+    # never cached)
+    #
+    def get(self, key, default=None):
+        """Get a value, marking it as recently used."""
+        key_hash = _key_hash(key)
+        if key_hash is None:
+            self.misses += 1
+            return default
+        for offset in self._offsets(self._set_index(key_hash)):
+            data = self._read(offset, key_hash)
+            if data is not None:
+                # racing with a writer only affects the eviction order
+                _LAST_USED.pack_into(self._mm, offset + 8, time.time())
+                self.hits += 1
+                return pickle.loads(data)
+        self.misses += 1
+        return default
+
+    def set(self, key, value, tags=()):
+        """Set a value, evicting the least recently used one of its set.
+
+        :param tags: Tags of the value, for ``invalidate_tags()``.
+        """
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        tag_hashes = sorted({_tag_hash(tag) for tag in tags})
+        if len(data) > self.max_size or len(tag_hashes) > self.max_tags:
+            return
+        key_hash = _key_hash(key)
+        if key_hash is None:
+            return
+        set_index = self._set_index(key_hash)
+        with self._locked(set_index):
+            slots = [
+                (_SLOT.unpack_from(self._mm, offset), offset)
+                for offset in self._offsets(set_index)
+            ]
+            for (_, _, slot_key, _, _, _), offset in slots:
+                if slot_key == key_hash:
+                    break
+            else:
+                for (_, _, slot_key, _, _, _), offset in slots:
+                    if slot_key == _EMPTY_KEY:
+                        break
+                else:
+                    _, offset = min(slots, key=lambda slot: slot[0][1])
+                    self.evictions += 1
+            self._write(offset, key_hash, data, tag_hashes)
+
+    def delete(self, key):
+        """Delete a value."""
+        key_hash = _key_hash(key)
+        if key_hash is None:
+            return
+        set_index = self._set_index(key_hash)
+        with self._locked(set_index):
+            for offset in self._offsets(set_index):
+                if _SLOT.unpack_from(self._mm, offset)[2] == key_hash:
+                    self._write(offset)
+
+    def invalidate_tags(self, tags):
+        """Delete the values with any of the given tags."""
+        tag_hashes = {_tag_hash(tag) for tag in tags}
+        for set_index in range(self.sets):
+            offsets = [
+                offset
+                for offset in self._offsets(set_index)
+                if self._slot_tags(offset) & tag_hashes
+            ]
+            if offsets:
+                with self._locked(set_index):
+                    for offset in offsets:
+                        # check again, the slot may have been overwritten
+                        if self._slot_tags(offset) & tag_hashes:
+                            self._write(offset)
+
+    def clear(self):
+        """Delete all the values."""
+        for set_index in range(self.sets):
+            with self._locked(set_index):
+                for offset in self._offsets(set_index):
+                    if _SLOT.unpack_from(self._mm, offset)[2] != _EMPTY_KEY:
+                        self._write(offset)
+
+    def _used_slots(self):
+        for offset in range(_HEADER_SIZE, len(self._mm), self.slot_size):
+            _, _, slot_key, length, _, _ = _SLOT.unpack_from(self._mm, offset)
+            if slot_key != _EMPTY_KEY:
+                yield length
+
+    def __len__(self):
+        """Number of cached values."""
+        return sum(1 for _ in self._used_slots())
+
+    @property
+    def stats(self):
+        """Counters for tuning the cache."""
+        lookups = self.hits + self.misses
+        sizes = list(self._used_slots())
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(sizes),
+            "size": sum(sizes),
+            "max_size": self.slots * self.max_size,
+        }
@@ -4,18 +4,29 @@
 
 """Resources test module."""
 
+import datetime
+import gc
+import weakref
+
 import marshmallow as ma
 import pytest
+from werkzeug.datastructures import MultiDict
 
 from flask_resources import (
     HTTPJSONException,
+    MultiDictSchema,
+    RequestParser,
     Resource,
     ResourceConfig,
     create_error_handler,
+    from_conf,
     request_parser,
     resource_requestctx,
     route,
 )
+from flask_resources.context import ResourceRequestCtx
+from flask_resources.parsers.base import HeadersView
+from flask_resources.parsers.loading import compile_loader
 
 
 @pytest.fixture(scope="module")
@@ -111,3 +122,225 @@ def test_headers(client):
     res = client.get("/header-unknown", headers={"if-match": "1"})
     assert res.json["if_match"] == 1
     assert "user_agent" in res.json
+
+
+def test_parser_is_cached(app, mocker):
+    parser = RequestParser({"id": ma.fields.Int()}, location="args")
+    with app.test_request_context("/?id=1"):
+        assert parser.parse() == {"id": 1}
+        schema = parser.schema
+        assert parser.parse() == {"id": 1}
+        assert parser.schema is schema
+
+    class Config:
+        args = {"id": ma.fields.Int()}
+
+    class MyResource:
+        config = Config
+
+        @request_parser(from_conf("args"), location="args")
+        def view(self):
+            return resource_requestctx.args
+
+    init = mocker.spy(RequestParser, "__init__")
+    with app.test_request_context("/?id=2"):
+        for _ in range(2):
+            with ResourceRequestCtx(Config):
+                assert MyResource().view() == {"id": 2}
+    assert init.call_count == 1
+
+
+def test_flatten_multidict():
+    class SearchArgs(MultiDictSchema):
+        q = ma.fields.String()
+        type = ma.fields.List(ma.fields.String(), data_key="t")
+        page = ma.fields.Int()
+
+    class IncludeArgs(SearchArgs):
+        class Meta:
+            unknown = ma.INCLUDE
+
+    data = MultiDict([("q", "a"), ("q", "b"), ("t", "x"), ("t", "y"), ("u", "1")])
+    assert SearchArgs().load(data) == {"q": "a", "type": ["x", "y"]}
+    assert IncludeArgs().load(data) == {"q": "a", "type": ["x", "y"], "u": ["1"]}
+
+    # the index is computed once per schema class
+    schema = SearchArgs()
+    assert schema.get_multidict_index() is SearchArgs().get_multidict_index()
+    assert schema.get_multidict_index() == (
+        frozenset(["q", "page"]),
+        frozenset(["q", "type", "t", "page"]),
+    )
+    assert SearchArgs(only=["q"]).get_multidict_index()[1] == frozenset(["q"])
+
+    # schema classes created at runtime are not kept alive by the index
+    generated = MultiDictSchema.from_dict({"q": ma.fields.String()})
+    assert generated().load(data) == {"q": "a"}
+    assert generated in MultiDictSchema._multidict_indexes
+    ref = weakref.ref(generated)
+    del generated
+    gc.collect()
+    assert ref() is None
+
+
+def test_headers_view(app):
+    parser = RequestParser(
+        {
+            "if_match": ma.fields.Int(),
+            "x_forwarded_for": ma.fields.String(),
+            "content_type": ma.fields.String(),
+        },
+        location="headers",
+    )
+    headers = {"If-Match": "1", "X-Forwarded-For": "10.0.0.1", "X-Other": "a"}
+    with app.test_request_context("/", headers=headers):
+        data = parser.load_data()
+        assert isinstance(data, HeadersView)
+        assert data["if_match"] == "1"
+        assert "x_other" not in data
+        assert "content_type" not in data
+        assert parser.parse() == {"if_match": 1, "x_forwarded_for": "10.0.0.1"}
+        # iterating gives all the headers
+        assert {"if_match", "x_forwarded_for", "x_other", "host"} <= set(data)
+
+
+def test_headers_pre_load(app):
+    class HeadersSchema(ma.Schema):
+        other = ma.fields.String()
+
+        class Meta:
+            unknown = ma.EXCLUDE
+
+        @ma.pre_load
+        def read_other(self, data, **kwargs):
+            data["other"] = data["x_other"]
+            return data
+
+    parser = RequestParser(HeadersSchema, location="headers")
+    with app.test_request_context("/", headers={"X-Other": "a"}):
+        # the hook gets all the headers, in a mutable dict
+        assert not isinstance(parser.load_data(), HeadersView)
+        assert parser.parse() == {"other": "a"}
+
+
+class CompiledArgs(MultiDictSchema):
+    q = ma.fields.String(validate=ma.validate.Length(max=5))
+    page = ma.fields.Int(load_default=1, validate=ma.validate.Range(min=1))
+    size = ma.fields.Int(strict=True)
+    flag = ma.fields.Boolean(data_key="f")
+    type = ma.fields.List(ma.fields.String(validate=ma.validate.OneOf(["a", "b"])))
+    sort = ma.fields.String(required=True, allow_none=True, attribute="sort_by")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        MultiDict([("q", "abc"), ("page", "2"), ("f", "true"), ("sort", "new")]),
+        MultiDict([("type", "a"), ("type", "b"), ("sort", "x"), ("u", "1")]),
+        MultiDict([("q", "too long"), ("page", "0"), ("f", "maybe")]),
+        MultiDict([("page", "a"), ("size", "1"), ("type", "a"), ("type", "c")]),
+        {"q": 1, "page": True, "size": 2, "f": 1, "type": "a", "sort": None},
+        {"q": b"\xff", "page": 10**400, "f": [], "type": ["a", 2], "sort": "x"},
+    ],
+)
+@pytest.mark.parametrize("unknown", [ma.EXCLUDE, ma.INCLUDE, ma.RAISE])
+def test_compiled_loader(data, unknown):
+    schema = CompiledArgs(unknown=unknown)
+    load = compile_loader(schema)
+    assert load is not None
+    try:
+        expected = schema.load(data)
+    except ma.ValidationError as error:
+        with pytest.raises(ma.ValidationError) as compiled_error:
+            load(data)
+        assert compiled_error.value.messages == error.messages
+        assert compiled_error.value.valid_data == error.valid_data
+        assert compiled_error.value.data is data
+    else:
+        assert load(data) == expected
+
+
+def test_compiled_loader_fallback(app):
+    class HookArgs(MultiDictSchema):
+        q = ma.fields.String()
+
+        @ma.post_load
+        def hook(self, data, **kwargs):
+            return data
+
+    class ValidatesArgs(MultiDictSchema):
+        q = ma.fields.String()
+
+        @ma.validates("q")
+        def validate_q(self, value, **kwargs):
+            pass
+
+    class DateArgs(MultiDictSchema):
+        d = ma.fields.Date()
+
+    for schema in [HookArgs(), ValidatesArgs(), DateArgs(), CompiledArgs(many=True)]:
+        assert compile_loader(schema) is None
+    # non-mapping data is loaded by the schema
+    with pytest.raises(ma.ValidationError) as error:
+        compile_loader(CompiledArgs())(["a"])
+    assert error.value.messages == {"_schema": ["Invalid input type."]}
+
+    parser = RequestParser(DateArgs, location="args")
+    with app.test_request_context("/?d=2020-01-02"):
+        assert parser.loader == parser.schema.load
+        assert parser.parse() == {"d": datetime.date(2020, 1, 2)}
+
+    parser = RequestParser({"page": ma.fields.Int()}, location="args")
+    with app.test_request_context("/?page=2"):
+        assert parser.loader != parser.schema.load
+        assert parser.parse() == {"page": 2}
+
+
+def test_parsed_args_cache(app, mocker):
+    class PureArgs(MultiDictSchema):
+        q = ma.fields.String()
+        type = ma.fields.List(ma.fields.String())
+
+        class Meta:
+            pure = True
+
+    class Config:
+        args = PureArgs
+        impure_args = {"q": ma.fields.String()}
+
+    class MyResource:
+        config = Config
+
+        @request_parser(from_conf("args"), location="args", cache_size=2)
+        def view(self):
+            args = resource_requestctx.args
+            result = dict(args, type=list(args["type"]))
+            args["type"].append("modified")
+            return result
+
+        @request_parser(from_conf("impure_args"), location="args", cache_size=2)
+        def impure_view(self):
+            return resource_requestctx.args
+
+    parse = mocker.spy(RequestParser, "parse")
+    expected = {"q": "a", "type": ["x", "y"]}
+    for _ in range(3):
+        with app.test_request_context("/?q=a&type=x&type=y"):
+            with ResourceRequestCtx(Config):
+                assert MyResource().view() == expected
+    assert parse.call_count == 1
+
+    with app.test_request_context("/?q=b&type=x"):
+        with ResourceRequestCtx(Config):
+            assert MyResource().view() == {"q": "b", "type": ["x"]}
+    assert parse.call_count == 2
+
+    for _ in range(2):
+        with app.test_request_context("/?q=a"):
+            with ResourceRequestCtx(Config):
+                assert MyResource().impure_view() == {"q": "a"}
+    assert parse.call_count == 4
+
+    assert RequestParser(PureArgs, location="args").pure
+    assert RequestParser({"q": ma.fields.String()}, "args", pure=True).pure
+    assert not RequestParser({"q": ma.fields.String()}, "args").pure
@@ -9,7 +9,9 @@ import json
 import pytest
 
 from flask_resources import (
+    JSONArrayDeserializer,
     JSONDeserializer,
+    NDJSONDeserializer,
     RequestBodyParser,
     Resource,
     ResourceConfig,
@@ -17,6 +19,7 @@ from flask_resources import (
     resource_requestctx,
     route,
 )
+from flask_resources.context import ResourceRequestCtx
 
 
 @pytest.fixture(scope="module")
@@ -55,3 +58,31 @@ def test_body_parser(client):
         data=json.dumps({"val": "1"}),
     )
     assert res.status_code == 415
+
+
+def test_streaming_body_parser(app):
+    @request_body_parser(
+        parsers={
+            "application/x-ndjson": RequestBodyParser(NDJSONDeserializer()),
+            "application/json": RequestBodyParser(JSONArrayDeserializer()),
+        }
+    )
+    def view(self):
+        data = resource_requestctx.data
+        assert not isinstance(data, list)
+        return [item["id"] for item in data]
+
+    class MyResource:
+        config = ResourceConfig
+
+    records = [{"id": i} for i in range(5)]
+    bodies = {
+        "application/x-ndjson": "\n".join(json.dumps(r) for r in records),
+        "application/json": json.dumps(records),
+    }
+    for content_type, body in bodies.items():
+        with app.test_request_context(
+            "/", method="POST", data=body, content_type=content_type
+        ):
+            with ResourceRequestCtx(ResourceConfig):
+                assert view(MyResource()) == list(range(5))
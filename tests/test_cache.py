@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Test the caches."""
+
+from flask_resources import cache as cache_module
+from flask_resources.cache import (
+    LRUCache,
+    approx_sizeof,
+    invalidate_tags,
+    tags_generation,
+    tags_invalidated_since,
+)
+
+
+def test_lru_cache():
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    cache.delete("c")
+    assert cache.get("c", "default") == "default"
+
+    stats = cache.stats
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 2, 1)
+    assert stats["hit_rate"] == 0.5
+    assert stats["entries"] == stats["size"] == 1
+
+
+def test_lru_cache_sizeof():
+    cache = LRUCache(max_size=10, sizeof=len)
+    cache.set("a", "x" * 6)
+    cache.set("b", "x" * 4)
+    assert len(cache) == 2
+    cache.set("c", "x" * 2)
+    assert cache.get("a") is None
+    assert cache.stats["size"] == 6
+    # too big values are not cached
+    cache.set("d", "x" * 11)
+    assert cache.get("d") is None
+    cache.clear()
+    assert cache.stats["size"] == 0
+
+
+def test_approx_sizeof():
+    assert approx_sizeof({"a": [1, 2]}) > approx_sizeof({}) + approx_sizeof([])
+
+
+def test_lru_cache_tags():
+    cache = LRUCache(max_size=3)
+    other = LRUCache()
+    cache.set("a", 1, tags=["record:1", "records"])
+    cache.set("b", 2, tags=["record:2", "records"])
+    cache.set("c", 3)
+    other.set("a", 1, tags=["record:1"])
+
+    # invalidated on all the caches
+    invalidate_tags(["record:1"])
+    assert cache.get("a") is None
+    assert other.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.invalidate_tags(["records"])
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    # the tags of the deleted or evicted values are forgotten
+    cache.set("d", 4, tags=["x"])
+    cache.set("e", 5, tags=["y"])
+    cache.set("f", 6, tags=["z"])
+    cache.set("g", 7)
+    assert set(cache._tags) == {"y", "z"}
+
+
+def test_tags_invalidated_since(monkeypatch):
+    generation = tags_generation()
+    assert not tags_invalidated_since(["record:1"], generation)
+    invalidate_tags(["record:1"])
+    assert tags_invalidated_since(["record:1", "record:2"], generation)
+    assert not tags_invalidated_since(["record:2"], generation)
+    assert not tags_invalidated_since(["record:1"], tags_generation())
+
+    # the forgotten tags count as invalidated
+    monkeypatch.setattr(cache_module, "MAX_INVALIDATED_TAGS", 1)
+    generation = tags_generation()
+    invalidate_tags(["record:3"])
+    invalidate_tags(["record:4"])
+    assert tags_invalidated_since(["record:3"], generation)
+    assert tags_invalidated_since(["other"], generation)
+    assert not tags_invalidated_since(["other"], tags_generation())
@@ -171,3 +171,19 @@ def test_choose_default_if_no_query_and_no_header():
     assert "application/json" == ContentNegotiator.match(
         server_mimetypes, client_mimetypes, formats_map, fmt, default="application/json"
     )
+
+
+def test_match_header_is_cached():
+    server_mimetypes = frozenset(["application/json", "application/marcxml+xml"])
+    ContentNegotiator.match_header.cache_clear()
+
+    for _ in range(3):
+        assert "application/marcxml+xml" == ContentNegotiator.match_header(
+            server_mimetypes, "application/marcxml+xml, */*", None
+        )
+    assert "application/json" == ContentNegotiator.match_header(
+        server_mimetypes, None, None, default="application/json"
+    )
+
+    info = ContentNegotiator.match_header.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
@@ -4,9 +4,12 @@
 
 """Test deserialization."""
 
+import io
 import json
 
-from flask_resources import JSONDeserializer
+import pytest
+
+from flask_resources import JSONArrayDeserializer, JSONDeserializer, NDJSONDeserializer
 
 
 def test_json_deserializer():
@@ -18,3 +21,36 @@ def test_json_deserializer():
 
     data = None
     assert JSONDeserializer().deserialize(json.dumps(data)) is None
+
+
+def test_ndjson_deserializer():
+    body = b'{"a": 1}\n\n{"b": "\xc3\xa9"}\r\n[1, 2]'
+    for chunk_size in [1, 3, 1024]:
+        deserializer = NDJSONDeserializer(chunk_size=chunk_size)
+        result = deserializer.deserialize(io.BytesIO(body))
+        assert not isinstance(result, list)
+        assert list(result) == [{"a": 1}, {"b": "é"}, [1, 2]]
+    assert list(NDJSONDeserializer().deserialize(io.BytesIO(b""))) == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+def test_json_array_deserializer(chunk_size):
+    items = [{"a": 1, "b": ["x", "é"]}, 12345, "s" * 100, None, [], 1.5e3]
+    deserializer = JSONArrayDeserializer(chunk_size=chunk_size)
+    for body in [json.dumps(items), json.dumps(items, indent=2) + "\n"]:
+        stream = io.BytesIO(body.encode("utf-8"))
+        assert list(deserializer.deserialize(stream)) == items
+    for body in [b"[]", b" [ ] "]:
+        assert list(deserializer.deserialize(io.BytesIO(body))) == []
+
+    # the items are decoded as they are read
+    stream = io.BytesIO(b'[{"a": 1}, {"b": 2}, oops]')
+    result = deserializer.deserialize(stream)
+    assert next(result) == {"a": 1}
+    assert next(result) == {"b": 2}
+    with pytest.raises(ValueError):
+        next(result)
+
+    for body in [b"", b'{"a": 1}', b"[1, 2", b"[1,]", b"[1 2]", b"[1] 2"]:
+        with pytest.raises(ValueError):
+            list(deserializer.deserialize(io.BytesIO(body)))
@@ -0,0 +1,319 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Test the schema dumpers."""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime
+
+import pytest
+from flask import Flask
+from marshmallow import Schema, fields, post_dump
+
+from flask_resources import (
+    BaseListSchema,
+    JSONSerializer,
+    MarshmallowSerializer,
+    ResourceConfig,
+    resource_requestctx,
+)
+from flask_resources.cache import LRUCache, approx_sizeof, invalidate_tags
+from flask_resources.context import ResourceRequestCtx
+from flask_resources.serializers import BaseSerializerSchema, DumperMixin
+from flask_resources.serializers.dumping import (
+    CachingDumper,
+    CompiledSchemaDumper,
+    ParallelDumper,
+    SchemaDumper,
+    compile_dumper,
+)
+
+
+class AuthorSchema(Schema):
+    name = fields.String()
+    orcid = fields.String(data_key="ORCID", dump_default="unknown")
+
+
+class RecordSchema(Schema):
+    id = fields.String()
+    title = fields.String(attribute="metadata.title")
+    version = fields.Integer()
+    count = fields.Integer(as_string=True)
+    public = fields.Boolean()
+    created = fields.DateTime()
+    updated = fields.DateTime(format="%Y")
+    published = fields.Date()
+    author = fields.Nested(AuthorSchema)
+    authors = fields.List(fields.Nested(AuthorSchema, only=["name"]))
+    keywords = fields.List(fields.String())
+    custom = fields.Method("get_custom")
+    items = fields.String()
+
+    def get_custom(self, obj):
+        return "custom"
+
+
+class HookSchema(Schema):
+    id = fields.String()
+
+    @post_dump
+    def add_hook(self, data, **kwargs):
+        data["hook"] = True
+        return data
+
+
+RECORDS = [
+    {
+        "id": 1,
+        "metadata": {"title": "Title"},
+        "version": "2",
+        "count": 3,
+        "public": "yes",
+        "created": datetime(2020, 1, 1, 10, 30),
+        "updated": datetime(2021, 1, 1),
+        "published": date(2020, 1, 2),
+        "author": {"name": "Doe", "orcid": "0000"},
+        "authors": [{"name": "Doe", "orcid": "0000"}, {"name": b"Roe"}],
+        "keywords": ["a", 1],
+        "items": "items",
+    },
+    {"id": None, "author": None, "keywords": None, "public": 0},
+    {},
+]
+
+
+@pytest.mark.parametrize("obj", RECORDS)
+def test_compiled_dumper(obj):
+    schema = RecordSchema()
+    assert compile_dumper(schema) is not None
+    assert CompiledSchemaDumper(schema).dump(obj) == schema.dump(obj)
+
+
+def test_compiled_dumper_fallback():
+    schema = HookSchema()
+    assert compile_dumper(schema) is None
+    assert CompiledSchemaDumper(schema).dump({"id": "1"}) == {"id": "1", "hook": True}
+
+
+def test_marshmallow_serializer_compile_schemas():
+    serializer = MarshmallowSerializer(
+        format_serializer_cls=JSONSerializer,
+        object_schema_cls=RecordSchema,
+        list_schema_cls=BaseListSchema,
+        compile_schemas=True,
+    )
+    assert serializer.object_dumper.compiled
+    assert serializer.dump_obj(RECORDS[1]) == RecordSchema().dump(RECORDS[1])
+
+    obj_list = {"hits": {"hits": [RECORDS[0], RECORDS[2]]}}
+    expected = {
+        "hits": {"hits": RecordSchema().dump(obj_list["hits"]["hits"], many=True)}
+    }
+    assert serializer.dump_list(obj_list) == expected
+    assert serializer.list_schema.get_hits_dumper().compiled
+
+
+class VersionSchema(Schema):
+    id = fields.String()
+    version = fields.Integer()
+
+
+def test_marshmallow_serializer_dump_cache():
+    cache = LRUCache(max_size=10)
+    serializer = MarshmallowSerializer(
+        format_serializer_cls=JSONSerializer,
+        object_schema_cls=VersionSchema,
+        list_schema_cls=BaseListSchema,
+        dump_cache=cache,
+    )
+    records = [
+        {"id": "1", "revision_id": 1, "version": 1},
+        {"id": "2", "revision_id": 1, "version": 2},
+        {"id": "3", "version": 3},
+    ]
+    assert serializer.dump_obj(records[0]) == {"id": "1", "version": 1}
+    assert cache.stats["misses"] == 1
+
+    dumped = serializer.dump_list({"hits": {"hits": list(records)}})
+    assert dumped["hits"]["hits"] == VersionSchema().dump(records, many=True)
+    # the first record comes from the cache, the one without revision is
+    # never cached
+    assert (cache.stats["hits"], cache.stats["misses"]) == (1, 2)
+    assert len(cache) == 2
+
+    # a new revision is dumped again
+    assert serializer.dump_obj({"id": "1", "revision_id": 2, "version": 5}) == {
+        "id": "1",
+        "version": 5,
+    }
+
+
+def test_marshmallow_serializer_dump_cache_tags():
+    cache = LRUCache(max_size=10)
+    serializer = MarshmallowSerializer(
+        format_serializer_cls=JSONSerializer,
+        object_schema_cls=VersionSchema,
+        dump_cache=cache,
+        dump_cache_tags=lambda obj: ["record:" + obj["id"]],
+    )
+    serializer.dump_obj({"id": "1", "revision_id": 1, "version": 1})
+    serializer.dump_obj({"id": "2", "revision_id": 1, "version": 2})
+    assert len(cache) == 2
+    invalidate_tags(["record:1"])
+    assert len(cache) == 1
+
+
+class FailingDumper(DumperMixin):
+    def post_dump(self, data, original=None, **kwargs):
+        if data["version"] == 42:
+            raise ValueError("Cannot dump 42.")
+        return data
+
+
+class VersionDumperSchema(BaseSerializerSchema):
+    id = fields.String()
+    version = fields.Integer()
+
+
+@pytest.mark.parametrize("executor_cls", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_parallel_dumper(executor_cls):
+    objs = [{"id": str(i), "version": i} for i in range(100)]
+    with executor_cls(max_workers=2) as executor:
+        dumper = ParallelDumper(
+            SchemaDumper(VersionSchema()), executor, min_chunk_size=1, chunk_bytes=1
+        )
+        assert dumper.chunk_size(VersionSchema().dump(objs[0])) == 1
+        assert dumper.dump_many(objs) == VersionSchema().dump(objs, many=True)
+
+
+class CountingDumper(DumperMixin):
+    def __init__(self):
+        self.count = 0
+
+    def post_dump(self, data, original=None, **kwargs):
+        self.count += 1
+        return data
+
+
+def test_parallel_dumper_errors():
+    counter = CountingDumper()
+    schema = VersionDumperSchema(dumpers=[FailingDumper(), counter])
+    objs = [{"id": str(i), "version": i} for i in range(1000)]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dumper = ParallelDumper(
+            SchemaDumper(schema), executor, min_chunk_size=10, chunk_bytes=1
+        )
+        assert dumper.chunk_size(schema.dump(objs[0])) == 10
+        assert dumper.dump_many(objs[:42]) == VersionSchema().dump(objs[:42], many=True)
+        with pytest.raises(ValueError):
+            dumper.dump_many(objs)
+
+    # the chunks after the failing one were cancelled
+    assert counter.count < 42 + len(objs)
+
+
+def test_parallel_dumper_contexts():
+    app = Flask("test_parallel_dumper_contexts")
+    teardowns = []
+    app.teardown_request(teardowns.append)
+    app.teardown_appcontext(teardowns.append)
+
+    class MimetypeSchema(Schema):
+        id = fields.String()
+        mimetype = fields.Function(lambda obj: resource_requestctx.accept_mimetype)
+
+    objs = [{"id": str(i)} for i in range(100)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        dumper = ParallelDumper(
+            SchemaDumper(MimetypeSchema()), executor, min_chunk_size=1, chunk_bytes=1
+        )
+        with app.test_request_context("/"), ResourceRequestCtx(ResourceConfig):
+            resource_requestctx.accept_mimetype = "application/json"
+            dumped = dumper.dump_many(objs)
+            # the Flask contexts are not pushed (and torn down) per chunk
+            assert teardowns == []
+            assert resource_requestctx.accept_mimetype == "application/json"
+    assert dumped == [
+        {"id": str(i), "mimetype": "application/json"} for i in range(100)
+    ]
+    assert len(teardowns) == 2
+
+
+class ObjRecord:
+    def __init__(self, i):
+        self.id = str(i)
+        self.version = i
+
+
+def test_parallel_dumper_chunk_size():
+    objs = [ObjRecord(i) for i in range(100)]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dumper = ParallelDumper(SchemaDumper(VersionSchema()), executor)
+        # the size is the one of the dumped object, not the shallow size of
+        # the object
+        dumped = VersionSchema().dump(objs[0])
+        assert dumper.chunk_size(dumped) == 512 * 1024 // approx_sizeof(dumped)
+        assert dumper.dump_many(objs) == VersionSchema().dump(objs, many=True)
+
+
+def test_marshmallow_serializer_dump_executor():
+    objs = [{"id": str(i), "version": i} for i in range(100)]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        serializer = MarshmallowSerializer(
+            format_serializer_cls=JSONSerializer,
+            object_schema_cls=VersionSchema,
+            list_schema_cls=BaseListSchema,
+            compile_schemas=True,
+            dump_executor=executor,
+        )
+        dumper = serializer.list_schema.get_hits_dumper()
+        dumper.min_chunk_size = 10
+        dumper.chunk_bytes = 1
+        dumped = serializer.dump_list({"hits": {"hits": list(objs)}})
+    assert dumped["hits"]["hits"] == VersionSchema().dump(objs, many=True)
+
+
+class ContextSchema(Schema):
+    id = fields.String()
+    lang = fields.Method("get_lang")
+
+    def get_lang(self, obj):
+        return self.context.get("lang")
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_list_schema_context_changes():
+    schema = BaseListSchema(object_schema_cls=ContextSchema, context={"lang": "en"})
+    obj_list = {"hits": {"hits": [{"id": "1"}]}}
+    assert schema.dump(obj_list)["hits"]["hits"] == [{"id": "1", "lang": "en"}]
+    dumper = schema.get_hits_dumper()
+    assert schema.get_hits_dumper() is dumper
+
+    # the hits schema is built again from the new context
+    schema.context["lang"] = "fr"
+    obj_list = {"hits": {"hits": [{"id": "1"}]}}
+    assert schema.dump(obj_list)["hits"]["hits"] == [{"id": "1", "lang": "fr"}]
+    assert schema.get_hits_dumper() is not dumper
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_caching_dumper_copies_and_context():
+    cache = LRUCache(max_size=10)
+    obj = {"id": "1", "revision_id": 1}
+    dumper = CachingDumper(SchemaDumper(ContextSchema()), cache)
+    dumped = dumper.dump(obj)
+    assert dumped == {"id": "1", "lang": None}
+    # modifying a dump does not modify the cached one
+    dumped["id"] = "modified"
+    dumper.dump(obj)["lang"] = "modified"
+    assert dumper.dump_many([obj]) == [{"id": "1", "lang": None}]
+    assert cache.stats["hits"] == 2
+
+    # the dumps of other contexts are cached separately
+    dumper = CachingDumper(SchemaDumper(ContextSchema(context={"lang": "en"})), cache)
+    assert dumper.dump(obj) == {"id": "1", "lang": "en"}
+    assert len(cache) == 2
+    # unhashable contexts are not cached
+    dumper = CachingDumper(SchemaDumper(ContextSchema(context={"l": []})), cache)
+    assert dumper.dump(obj) == {"id": "1", "lang": None}
+    assert len(cache) == 2
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Test the store of serialized representations."""
+
+import mmap
+import subprocess
+import sys
+
+import marshmallow as ma
+import pytest
+
+from flask_resources import (
+    JSONSerializer,
+    MarshmallowSerializer,
+    Resource,
+    ResourceConfig,
+    ResponseHandler,
+    response_handler,
+    route,
+)
+from flask_resources.representations import RepresentationStore, StoredRepresentation
+
+loads = []
+
+
+def load_record():
+    loads.append(1)
+    return {"id": "1", "title": "Immutable"}
+
+
+class RecordSchema(ma.Schema):
+    id = ma.fields.String()
+    title = ma.fields.String()
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    return RepresentationStore(str(tmp_path_factory.mktemp("store") / "records"))
+
+
+@pytest.fixture(scope="module")
+def resource(store):
+    class TestConfig(ResourceConfig):
+        blueprint_name = "test"
+
+        response_handlers = {
+            "application/json": ResponseHandler(
+                JSONSerializer(), etag=True, store=store
+            ),
+            "application/vnd.nostore+json": ResponseHandler(JSONSerializer()),
+            "application/vnd.fields+json": ResponseHandler(
+                MarshmallowSerializer(
+                    format_serializer_cls=JSONSerializer,
+                    object_schema_cls=RecordSchema,
+                    sparse_fieldsets="fields",
+                ),
+                store=store,
+            ),
+        }
+
+    class TestResource(Resource):
+        @response_handler()
+        def read(self):
+            return StoredRepresentation("1:v1", loader=load_record), 200
+
+        def create_url_rules(self):
+            return [route("GET", "/records/1", self.read)]
+
+    return TestResource(TestConfig)
+
+
+def test_representation_store(tmp_path):
+    path = str(tmp_path / "records")
+    store = RepresentationStore(path)
+    assert store.get("1", "application/json") is None
+    assert store.put("1", "application/json", b'{"id": "1"}') == b'{"id": "1"}'
+    store.put("1", "text/csv", b"id\r\n1\r\n")
+    # written once
+    store.put("1", "application/json", b"other")
+    assert store.get("1", "application/json") == b'{"id": "1"}'
+    # a view of the memory map, not a copy
+    assert isinstance(store.get("1", "application/json"), memoryview)
+    assert store.get("1", "application/json").readonly
+    assert ("1", "text/csv") in store
+    assert len(store) == 2
+
+    # shared with the other instances on the same files
+    other = RepresentationStore(path)
+    assert other.get("1", "text/csv") == b"id\r\n1\r\n"
+    store.put("2", "application/json", b'{"id": "2"}')
+    assert other.get("2", "application/json") == b'{"id": "2"}'
+
+
+def test_stored_representation_response(client, store):
+    res = client.get("/records/1")
+    assert res.status_code == 200
+    assert res.json == {"id": "1", "title": "Immutable"}
+    assert store.get("1:v1", "application/json") == res.data
+    assert "ETag" in res.headers
+
+    # served from the store, without loading the record
+    res = client.get("/records/1")
+    assert res.json == {"id": "1", "title": "Immutable"}
+    assert len(loads) == 1
+
+    # handlers without a store serialize the object
+    res = client.get("/records/1", headers={"Accept": "application/vnd.nostore+json"})
+    assert res.json == {"id": "1", "title": "Immutable"}
+    assert len(loads) == 2
+
+
+def test_stored_representation_query_string(client, store):
+    # the output of these requests depends on the query string
+    res = client.get("/records/1?prettyprint=1")
+    assert res.data == b'{\n  "id": "1",\n  "title": "Immutable"\n}'
+    res = client.get(
+        "/records/1?fields=id", headers={"Accept": "application/vnd.fields+json"}
+    )
+    assert res.json == {"id": "1"}
+    assert store.get("1:v1", "application/vnd.fields+json") is None
+
+    # and is not stored for the other requests
+    res = client.get("/records/1")
+    assert res.data == b'{"id": "1", "title": "Immutable"}'
+    res = client.get("/records/1", headers={"Accept": "application/vnd.fields+json"})
+    assert res.json == {"id": "1", "title": "Immutable"}
+    assert store.get("1:v1", "application/vnd.fields+json") == res.data
+
+
+def test_store_remap_with_views(tmp_path):
+    store = RepresentationStore(str(tmp_path / "records"))
+    store.put("1", "application/json", b"1" * 10)
+    view = store.get("1", "application/json")
+    # the data file grows and is mapped again while the view is in use
+    store.put("2", "application/json", b"2" * mmap.PAGESIZE * 2)
+    assert store.get("2", "application/json") == b"2" * mmap.PAGESIZE * 2
+    assert view == b"1" * 10
+    store.close()
+    assert view == b"1" * 10
+
+
+def test_import_without_fcntl():
+    code = "import sys; sys.modules['fcntl'] = None; import flask_resources"
+    subprocess.run([sys.executable, "-c", code], check=True)
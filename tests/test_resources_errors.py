@@ -4,13 +4,20 @@
 
 """Resources test module."""
 
+import json
+
 import pytest
 from flask import abort
+from speaklater import make_lazy_string
 
 from flask_resources import Resource, ResourceConfig, create_error_handler, route
 from flask_resources.errors import HTTPJSONException
 
 
+def _(s):
+    return make_lazy_string(lambda: s)
+
+
 @pytest.fixture(scope="module")
 def resource():
     class Config(ResourceConfig):
@@ -76,3 +83,12 @@ def test_error_handlers(client):
     res = client.get("/unhandled")
     assert res.status_code == 500
     assert res.json["status"] == 500
+
+
+def test_error_body_converts_types(app):
+    errors = [{"field": "title", "messages": [_("lazy message")]}]
+    with app.test_request_context():
+        body = HTTPJSONException(code=400, errors=errors).get_body()
+    assert json.loads(body)["errors"] == [
+        {"field": "title", "messages": ["lazy message"]}
+    ]
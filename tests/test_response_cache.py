@@ -0,0 +1,227 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Response cache tests."""
+
+import threading
+import time
+
+import pytest
+
+from flask_resources import (
+    JSONSerializer,
+    Resource,
+    ResourceConfig,
+    ResponseHandler,
+    cache_tags,
+    invalidate_cache_tags,
+    response_handler,
+    route,
+)
+from flask_resources.cache import LRUCache, invalidate_tags
+from flask_resources.responses import CachedResponse
+
+calls = {"read": 0, "search": 0, "slow": 0, "racy": 0}
+running = {"missing": 0, "max": 0}
+running_lock = threading.Lock()
+
+
+@pytest.fixture(scope="module")
+def cache():
+    return LRUCache(max_size=1024 * 1024, sizeof=len)
+
+
+@pytest.fixture(scope="module")
+def resource(cache):
+    class TestConfig(ResourceConfig):
+        blueprint_name = "test"
+
+        response_handlers = {
+            "application/json": ResponseHandler(JSONSerializer(), etag=True),
+        }
+        response_cache = cache
+        response_cache_ttl = {
+            "read": 60,
+            "search": 60,
+            "slow": 0.2,
+            "racy": 60,
+            "missing": 60,
+        }
+
+    class TestResource(Resource):
+        @cache_tags("record:{id}")
+        @response_handler()
+        def read(self):
+            calls["read"] += 1
+            return {"id": "1", "calls": calls["read"]}, 200
+
+        @response_handler()
+        def search(self):
+            calls["search"] += 1
+            return {"calls": calls["search"]}, 200
+
+        @response_handler()
+        def slow(self):
+            calls["slow"] += 1
+            time.sleep(0.1)
+            return {"calls": calls["slow"]}, 200
+
+        @cache_tags("record:{id}")
+        @response_handler()
+        def racy(self):
+            calls["racy"] += 1
+            # a write commits while the response is computed
+            invalidate_tags(["record:racy"])
+            return {"calls": calls["racy"]}, 200
+
+        @response_handler()
+        def missing(self):
+            with running_lock:
+                running["missing"] += 1
+                running["max"] = max(running["max"], running["missing"])
+            time.sleep(0.1)
+            with running_lock:
+                running["missing"] -= 1
+            return {"status": 404}, 404
+
+        @invalidate_cache_tags("record:{id}", "record:{pid_value}")
+        def bad_update(self):
+            calls["bad_update"] = True
+            return {}, 200
+
+        @invalidate_cache_tags("record:{id}")
+        @response_handler()
+        def update(self):
+            return {"id": "1"}, 200
+
+        @invalidate_cache_tags("record:{id}")
+        def delete(self):
+            raise RuntimeError("Cannot delete.")
+
+        def create_url_rules(self):
+            return [
+                route("GET", "/records/<id>", self.read),
+                route("PUT", "/records/<id>", self.update),
+                route("DELETE", "/records/<id>", self.delete),
+                route("GET", "/records", self.search),
+                route("GET", "/slow", self.slow),
+                route("GET", "/racy/<id>", self.racy),
+                route("GET", "/missing", self.missing),
+                route("POST", "/records/<id>", self.bad_update),
+            ]
+
+    return TestResource(TestConfig)
+
+
+def test_cached_response(client):
+    res = client.get("/records/1")
+    assert res.json == {"id": "1", "calls": 1}
+    res = client.get("/records/1")
+    assert res.json == {"id": "1", "calls": 1}
+    assert res.headers["Content-Type"] == "application/json"
+
+    # the view args are part of the key
+    assert client.get("/records/2").json == {"id": "1", "calls": 2}
+
+    # the cached responses are still conditional
+    res = client.get("/records/1", headers={"If-None-Match": res.headers["ETag"]})
+    assert res.status_code == 304
+
+    # only GET routes are cached
+    assert client.put("/records/1").status_code == 200
+
+
+def test_invalidate_cache_tags(client):
+    assert client.get("/records/3").json["calls"] == 3
+    assert client.get("/records/4").json["calls"] == 4
+
+    # failed writes do not invalidate the cache
+    assert client.delete("/records/3").status_code == 500
+    assert client.get("/records/3").json["calls"] == 3
+
+    assert client.put("/records/3").status_code == 200
+    assert client.get("/records/3").json["calls"] == 5
+    assert client.get("/records/4").json["calls"] == 4
+
+
+def test_query_args_are_normalized(client):
+    assert client.get("/records?q=a&sort=b").json == {"calls": 1}
+    assert client.get("/records?sort=b&q=a").json == {"calls": 1}
+    assert client.get("/records?q=b&sort=b").json == {"calls": 2}
+    # the order of the values of a key matters
+    assert client.get("/records?sort=a&sort=b").json == {"calls": 3}
+    assert client.get("/records?sort=b&sort=a").json == {"calls": 4}
+    assert client.get("/records?sort=a&q=a&sort=b").json == {"calls": 5}
+    assert client.get("/records?q=a&sort=a&sort=b").json == {"calls": 5}
+
+
+def test_cache_is_sized_in_bytes():
+    cache = LRUCache(max_size=100, sizeof=len)
+    entry = CachedResponse(0, 200, [("Content-Type", "text/plain")], b"x" * 50)
+    assert len(entry) == 50 + len("Content-Type") + len("text/plain")
+    cache.set("a", entry)
+    cache.set("b", entry)
+    assert len(cache) == 1
+
+
+def test_stampede(app):
+    def get():
+        with app.test_client() as client:
+            results.append(client.get("/slow").json["calls"])
+
+    def get_all():
+        threads = [threading.Thread(target=get) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    # requests wait for the one computing the missing entry
+    results = []
+    get_all()
+    assert results == [1] * 5
+    assert calls["slow"] == 1
+
+    # once expired, a single request recomputes the entry while the others
+    # are served the expired one
+    time.sleep(0.25)
+    results = []
+    get_all()
+    assert sorted(results) in ([1, 1, 1, 1, 2], [2] * 5)
+    assert calls["slow"] == 2
+
+
+def test_not_cacheable_concurrent(app):
+    def get():
+        with app.test_client() as client:
+            results.append(client.get("/missing").status_code)
+
+    results = []
+    threads = [threading.Thread(target=get) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [404] * 5
+    # the requests waiting for the first one did not compute it one at a time
+    assert running["max"] > 1
+
+
+def test_invalidated_while_computed(client):
+    # the response is not cached if its tags were invalidated meanwhile
+    assert client.get("/racy/racy").json == {"calls": 1}
+    assert client.get("/racy/racy").json == {"calls": 2}
+    assert client.get("/racy/other").json == {"calls": 3}
+    assert client.get("/racy/other").json == {"calls": 3}
+
+
+def test_invalid_cache_tags(client):
+    for decorator in [cache_tags, invalidate_cache_tags]:
+        for tag in ["record:{}", "record:{0}", "record:{id.x}", "record:{id[0]}"]:
+            with pytest.raises(ValueError):
+                decorator(tag)
+        decorator("record:{id}:{{literal}}")
+
+    # a view arg missing from the route fails before the view is called
+    assert client.post("/records/1").status_code == 500
+    assert "bad_update" not in calls
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Response compression tests."""
+
+import gzip
+import json
+import zlib
+
+import pytest
+from flask import request
+
+from flask_resources import (
+    JSONSerializer,
+    Resource,
+    ResourceConfig,
+    ResponseHandler,
+    response_handler,
+    route,
+)
+
+
+@pytest.fixture(scope="module")
+def resource():
+    class TestConfig(ResourceConfig):
+        blueprint_name = "test"
+
+        response_handlers = {
+            "application/json": ResponseHandler(JSONSerializer()),
+            "application/vnd.stream+json": ResponseHandler(
+                JSONSerializer(), stream=True
+            ),
+            "text/plain": ResponseHandler(JSONSerializer()),
+        }
+        response_compression_mimetypes = [
+            "application/json",
+            "application/vnd.stream+json",
+        ]
+        response_compression_min_size = 100
+
+    class TestResource(Resource):
+        @response_handler(many=True)
+        def search(self):
+            size = request.args.get("size", 100, type=int)
+            hits = [{"id": str(i)} for i in range(size)]
+            return {"hits": {"hits": hits}}, 200
+
+        def create_url_rules(self):
+            return [route("GET", "/search", self.search)]
+
+    return TestResource(TestConfig)
+
+
+def expected_body(size=100):
+    return {"hits": {"hits": [{"id": str(i)} for i in range(size)]}}
+
+
+@pytest.mark.parametrize("accept", ["application/json", "application/vnd.stream+json"])
+def test_gzip(client, accept):
+    res = client.get("/search", headers={"Accept": accept, "Accept-Encoding": "gzip"})
+    assert res.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in res.headers["Vary"]
+    assert json.loads(gzip.decompress(res.data)) == expected_body()
+    # no modification time in the header, the output is reproducible
+    assert res.data[4:8] == b"\x00\x00\x00\x00"
+
+
+@pytest.mark.parametrize("accept", ["application/json", "application/vnd.stream+json"])
+def test_deflate(client, accept):
+    res = client.get(
+        "/search",
+        headers={"Accept": accept, "Accept-Encoding": "gzip;q=0.5, deflate"},
+    )
+    assert res.headers["Content-Encoding"] == "deflate"
+    assert json.loads(zlib.decompress(res.data)) == expected_body()
+
+
+@pytest.mark.parametrize("accept", ["application/json", "application/vnd.stream+json"])
+def test_not_compressed(client, accept):
+    # below the minimum size
+    res = client.get(
+        "/search?size=1", headers={"Accept": accept, "Accept-Encoding": "gzip"}
+    )
+    assert "Content-Encoding" not in res.headers
+    assert res.headers["Vary"] == "Accept-Encoding"
+    assert res.json == expected_body(1)
+
+    # not accepted by the client
+    res = client.get("/search", headers={"Accept": accept})
+    assert "Content-Encoding" not in res.headers
+    assert res.json == expected_body()
+
+
+def test_not_compressed_mimetype(client):
+    res = client.get(
+        "/search", headers={"Accept": "text/plain", "Accept-Encoding": "gzip"}
+    )
+    assert "Content-Encoding" not in res.headers
+    assert "Vary" not in res.headers
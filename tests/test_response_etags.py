@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""ETag and conditional request tests."""
+
+import pytest
+
+from flask_resources import (
+    JSONSerializer,
+    Resource,
+    ResourceConfig,
+    ResponseHandler,
+    response_handler,
+    route,
+)
+
+
+def record_etag(obj, code, many=False):
+    return str(obj["revision_id"])
+
+
+@pytest.fixture(scope="module")
+def serializer():
+    return JSONSerializer()
+
+
+@pytest.fixture(scope="module")
+def resource(serializer):
+    class TestConfig(ResourceConfig):
+        blueprint_name = "test"
+
+        response_handlers = {
+            "application/json": ResponseHandler(serializer, etag=record_etag),
+            "application/vnd.hash+json": ResponseHandler(serializer, etag=True),
+            "application/vnd.weak+json": ResponseHandler(
+                serializer, etag=True, weak_etag=True
+            ),
+        }
+        response_compression_mimetypes = ["application/vnd.hash+json"]
+        response_compression_min_size = 0
+
+    class TestResource(Resource):
+        @response_handler()
+        def read(self):
+            return {"id": "1", "revision_id": 3}, 200
+
+        @response_handler()
+        def create(self):
+            return {"id": "1", "revision_id": 3}, 201
+
+        def create_url_rules(self):
+            return [
+                route("GET", "/record", self.read),
+                route("POST", "/record", self.create),
+            ]
+
+    return TestResource(TestConfig)
+
+
+def test_etag_from_version(client, serializer, mocker):
+    res = client.get("/record")
+    assert res.status_code == 200
+    assert res.headers["ETag"] == '"3"'
+
+    serialize = mocker.spy(serializer, "serialize_object")
+    res = client.get("/record", headers={"If-None-Match": '"3"'})
+    assert res.status_code == 304
+    assert res.headers["ETag"] == '"3"'
+    assert res.data == b""
+    # the serialization was skipped
+    assert serialize.call_count == 0
+
+    res = client.get("/record", headers={"If-None-Match": '"2"'})
+    assert res.status_code == 200
+    assert res.json == {"id": "1", "revision_id": 3}
+
+    # only for GET requests with a 200 response
+    res = client.post("/record", headers={"If-None-Match": '"3"'})
+    assert res.status_code == 201
+
+
+def test_etag_from_hash(client):
+    headers = {"Accept": "application/vnd.hash+json"}
+    res = client.get("/record", headers=headers)
+    assert res.status_code == 200
+    etag = res.headers["ETag"]
+    assert etag.startswith('"')
+
+    res = client.get("/record", headers={"If-None-Match": etag, **headers})
+    assert res.status_code == 304
+
+    # strong ETags become weak when the body is compressed
+    res = client.get("/record", headers={"Accept-Encoding": "gzip", **headers})
+    assert res.headers["ETag"] == "W/" + etag
+    res = client.get(
+        "/record",
+        headers={"If-None-Match": "W/" + etag, "Accept-Encoding": "gzip", **headers},
+    )
+    assert res.status_code == 304
+
+
+def test_weak_etag(client):
+    res = client.get("/record", headers={"Accept": "application/vnd.weak+json"})
+    assert res.headers["ETag"].startswith('W/"')
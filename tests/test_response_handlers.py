@@ -6,13 +6,16 @@
 
 import marshmallow as ma
 import pytest
+from flask import Flask
 
 from flask_resources import (
+    BaseListSchema,
     JSONSerializer,
     MarshmallowSerializer,
     Resource,
     ResourceConfig,
     ResponseHandler,
+    resource_requestctx,
     response_handler,
     route,
 )
@@ -75,3 +78,103 @@ def test_one(client):
 
     res = client.get("/one", headers={"accept": "application/xml"})
     assert res.status_code == 406
+
+
+@pytest.fixture(scope="module")
+def streaming_app():
+    class TestSchema(ma.Schema):
+        id = ma.fields.String()
+        # the hits are dumped while the response is sent
+        mimetype = ma.fields.Function(lambda obj: resource_requestctx.accept_mimetype)
+
+    class TestConfig(ResourceConfig):
+        blueprint_name = "test_stream"
+
+        response_handlers = {
+            "application/json": ResponseHandler(
+                MarshmallowSerializer(
+                    format_serializer_cls=JSONSerializer,
+                    object_schema_cls=TestSchema,
+                    list_schema_cls=BaseListSchema,
+                ),
+                stream=True,
+            ),
+        }
+
+    class TestResource(Resource):
+        @response_handler(many=True)
+        def search(self):
+            hits = [{"id": str(i)} for i in range(1000)]
+            return {"hits": {"hits": hits, "total": len(hits)}}, 200
+
+        def create_url_rules(self):
+            return [route("GET", "/search", self.search)]
+
+    app = Flask("test_stream")
+    app.register_blueprint(TestResource(TestConfig).as_blueprint())
+    return app
+
+
+def test_stream(streaming_app):
+    res = streaming_app.test_client().get("/search")
+    assert res.is_streamed
+    assert "content-length" not in res.headers
+    assert res.json["hits"]["total"] == 1000
+    assert res.json["hits"]["hits"][999] == {
+        "id": "999",
+        "mimetype": "application/json",
+    }
+
+
+def test_write_into():
+    class TestSchema(ma.Schema):
+        id = ma.fields.String()
+
+    class SmallChunksResponseHandler(ResponseHandler):
+        stream_chunk_size = 1024
+
+    serializer = MarshmallowSerializer(
+        format_serializer_cls=JSONSerializer,
+        object_schema_cls=TestSchema,
+        list_schema_cls=BaseListSchema,
+    )
+
+    class TestConfig(ResourceConfig):
+        blueprint_name = "test_write_into"
+
+        response_handlers = {
+            "application/json": SmallChunksResponseHandler(serializer, write_into=True),
+        }
+
+    class TestResource(Resource):
+        @response_handler()
+        def read(self):
+            return {"id": "é"}, 200
+
+        @response_handler(many=True)
+        def search(self):
+            hits = [{"id": str(i)} for i in range(1000)]
+            return {"hits": {"hits": hits, "total": len(hits)}}, 200
+
+        def create_url_rules(self):
+            return [
+                route("GET", "/read", self.read),
+                route("GET", "/search", self.search),
+            ]
+
+    app = Flask("test_write_into")
+    app.register_blueprint(TestResource(TestConfig).as_blueprint())
+    client = app.test_client()
+
+    res = client.get("/read")
+    assert res.json == {"id": "é"}
+    assert res.headers["content-length"] == str(len(res.data))
+
+    res = client.get("/search")
+    assert res.headers["content-length"] == str(len(res.data))
+    hits = [{"id": str(i)} for i in range(1000)]
+    with app.test_request_context():
+        expected = serializer.serialize_object_list(
+            {"hits": {"hits": hits, "total": 1000}}
+        )
+    assert res.data == expected.encode()
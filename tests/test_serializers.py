@@ -5,13 +5,35 @@
 
 """Test serialization."""
 
+import decimal
+from datetime import date
+from io import BytesIO
+
 import pytest
 from flask import Flask
 from marshmallow import fields
 from speaklater import make_lazy_string
 
-from flask_resources import BaseListSchema, BaseObjectSchema, MarshmallowSerializer
-from flask_resources.serializers import CSVSerializer, JSONSerializer, SimpleSerializer
+from flask_resources import (
+    BaseListSchema,
+    BaseObjectSchema,
+    JSONDeserializer,
+    MarshmallowSerializer,
+    ResourceConfig,
+)
+from flask_resources.context import ResourceRequestCtx
+from flask_resources.serializers import (
+    CSVSerializer,
+    JSONSerializer,
+    RawJSON,
+    SimpleSerializer,
+)
+from flask_resources.serializers.json import (
+    JSONTypeRegistry,
+    StdlibJSONCodec,
+    json_default,
+    register_json_type,
+)
 
 
 def _(s):
@@ -230,3 +252,294 @@ def test_csv_collapse_lists_header(csv_test_data):
             "",
         ]
     )
+
+
+def test_json_serializer_stream_object_list():
+    serializer = JSONSerializer()
+    obj_list = {
+        "hits": {"hits": [{"id": "1"}, {"id": "2"}], "total": 2},
+        "links": {"self": "/"},
+    }
+    chunks = list(serializer.stream_object_list(obj_list))
+    assert len(chunks) > 1
+    assert "".join(chunks) == serializer.serialize_object_list(obj_list)
+
+    for empty in ([], {}, {"hits": {"hits": []}}):
+        assert "".join(serializer.stream_object_list(empty)) == (
+            serializer.serialize_object_list(empty)
+        )
+
+
+def test_json_serializer_stream_batches():
+    serializer = JSONSerializer()
+    serializer.batch_size = 2
+    hits = [{"id": "1"}, {"id": "2"}, RawJSON('{"id":"3"}'), {"id": "4"}, {"id": "5"}]
+    chunks = list(serializer.stream_object_list({"hits": iter(hits)}))
+    # a batch with fragments is written hit by hit
+    assert chunks[1:4] == ['[{"id": "1"}, {"id": "2"}', ', {"id":"3"}', ', {"id": "4"}']
+    assert "".join(chunks) == (
+        '{"hits": [{"id": "1"}, {"id": "2"}, {"id":"3"}, {"id": "4"}, {"id": "5"}]}'
+    )
+
+
+def test_json_serializer_stream_object_list_prettyprint():
+    app = Flask("test")
+    with app.test_request_context("/?prettyprint=1"):
+        serializer = JSONSerializer()
+        obj_list = {"hits": {"hits": iter([{"id": "1"}])}}
+        assert "".join(serializer.stream_object_list(obj_list)) == (
+            serializer.serialize_object_list({"hits": {"hits": [{"id": "1"}]}})
+        )
+
+
+def test_marshmallow_json_serializer_stream_object_list():
+    dumped = []
+
+    class CountingSchema(UITestSchema):
+        count = fields.Function(lambda obj: dumped.append(obj) or len(dumped))
+
+    serializer = MarshmallowSerializer(
+        format_serializer_cls=JSONSerializer,
+        object_schema_cls=CountingSchema,
+        list_schema_cls=BaseListSchema,
+    )
+    obj_list = {"hits": {"hits": [{"test": "test1"}, {"test": "test2"}], "total": 2}}
+
+    chunks = serializer.stream_object_list(obj_list)
+    # the hits are only dumped while the chunks are consumed
+    assert dumped == []
+    assert "".join(chunks) == (
+        '{"hits": {"hits": [{"title_l10n": "test1", "count": 1}, '
+        '{"title_l10n": "test2", "count": 2}], "total": 2}}'
+    )
+
+
+def test_raw_json_fragments():
+    serializer = MarshmallowSerializer(
+        format_serializer_cls=JSONSerializer,
+        object_schema_cls=UITestSchema,
+        list_schema_cls=BaseListSchema,
+    )
+    raw = RawJSON(b'{"title_l10n":"raw","nested":{"a":[1,2]}}')
+    hits = [{"test": "dumped"}, raw]
+    expected = (
+        '{"hits": {"hits": [{"title_l10n": "dumped"}, '
+        '{"title_l10n":"raw","nested":{"a":[1,2]}}]}}'
+    )
+    # the fragments are neither dumped nor re-encoded
+    assert serializer.serialize_object_list({"hits": {"hits": list(hits)}}) == expected
+    stream = serializer.stream_object_list({"hits": {"hits": list(hits)}})
+    assert "".join(stream) == expected
+    assert serializer.serialize_object(raw) == raw.json
+
+    # strings looking like placeholders are left alone
+    json_serializer = JSONSerializer()
+    assert json_serializer.serialize_object(["\x00abc:0\x00", RawJSON("1")]) == (
+        '["\\u0000abc:0\\u0000", 1]'
+    )
+
+    csv_serializer = CSVSerializer()
+    assert csv_serializer.serialize_object_list({"hits": {"hits": [raw]}}) == (
+        "nested_a_0,nested_a_1,title_l10n\r\n1,2,raw\r\n"
+    )
+
+
+def test_xml_serializer_stream_object_list():
+    serializer = SimpleSerializer(dummy_xml_encoder)
+    obj = {"hits": {"hits": [{"test": "one"}, {"test": "two"}]}}
+    assert list(serializer.stream_object_list(obj)) == [
+        "<root><test>one</test></root>",
+        "\n<root><test>two</test></root>",
+    ]
+
+
+@pytest.mark.parametrize("spool_max_size", [1, 1024 * 1024])
+def test_csv_stream_object_list(csv_test_data, spool_max_size):
+    serializer = CSVSerializer(spool_max_size=spool_max_size)
+    obj_list = {"hits": {"hits": [csv_test_data, {"doi": "10.456", "extra": None}]}}
+    chunks = list(serializer.stream_object_list(obj_list))
+    assert len(chunks) == 3
+    assert "".join(chunks) == serializer.serialize_object_list(obj_list)
+
+
+def test_csv_stream_object_list_known_headers(csv_test_data):
+    serializer = CSVSerializer(csv_headers=["title", "doi"])
+    hits = iter([csv_test_data, {"doi": "10.456"}])
+    assert "".join(serializer.stream_object_list({"hits": {"hits": hits}})) == (
+        "\r\n".join(["title,doi", "A Test Record,10.123", ",10.456", ""])
+    )
+
+
+def test_csv_flatten_plan_is_reused(csv_test_data, mocker):
+    serializer = CSVSerializer(csv_included_fields=["doi", "metadata_resource_type_id"])
+    key_in_field = mocker.spy(serializer, "key_in_field")
+
+    first = serializer.process_dict(csv_test_data)
+    calls = key_in_field.call_count
+    assert serializer.process_dict(csv_test_data) == first
+    assert key_in_field.call_count == calls
+    assert first == {"doi": "10.123", "metadata_resource_type_id": "image-photo"}
+
+
+@pytest.mark.parametrize(
+    "serializer",
+    [
+        JSONSerializer(),
+        CSVSerializer(),
+        SimpleSerializer(dummy_xml_encoder),
+        MarshmallowSerializer(
+            format_serializer_cls=JSONSerializer,
+            object_schema_cls=UITestSchema,
+            list_schema_cls=BaseListSchema,
+        ),
+    ],
+)
+def test_serialize_into(serializer):
+    def obj_list():
+        return {"hits": {"hits": [{"test": "é"}, {"test": "two"}]}}
+
+    buffer = BytesIO()
+    serializer.serialize_object_into({"test": "é"}, buffer)
+    assert buffer.getvalue() == serializer.serialize_object({"test": "é"}).encode()
+
+    buffer = BytesIO()
+    serializer.serialize_object_list_into(obj_list(), buffer)
+    expected = serializer.serialize_object_list(obj_list())
+    assert buffer.getvalue() == expected.encode()
+
+
+def test_serialize_into_subclass():
+    class CustomSerializer(JSONSerializer):
+        def serialize_object_list(self, obj_list):
+            return "custom"
+
+    buffer = BytesIO()
+    CustomSerializer().serialize_object_list_into({"hits": {"hits": []}}, buffer)
+    assert buffer.getvalue() == b"custom"
+
+
+class TaggingCodec(StdlibJSONCodec):
+    def encode(self, obj, **options):
+        return "tagged:" + super().encode(obj, **options)
+
+    def decode(self, data):
+        return {"tagged": super().decode(data)}
+
+
+def test_stdlib_codec_reuses_encoders():
+    codec = StdlibJSONCodec()
+    assert codec.get_encoder(indent=2) is codec.get_encoder(indent=2)
+    assert codec.get_encoder(indent=2) is not codec.get_encoder()
+    assert codec.encode({"title": _("lazy")}) == '{"title": "lazy"}'
+
+
+def test_json_codec():
+    codec = TaggingCodec()
+    assert JSONSerializer(codec=codec).serialize_object({"a": 1}) == 'tagged:{"a": 1}'
+    assert JSONDeserializer(codec=codec).deserialize('{"a": 1}') == {"tagged": {"a": 1}}
+
+    class Config(ResourceConfig):
+        json_codec = codec
+
+    app = Flask("test")
+    with app.test_request_context(), ResourceRequestCtx(Config):
+        assert JSONSerializer().serialize_object(1) == "tagged:1"
+        assert JSONDeserializer().deserialize("1") == {"tagged": 1}
+    assert JSONSerializer().serialize_object(1) == "1"
+
+
+def test_json_type_registry():
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    registry = JSONTypeRegistry(fallback=lambda obj: "fallback")
+    registry.register(Base, lambda obj: "base")
+    assert registry(Child()) == "base"
+    assert registry(Base()) == "base"
+    assert registry(object()) == "fallback"
+    # the lookups are cached per type, and reset when registering
+    assert registry._resolved[Child] is registry._resolved[Base]
+    registry.register(Child, lambda obj: "child")
+    assert registry(Child()) == "child"
+
+
+def test_register_json_type():
+    class Point:
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+
+    with pytest.raises(TypeError):
+        json_default(Point(1, 2))
+    register_json_type(Point, lambda p: [p.x, p.y])
+    assert JSONSerializer().serialize_object({"p": Point(1, 2)}) == '{"p": [1, 2]}'
+
+    # Flask's conversions still apply
+    assert json_default(decimal.Decimal("1.5")) == "1.5"
+    assert json_default(date(2026, 1, 2)) == "Fri, 02 Jan 2026 00:00:00 GMT"
+
+
+@pytest.mark.parametrize("cache_lazy_strings,expected_calls", [(False, 6), (True, 3)])
+def test_lazy_string_cache(cache_lazy_strings, expected_calls):
+    calls = []
+
+    def gettext(message, **variables):
+        calls.append(message)
+        return message.upper()
+
+    class Config(ResourceConfig):
+        pass
+
+    Config.cache_lazy_strings = cache_lazy_strings
+    hits = [
+        {"type": make_lazy_string(gettext, "article"), "lang": _("en")},
+        {"type": make_lazy_string(gettext, "article"), "lang": _("fr")},
+        {"type": make_lazy_string(gettext, "dataset", unhashable=[])},
+    ]
+    app = Flask("test")
+    with app.test_request_context(), ResourceRequestCtx(Config):
+        json_output = JSONSerializer().serialize_object_list(hits)
+        csv_output = CSVSerializer().serialize_object_list({"hits": {"hits": hits}})
+    assert json_output.count("ARTICLE") == 2
+    assert csv_output.count("ARTICLE") == 2
+    assert len(calls) == expected_calls
+
+
+def test_sparse_fieldsets():
+    computed = []
+
+    class RecordSchema(BaseObjectSchema):
+        id = fields.String()
+        title = fields.String(data_key="name")
+        expensive = fields.Method("get_expensive")
+
+        def get_expensive(self, obj):
+            computed.append(obj["id"])
+            return "computed"
+
+    serializer = MarshmallowSerializer(
+        format_serializer_cls=JSONSerializer,
+        object_schema_cls=RecordSchema,
+        list_schema_cls=BaseListSchema,
+        sparse_fieldsets="fields",
+    )
+    record = {"id": "1", "title": "Title"}
+    app = Flask("test")
+
+    with app.test_request_context("/?fields=id,name,unknown"):
+        assert serializer.dump_obj(record) == {"id": "1", "name": "Title"}
+        dumped = serializer.dump_list({"hits": {"hits": [record]}})
+        assert dumped["hits"]["hits"] == [{"id": "1", "name": "Title"}]
+        schemas = serializer.get_schemas()
+    assert computed == []
+
+    # the schemas are reused for the same field set
+    with app.test_request_context("/?fields=name&fields=id"):
+        assert serializer.get_schemas() is schemas
+
+    for query in ("/", "/?fields=unknown", "/?fields=id,name,expensive"):
+        with app.test_request_context(query):
+            assert serializer.get_schemas()[0] is serializer.object_schema
+            assert serializer.dump_obj(record)["expensive"] == "computed"
@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Test the shared memory cache."""
+
+import multiprocessing
+
+import pytest
+
+from flask_resources.cache import invalidate_tags
+from flask_resources.responses import CachedResponse
+from flask_resources.shared_cache import _SEQ, SharedMemoryCache, _key_hash
+
+SECRET = "secret"
+
+
+@pytest.fixture()
+def path(tmp_path):
+    return str(tmp_path / "cache")
+
+
+def test_shared_memory_cache(path):
+    cache = SharedMemoryCache(path, SECRET, max_entries=4, slot_size=1024, ways=2)
+    cache.set(("records", "1"), {"id": "1"}, tags=["record:1"])
+    cache.set(("records", "2"), {"id": "2"}, tags=["record:2"])
+    assert cache.get(("records", "1")) == {"id": "1"}
+    assert cache.get("unknown", "default") == "default"
+    assert len(cache) == 2
+
+    cache.set(("records", "1"), {"id": "1", "v": 2})
+    assert cache.get(("records", "1")) == {"id": "1", "v": 2}
+    assert len(cache) == 2
+
+    cache.delete(("records", "1"))
+    assert cache.get(("records", "1")) is None
+
+    invalidate_tags(["record:2"])
+    assert cache.get(("records", "2")) is None
+
+    # values bigger than a slot are not cached
+    cache.set("big", "x" * 2048)
+    assert cache.get("big") is None
+
+    stats = cache.stats
+    assert (stats["hits"], stats["misses"]) == (2, 4)
+    assert stats["entries"] == 0
+
+
+def test_shared_memory_cache_eviction(path):
+    cache = SharedMemoryCache(path, SECRET, max_entries=2, slot_size=256, ways=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats["evictions"] == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_shared_memory_cache_parameters(path):
+    SharedMemoryCache(path, SECRET, max_entries=4)
+    with pytest.raises(ValueError):
+        SharedMemoryCache(path, SECRET, max_entries=16)
+
+
+def test_cached_responses(path):
+    cache = SharedMemoryCache(path, SECRET, max_entries=4)
+    entry = CachedResponse(0, 200, [("Content-Type", "application/json")], b"{}")
+    cache.set("a", entry)
+    assert cache.get("a").body == b"{}"
+
+
+def _worker(path, worker, count):
+    cache = SharedMemoryCache(path, SECRET, max_entries=256, slot_size=512)
+    for i in range(count):
+        cache.set((worker, i), {"worker": worker, "i": i})
+        # reads of the other workers' values are either misses or correct
+        value = cache.get((1 - worker, i))
+        assert value is None or value == {"worker": 1 - worker, "i": i}
+
+
+def test_shared_between_processes(path):
+    cache = SharedMemoryCache(path, SECRET, max_entries=256, slot_size=512)
+    ctx = multiprocessing.get_context("spawn")
+    processes = [
+        ctx.Process(target=_worker, args=(path, worker, 100)) for worker in (0, 1)
+    ]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+        assert p.exitcode == 0
+
+    hits = sum(
+        cache.get((worker, i)) is not None for worker in (0, 1) for i in range(100)
+    )
+    assert hits > 100
+    assert cache.get((0, 99)) == {"worker": 0, "i": 99}
+
+
+def test_signed_entries(path):
+    cache = SharedMemoryCache(path, SECRET, max_entries=4, slot_size=1024, ways=2)
+    cache.set("a", {"id": "1"})
+    assert cache.get("a") == {"id": "1"}
+
+    # tampered entries are ignored
+    with open(path, "r+b") as f:
+        pos = f.read().index(b"id")
+        f.seek(pos)
+        f.write(b"ID")
+    assert cache.get("a") is None
+
+    # so are the entries written without the secret key
+    other = SharedMemoryCache(path, "other", max_entries=4, slot_size=1024, ways=2)
+    other.set("b", {"id": "2"})
+    assert other.get("b") == {"id": "2"}
+    assert cache.get("b") is None
+
+    with pytest.raises(ValueError):
+        SharedMemoryCache(path, "", max_entries=4, slot_size=1024, ways=2)
+
+
+def test_shared_in_process(path):
+    cache = SharedMemoryCache(path, SECRET, max_entries=4)
+    other = SharedMemoryCache(path, SECRET, max_entries=4)
+    # the caches of a process share the descriptor and the locks of the file
+    assert other._fd == cache._fd
+    assert other._thread_locks is cache._thread_locks
+    other.set("a", 1)
+    assert cache.get("a") == 1
+
+    other.close()
+    other.close()
+    cache.set("b", 2)
+    assert cache.get("b") == 2
+    cache.close()
+    assert SharedMemoryCache(path, SECRET, max_entries=4).get("b") == 2
+
+
+def test_crashed_writer(path):
+    cache = SharedMemoryCache(path, SECRET, max_entries=2, slot_size=256, ways=2)
+    cache.set("a", 1)
+    offset = next(
+        o for o in cache._offsets(0) if cache._mm[o + 16 : o + 32] == _key_hash("a")
+    )
+    # a writer crashed while writing the slot
+    seq = _SEQ.unpack_from(cache._mm, offset)[0]
+    _SEQ.pack_into(cache._mm, offset, seq + 1)
+    assert cache.get("a") is None
+
+    cache.set("a", 2)
+    assert _SEQ.unpack_from(cache._mm, offset)[0] % 2 == 0
+    assert cache.get("a") == 2
+
+
+def test_key_hashes():
+    assert _key_hash(("records", 1, None, (b"x", 1.5))) == _key_hash(
+        ("records", 1, None, (b"x", 1.5))
+    )
+    assert _key_hash(("1",)) != _key_hash((1,))
+    assert _key_hash(("a", "b")) != _key_hash(("ab",))
+    assert _key_hash((SharedMemoryCache, frozenset([1, 2]))) is not None
+    # objects without a stable encoding are not cached
+    assert _key_hash(("records", object())) is None
+
+
+def test_unsupported_keys(path):
+    cache = SharedMemoryCache(path, SECRET, max_entries=4)
+    key = ("records", object())
+    cache.set(key, 1)
+    cache.delete(key)
+    assert cache.get(key, "default") == "default"
+    assert len(cache) == 0